@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark da extração do nome do jogador do face.fpk.
+
+Compara a leitura antiga (modo texto, linha a linha) com a busca em bytes de
+gerenciador.fpk.extrair_nome_jogador em arquivos sintéticos.
+
+Uso: python benchmarks/bench_extracao_fpk.py [--arquivos N] [--tamanho-kb KB]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gerenciador.fpk import MARCADOR_FACE, extrair_nome_jogador  # noqa: E402
+
+
+def extrair_nome_jogador_texto(face_fpk_path):
+    """Implementação anterior: decodifica o arquivo e procura o marcador por linha."""
+    with open(face_fpk_path, 'r', encoding='utf-8', errors='ignore') as f:
+        for linha in f:
+            if MARCADOR_FACE in linha:
+                partes = linha.split(MARCADOR_FACE)
+                if len(partes) > 1:
+                    return partes[1].strip().split('/')[0].strip()
+    return None
+
+
+def gerar_fpk(caminho, tamanho, nome, posicao_relativa):
+    """Arquivo binário aleatório (quase sem quebras de linha) com o marcador na posição indicada."""
+    conteudo = bytearray(os.urandom(tamanho).replace(b'\n', b' '))
+    caminho_face = f"{MARCADOR_FACE}{nome}/sourceimages/face_bsm_alp.ftex\x00".encode()
+    posicao = int((tamanho - len(caminho_face)) * posicao_relativa)
+    conteudo[posicao:posicao + len(caminho_face)] = caminho_face
+    Path(caminho).write_bytes(bytes(conteudo))
+
+
+def medir(funcao, arquivos):
+    inicio = time.perf_counter()
+    nomes = [funcao(arquivo) for arquivo in arquivos]
+    return time.perf_counter() - inicio, nomes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--arquivos", type=int, default=200)
+    parser.add_argument("--tamanho-kb", type=int, default=2048)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        for posicao_relativa, descricao in ((0.01, "marcador no início"), (0.9, "marcador no fim")):
+            arquivos = []
+            for i in range(args.arquivos):
+                caminho = Path(pasta) / f"{descricao[:3]}_{i}.fpk"
+                gerar_fpk(caminho, args.tamanho_kb * 1024, f"Jogador {i}", posicao_relativa)
+                arquivos.append(caminho)
+
+            tempo_texto, nomes_texto = medir(extrair_nome_jogador_texto, arquivos)
+            tempo_bytes, nomes_bytes = medir(extrair_nome_jogador, arquivos)
+            assert nomes_texto == nomes_bytes, "as duas implementações devem extrair os mesmos nomes"
+
+            print(f"{descricao} ({args.arquivos} arquivos de {args.tamanho_kb} KB):")
+            print(f"  texto linha a linha: {tempo_texto * 1000 / args.arquivos:8.3f} ms/arquivo")
+            print(f"  busca em bytes:      {tempo_bytes * 1000 / args.arquivos:8.3f} ms/arquivo "
+                  f"({tempo_texto / tempo_bytes:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmarks das operações do gerenciador com dados sintéticos em várias escalas.
+
+Mede a movimentação por CSV, a busca por face.fpk (varredura e índice frio e
+quente), o inventário recursivo de pastas, as cópias por FPK (conteúdo e
+pasta completa) e a renomeação por OCR (com um leitor só ou em vários
+processos na CPU).
+Os dados são gerados por benchmarks/dados_sinteticos.py a cada repetição das
+operações que alteram o disco; o tempo de geração não entra na medição.
+
+Cada resultado (tempo mínimo e mediana, itens/s e o tempo por etapa das
+``Metricas``) é acrescentado a benchmarks/resultados.jsonl no diretório de
+cache do usuário (fora do repositório; veja ``--resultados``) com o commit e a
+plataforma, e comparado com o último resultado de outro commit na mesma
+escala, para que regressões entre versões apareçam.
+
+Uso: python benchmarks/bench_operacoes.py [--escalas 100 1000] [--escalas-ocr 20]
+         [--apenas csv fpk-busca ...] [--repeticoes 3] [--pasta DIR_NO_NAS]
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+import dados_sinteticos  # noqa: E402
+from gerenciador.cache_ocr import diretorio_cache_padrao  # noqa: E402
+from gerenciador.copia import MODO_PADRAO, MODOS_TRANSFERENCIA  # noqa: E402
+from gerenciador.fpk import IndiceFPK, percorrer_pastas_com_face  # noqa: E402
+from gerenciador.inventario import inventariar_pastas  # noqa: E402
+from gerenciador.metricas import Metricas  # noqa: E402
+from gerenciador.operacoes import copiar_conteudo_por_fpk, copiar_pasta_completa_por_fpk, mover_por_csv  # noqa: E402
+
+# Histórico por máquina: fica no diretório de cache, não na árvore do repositório
+ARQUIVO_RESULTADOS = diretorio_cache_padrao() / "benchmarks" / "resultados.jsonl"
+# Variação (em %) do tempo mínimo a partir da qual a comparação aponta regressão
+LIMITE_REGRESSAO = 10
+
+
+def _csv(pasta, escala, args):
+    arquivo_csv = dados_sinteticos.gerar_base_csv(pasta, escala)
+
+    def executar(metricas):
+        mover_por_csv(arquivo_csv, metricas=metricas)
+        return escala
+    return executar
+
+
+def _fpk_busca(pasta, escala, args):
+    parte1, _ = dados_sinteticos.gerar_partes_fpk(pasta, escala, arquivos_por_jogador=0)
+
+    def executar(metricas):
+        return sum(1 for _ in metricas.medir_iteracao("busca", percorrer_pastas_com_face(parte1)))
+    return executar
+
+
+def _inventario(pasta, escala, args):
+    parte1, _ = dados_sinteticos.gerar_partes_fpk(pasta, escala, arquivos_por_jogador=0)
+    saida = pasta / "inventario_pastas.csv"
+
+    def executar(metricas):
+        return inventariar_pastas(parte1, saida, metricas=metricas).total_pastas
+    return executar
+
+
+def _fpk_indice(quente):
+    def preparar(pasta, escala, args):
+        parte1, _ = dados_sinteticos.gerar_partes_fpk(pasta, escala, arquivos_por_jogador=0)
+        caminho_indice = Path(pasta) / "indice.sqlite3"
+
+        def percorrer(metricas):
+            with IndiceFPK(parte1, caminho=caminho_indice) as indice:
+                return sum(1 for _ in metricas.medir_iteracao("busca", indice.percorrer()))
+
+        def executar(metricas):
+            if quente:
+                return percorrer(metricas)
+            caminho_indice.unlink(missing_ok=True)
+            return percorrer(metricas)
+
+        if quente:
+            percorrer(Metricas())  # Índice já preenchido antes das medições
+        return executar
+    return preparar
+
+
+def _fpk_copia(operacao):
+    def preparar(pasta, escala, args):
+        parte1, parte2 = dados_sinteticos.gerar_partes_fpk(pasta, escala, tamanho_arquivo_kb=args.tamanho_kb)
+
+        def executar(metricas):
+            operacao(parte1, parte2, usar_indice=False, modo=args.modo, metricas=metricas)
+            return escala
+        return executar
+    return preparar
+
+
+_leitores = {}  # O modelo de OCR é carregado uma vez para todas as escalas
+
+
+def _ocr(pasta, escala, args):
+    from gerenciador.ocr import LeitorSobDemanda, MotorOCR, PreProcessamento, RegiaoInteresse, renomear_imagens
+
+    dados_sinteticos.gerar_imagens_ocr(pasta, escala, largura=args.altura_ocr * 16 // 9, altura=args.altura_ocr)
+    leitor = _leitores.setdefault(args.cpu, LeitorSobDemanda(["en"], gpu=False if args.cpu else None))
+    reader = leitor.obter()
+
+    def executar(metricas):
+        preprocessamento = PreProcessamento(args.altura_maxima or None) if args.altura_maxima is not None else None
+        motor = MotorOCR(reader, regiao=RegiaoInteresse(), preprocessamento=preprocessamento)
+        renomear_imagens(pasta, motor, metricas=metricas)
+        return escala
+    return executar
+
+
+_pools_ocr = {}  # Processos de OCR (com os modelos carregados) reaproveitados entre repetições e escalas
+
+
+def _ocr_processos(pasta, escala, args):
+    from gerenciador.ocr import PreProcessamento, RegiaoInteresse, listar_imagens, renomear_imagens
+    from gerenciador.processos_ocr import MotorOCRProcessos
+
+    dados_sinteticos.gerar_imagens_ocr(pasta, escala, largura=args.altura_ocr * 16 // 9, altura=args.altura_ocr)
+    motor = _pools_ocr.get(args.processos)
+    if motor is None:
+        preprocessamento = PreProcessamento(args.altura_maxima or None) if args.altura_maxima is not None else None
+        motor = MotorOCRProcessos(["en"], processos=args.processos, regiao=RegiaoInteresse(),
+                                  preprocessamento=preprocessamento)
+        for _ in motor.reconhecer(listar_imagens(pasta)):
+            pass  # Carrega os modelos em todos os processos antes das medições
+        _pools_ocr[args.processos] = motor
+
+    def executar(metricas):
+        renomear_imagens(pasta, motor, metricas=metricas)
+        return escala
+    return executar
+
+
+# nome -> (preparar(pasta, escala, args) -> executar(metricas), altera o disco, escala do OCR)
+BENCHMARKS = {
+    "csv": (_csv, True, False),
+    "fpk-busca": (_fpk_busca, False, False),
+    "inventario": (_inventario, False, False),
+    "fpk-indice-frio": (_fpk_indice(quente=False), False, False),
+    "fpk-indice-quente": (_fpk_indice(quente=True), False, False),
+    "fpk-copy": (_fpk_copia(copiar_conteudo_por_fpk), True, False),
+    "fpk-copy-folder": (_fpk_copia(copiar_pasta_completa_por_fpk), True, False),
+    "ocr-rename": (_ocr, True, True),
+    "ocr-rename-processos": (_ocr_processos, True, True),
+}
+
+
+def medir(nome, escala, args, pasta_base):
+    """Roda o benchmark ``args.repeticoes`` vezes; retorna o registro do resultado.
+
+    Quem altera o disco recebe dados novos a cada repetição; os benchmarks só
+    de leitura reaproveitam os dados da primeira.
+    """
+    preparar, altera_disco, _ = BENCHMARKS[nome]
+    tempos, melhor = [], None
+    pasta = executar = None
+    try:
+        for _ in range(args.repeticoes):
+            if executar is None or altera_disco:
+                pasta = Path(tempfile.mkdtemp(prefix=f"{nome}-{escala}-", dir=pasta_base))
+                executar = preparar(pasta, escala, args)
+            metricas = Metricas(nome)
+            inicio = time.perf_counter()
+            itens = executar(metricas)
+            tempo = time.perf_counter() - inicio
+            metricas.encerrar()
+            if altera_disco:
+                shutil.rmtree(pasta, ignore_errors=True)
+                pasta = None
+            tempos.append(tempo)
+            if melhor is None or tempo < melhor[0]:
+                melhor = (tempo, itens, metricas)
+    finally:
+        if pasta is not None:
+            shutil.rmtree(pasta, ignore_errors=True)
+
+    tempo, itens, metricas = melhor
+    resumo = metricas.resumo()
+    return {
+        "benchmark": nome,
+        "escala": escala,
+        "repeticoes": args.repeticoes,
+        "segundos_min": round(min(tempos), 4),
+        "segundos_mediana": round(statistics.median(tempos), 4),
+        "itens": itens,
+        "itens_por_s": round(itens / tempo, 1) if tempo else None,
+        "bytes_por_s": resumo["bytes_por_s"] if resumo["bytes"] else None,
+        "etapas": {etapa: dados["segundos"] for etapa, dados in resumo["etapas"].items()},
+    }
+
+
+def identificar_versao():
+    """Commit atual (com ``-sujo`` se houver alterações não commitadas) ou None fora de um repositório git."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, capture_output=True, text=True,
+                                check=True).stdout.strip()
+        sujo = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=RAIZ,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-sujo" if sujo else commit
+
+
+def carregar_resultados(caminho):
+    resultados = []
+    try:
+        with open(caminho, encoding="utf-8") as f:
+            for linha in f:
+                if linha.strip():
+                    resultados.append(json.loads(linha))
+    except FileNotFoundError:
+        pass
+    return resultados
+
+
+def comparar(resultado, anteriores, limite):
+    """Texto comparando com o último resultado de outro commit no mesmo benchmark, escala e máquina."""
+    for anterior in reversed(anteriores):
+        if (anterior["benchmark"], anterior["escala"], anterior.get("maquina")) != \
+                (resultado["benchmark"], resultado["escala"], resultado["maquina"]):
+            continue
+        if anterior.get("commit") == resultado["commit"]:
+            continue
+        variacao = (resultado["segundos_min"] / anterior["segundos_min"] - 1) * 100 if anterior["segundos_min"] else 0
+        marca = "⚠️ regressão" if variacao > limite else ("✅ melhora" if variacao < -limite else "≈")
+        return f"{variacao:+.1f}% vs {anterior.get('commit')} {marca}"
+    return "sem resultado anterior"
+
+
+def executar_benchmarks(args, contexto, anteriores, novos):
+    """Roda os benchmarks escolhidos, mostrando e acrescentando cada resultado a ``novos``."""
+    for nome in args.apenas or list(BENCHMARKS):
+        escalas = args.escalas_ocr if BENCHMARKS[nome][2] else args.escalas
+        for escala in escalas:
+            try:
+                resultado = {**contexto, **medir(nome, escala, args, args.pasta)}
+            except ModuleNotFoundError as e:
+                print(f"⏭️ {nome}: ignorado (dependência ausente: {e.name})")
+                break
+            print(f"{nome:20} {escala:>7}  min {resultado['segundos_min']:9.4f}s  "
+                  f"mediana {resultado['segundos_mediana']:9.4f}s  {resultado['itens_por_s'] or 0:10.1f} itens/s  "
+                  f"{comparar(resultado, anteriores, args.limite_regressao)}")
+            novos.append(resultado)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apenas", nargs="+", choices=list(BENCHMARKS), help="benchmarks a rodar (padrão: todos)")
+    parser.add_argument("--escalas", type=int, nargs="+", default=[100, 1000],
+                        help="IDs (csv) ou faces (fpk) em cada escala")
+    parser.add_argument("--escalas-ocr", type=int, nargs="+", default=[20, 100], help="imagens em cada escala do OCR")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--tamanho-kb", type=int, default=64, help="tamanho dos arquivos dos jogadores na PARTE 2")
+    parser.add_argument("--modo", choices=MODOS_TRANSFERENCIA, default=MODO_PADRAO, help="modo das cópias por FPK")
+    parser.add_argument("--cpu", action="store_true", help="OCR sem GPU mesmo se disponível")
+    parser.add_argument("--altura-maxima", type=int,
+                        help="pré-processamento do OCR (tons de cinza, reduzindo acima dessa altura; 0 = só cinza); "
+                             "padrão: sem pré-processamento")
+    parser.add_argument("--processos", type=int, default=os.cpu_count(), help="processos do ocr-rename-processos")
+    parser.add_argument("--altura-ocr", type=int, default=360, help="altura das imagens sintéticas do OCR")
+    parser.add_argument("--pasta", help="onde gerar os dados (ex.: um compartilhamento de rede); padrão: temporário")
+    parser.add_argument("--resultados", default=str(ARQUIVO_RESULTADOS), help="arquivo JSONL com o histórico")
+    parser.add_argument("--nao-salvar", action="store_true", help="só mostra os resultados, sem gravar no histórico")
+    parser.add_argument("--limite-regressao", type=float, default=LIMITE_REGRESSAO,
+                        help="variação percentual do tempo mínimo marcada como regressão")
+    parser.add_argument("-v", "--verbose", action="store_true", help="mantém o log das operações")
+    args = parser.parse_args()
+
+    # O log das operações (milhares de linhas) distorceria as medições
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+
+    anteriores = carregar_resultados(args.resultados)
+    contexto = {
+        "quando": datetime.now().isoformat(timespec="seconds"),
+        "commit": identificar_versao(),
+        "maquina": platform.node(),
+        "plataforma": platform.platform(),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+    }
+    if args.pasta:
+        Path(args.pasta).mkdir(parents=True, exist_ok=True)
+
+    novos = []
+    try:
+        executar_benchmarks(args, contexto, anteriores, novos)
+    finally:
+        for motor in _pools_ocr.values():
+            motor.fechar()
+
+    if novos and not args.nao_salvar:
+        Path(args.resultados).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.resultados, "a", encoding="utf-8") as f:
+            for resultado in novos:
+                f.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+        print(f"📝 {len(novos)} resultados acrescentados a {args.resultados}")
+
+
+if __name__ == "__main__":
+    main()
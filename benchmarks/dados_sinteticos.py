@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Geradores de dados sintéticos para os benchmarks.
+
+Cada função cria, numa pasta vazia, a estrutura que uma operação espera:
+diretório base com pastas por ID e CSV ``Id;Name``, PARTE 1/PARTE 2 com
+face.fpk e pastas de jogadores, e imagens com o rótulo "JOGADOR ID = n".
+Os dados dependem só dos parâmetros e da ``semente``, então duas execuções
+com os mesmos argumentos geram exatamente os mesmos arquivos.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gerenciador.fpk import MARCADOR_FACE, NOME_FACE_FPK  # noqa: E402
+
+SEMENTE = 2016
+
+
+def _conteudo(gerador, tamanho):
+    return gerador.randbytes(tamanho)
+
+
+def gerar_base_csv(pasta, ids, arquivos_por_id=2, soltos_por_id=1, proporcao_ausentes=0.1, semente=SEMENTE):
+    """Diretório base com ``ids`` pastas ``<Id>`` (com arquivos dentro), arquivos ``<Id>_*`` soltos e o CSV.
+
+    Uma fração ``proporcao_ausentes`` das linhas do CSV aponta para IDs sem
+    pasta nem arquivos. Retorna o caminho do CSV.
+    """
+    gerador = random.Random(semente)
+    pasta = Path(pasta)
+    pasta.mkdir(parents=True, exist_ok=True)
+    linhas = ["Id;Name"]
+    for i in range(ids):
+        id_pasta = str(100000 + i)
+        linhas.append(f"{id_pasta};Jogador {i % max(1, ids // 3)}")
+        if gerador.random() < proporcao_ausentes:
+            continue
+        pasta_id = pasta / id_pasta
+        pasta_id.mkdir()
+        for j in range(arquivos_por_id):
+            (pasta_id / f"arquivo_{j}.bin").write_bytes(_conteudo(gerador, 4096))
+        for j in range(soltos_por_id):
+            (pasta / f"{id_pasta}_{j}.png").write_bytes(_conteudo(gerador, 2048))
+    arquivo_csv = pasta / "jogadores.csv"
+    arquivo_csv.write_text("\n".join(linhas) + "\n", encoding="utf-8")
+    return arquivo_csv
+
+
+def gerar_face_fpk(caminho, nome_jogador, tamanho, gerador):
+    """face.fpk falso: bytes aleatórios com o caminho da textura do jogador perto do início."""
+    conteudo = bytearray(_conteudo(gerador, tamanho))
+    caminho_face = f"{MARCADOR_FACE}{nome_jogador}/sourceimages/face_bsm_alp.ftex\x00".encode()
+    posicao = min(256, max(0, tamanho - len(caminho_face)))
+    conteudo[posicao:posicao + len(caminho_face)] = caminho_face
+    Path(caminho).write_bytes(bytes(conteudo))
+
+
+def gerar_partes_fpk(pasta, faces, jogadores=None, arquivos_por_jogador=4, tamanho_arquivo_kb=64,
+                     faces_por_time=20, pastas_sem_face=0.2, tamanho_fpk_kb=32, semente=SEMENTE):
+    """PARTE 1 com ``faces`` pastas de ID contendo face.fpk e PARTE 2 com as pastas dos jogadores.
+
+    As pastas de ID ficam agrupadas em pastas de time (``faces_por_time`` por
+    time), com uma fração ``pastas_sem_face`` de pastas extras sem face.fpk
+    para a busca atravessar. Várias faces apontam para o mesmo jogador quando
+    ``jogadores`` é menor que ``faces``. Cada jogador tem ``arquivos_por_jogador``
+    arquivos na raiz e uma subpasta com mais dois. Retorna ``(parte1, parte2)``.
+    """
+    gerador = random.Random(semente)
+    pasta = Path(pasta)
+    parte1, parte2 = pasta / "parte1", pasta / "parte2"
+    jogadores = jogadores or max(1, faces // 2)
+
+    for i in range(faces):
+        pasta_id = parte1 / f"Time {i // faces_por_time:03d}" / str(200000 + i)
+        pasta_id.mkdir(parents=True)
+        gerar_face_fpk(pasta_id / NOME_FACE_FPK, f"Jogador {i % jogadores}", tamanho_fpk_kb * 1024, gerador)
+    for i in range(int(faces * pastas_sem_face)):
+        (parte1 / f"Time {i % max(1, faces // faces_por_time):03d}" / f"extra_{i}" / "dados").mkdir(parents=True)
+
+    for j in range(jogadores):
+        pasta_jogador = parte2 / f"Jogador {j}"
+        (pasta_jogador / "texturas").mkdir(parents=True)
+        for k in range(arquivos_por_jogador):
+            (pasta_jogador / f"arquivo_{k}.bin").write_bytes(_conteudo(gerador, tamanho_arquivo_kb * 1024))
+        for k in range(2):
+            (pasta_jogador / "texturas" / f"textura_{k}.dds").write_bytes(_conteudo(gerador, tamanho_arquivo_kb * 1024))
+    return parte1, parte2
+
+
+def gerar_imagens_ocr(pasta, quantidade, largura=640, altura=360, semente=SEMENTE):
+    """Imagens PNG com o rótulo "JOGADOR ID = n" (e outros textos) desenhados; retorna os IDs por arquivo.
+
+    A posição do rótulo varia pouco entre as imagens, como nas capturas reais,
+    para que a região do ID possa ser aprendida. Textos e posições acompanham
+    a ``altura`` (360 é a escala de referência), simulando capturas em 1080p ou 4K.
+    """
+    import cv2
+    import numpy as np
+
+    gerador = random.Random(semente)
+    pasta = Path(pasta)
+    pasta.mkdir(parents=True, exist_ok=True)
+    escala = altura / 360
+    ids = {}
+    for i in range(quantidade):
+        imagem = np.full((altura, largura, 3), 255, dtype=np.uint8)
+        id_jogador = str(gerador.randint(1000, 999999))
+        x, y = 40 + gerador.randint(0, 6), 300 + gerador.randint(0, 6)
+        textos = [(f"Jogador {i}", 40, 60, 1.2, (0, 0, 0)),
+                  (f"OVR {gerador.randint(60, 99)}", 40, 140, 1.0, (40, 40, 40)),
+                  (f"JOGADOR ID = {id_jogador}", x, y, 1.0, (0, 0, 0))]
+        for texto, tx, ty, tamanho, cor in textos:
+            cv2.putText(imagem, texto, (round(tx * escala), round(ty * escala)), cv2.FONT_HERSHEY_SIMPLEX,
+                        tamanho * escala, cor, max(1, round(2 * escala)))
+        nome = f"captura_{i:05d}.png"
+        cv2.imwrite(str(pasta / nome), imagem)
+        ids[nome] = id_jogador
+    return ids
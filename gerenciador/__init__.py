@@ -0,0 +1,71 @@
+"""Núcleo do Gerenciador de Pastas e Imagens.
+
+As operações deste pacote não dependem do Tk; a interface gráfica fica em
+``gerenciador.interface`` e a linha de comando em ``gerenciador.cli``.
+"""
+
+from .cache_ocr import CacheOCR, versao_cache
+from .copia import AgendadorCopia, copiar_arquivo
+from .diario import Diario, desfazer
+from .fpk import IndiceFPK, extrair_nome_jogador, percorrer_pastas_com_face
+from .indice import IndicePrefixos
+from .inventario import PastaInventario, ResumoInventario, inventariar_pastas, percorrer_inventario
+from .metricas import Metricas
+from .ocr import (LeitorSobDemanda, MotorOCR, PreProcessamento, RegiaoInteresse, ResultadoOCR, ResumoRenomeacao,
+                  criar_leitor, extrair_id_jogador, listar_imagens, renomear_imagens)
+from .operacoes import (Conciliacao, ErroCSV, ResumoCSV, ResumoFPK, ResumoListagem, conciliar_csv,
+                        copiar_conteudo_por_fpk, copiar_pasta_completa_por_fpk, ler_csv, ler_csv_em_lotes, limpar_nome,
+                        listar_pastas, mapear_csv, mover_por_csv)
+from .plano import Plano, executar_plano
+from .processos_ocr import MotorOCRProcessos
+from .tarefas import Cancelado, Tarefa
+from .vigia import VigiaPasta, vigiar_pasta
+
+__all__ = [
+    "AgendadorCopia",
+    "CacheOCR",
+    "Cancelado",
+    "Conciliacao",
+    "Diario",
+    "ErroCSV",
+    "IndiceFPK",
+    "IndicePrefixos",
+    "LeitorSobDemanda",
+    "Metricas",
+    "MotorOCR",
+    "MotorOCRProcessos",
+    "PastaInventario",
+    "Plano",
+    "PreProcessamento",
+    "RegiaoInteresse",
+    "ResultadoOCR",
+    "ResumoCSV",
+    "ResumoFPK",
+    "ResumoInventario",
+    "ResumoListagem",
+    "ResumoRenomeacao",
+    "Tarefa",
+    "VigiaPasta",
+    "conciliar_csv",
+    "copiar_arquivo",
+    "copiar_conteudo_por_fpk",
+    "copiar_pasta_completa_por_fpk",
+    "criar_leitor",
+    "desfazer",
+    "executar_plano",
+    "extrair_id_jogador",
+    "extrair_nome_jogador",
+    "inventariar_pastas",
+    "ler_csv",
+    "ler_csv_em_lotes",
+    "limpar_nome",
+    "listar_imagens",
+    "listar_pastas",
+    "mapear_csv",
+    "mover_por_csv",
+    "percorrer_inventario",
+    "percorrer_pastas_com_face",
+    "renomear_imagens",
+    "versao_cache",
+    "vigiar_pasta",
+]
@@ -0,0 +1,128 @@
+"""Cache persistente dos resultados de OCR, indexado pelo conteúdo da imagem."""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+LIMITE_ENTRADAS_PADRAO = 200_000
+# Operações de escrita acumuladas antes de um commit
+OPERACOES_POR_COMMIT = 200
+
+
+def diretorio_cache_padrao():
+    """Diretório de cache do usuário (``%LOCALAPPDATA%`` no Windows, ``~/.cache`` nos demais)."""
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "MenuOCR"
+
+
+def versao_cache(idiomas, extra=""):
+    """Chave de versão: muda quando os idiomas ou a versão do EasyOCR mudam."""
+    try:
+        from importlib.metadata import version
+        versao_easyocr = version("easyocr")
+    except Exception:
+        versao_easyocr = "desconhecida"
+    return f"v1|{','.join(idiomas)}|easyocr-{versao_easyocr}|{extra}"
+
+
+def hash_conteudo(dados):
+    """Hash rápido (BLAKE2b de 128 bits) do conteúdo do arquivo."""
+    return hashlib.blake2b(dados, digest_size=16).hexdigest()
+
+
+class CacheOCR:
+    """Cache SQLite de texto e ID extraídos por imagem.
+
+    As entradas são chaveadas pelo hash do conteúdo e pela ``versao`` (idiomas
+    e modelo do OCR), então renomear ou mover a imagem não invalida o cache.
+    Quando o total passa de ``limite_entradas``, as entradas acessadas há mais
+    tempo são removidas. Seguro para uso a partir de várias threads.
+    """
+
+    def __init__(self, caminho=None, versao="", limite_entradas=LIMITE_ENTRADAS_PADRAO):
+        self.caminho = Path(caminho) if caminho else diretorio_cache_padrao() / "ocr_cache.sqlite"
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        self.versao = versao
+        self.limite_entradas = limite_entradas
+        self.acertos = 0
+        self.faltas = 0
+        self._lock = threading.Lock()
+        self._pendentes = 0
+        self._conexao = sqlite3.connect(str(self.caminho), check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.execute(
+            "CREATE TABLE IF NOT EXISTS entradas ("
+            " hash TEXT NOT NULL, versao TEXT NOT NULL, texto TEXT, id_jogador TEXT,"
+            " ultimo_acesso REAL NOT NULL, PRIMARY KEY (hash, versao))"
+        )
+        self._conexao.execute("CREATE INDEX IF NOT EXISTS idx_ultimo_acesso ON entradas (ultimo_acesso)")
+        self._conexao.commit()
+
+    def obter(self, chave):
+        """Retorna ``(texto, id_jogador)`` da imagem ou None se não estiver no cache."""
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT texto, id_jogador FROM entradas WHERE hash = ? AND versao = ?",
+                (chave, self.versao),
+            ).fetchone()
+            if linha is None:
+                self.faltas += 1
+                return None
+            self.acertos += 1
+            self._conexao.execute(
+                "UPDATE entradas SET ultimo_acesso = ? WHERE hash = ? AND versao = ?",
+                (time.time(), chave, self.versao),
+            )
+            self._registrar_escrita()
+            return linha
+
+    def guardar(self, chave, texto, id_jogador):
+        """Grava o resultado do OCR da imagem."""
+        with self._lock:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO entradas (hash, versao, texto, id_jogador, ultimo_acesso)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (chave, self.versao, texto, id_jogador, time.time()),
+            )
+            self._registrar_escrita()
+
+    def _registrar_escrita(self):
+        self._pendentes += 1
+        if self._pendentes >= OPERACOES_POR_COMMIT:
+            self._conexao.commit()
+            self._pendentes = 0
+
+    def podar(self):
+        """Remove as entradas menos usadas recentemente acima do limite."""
+        with self._lock:
+            total = self._conexao.execute("SELECT COUNT(*) FROM entradas").fetchone()[0]
+            excesso = total - self.limite_entradas
+            if excesso > 0:
+                self._conexao.execute(
+                    "DELETE FROM entradas WHERE rowid IN"
+                    " (SELECT rowid FROM entradas ORDER BY ultimo_acesso ASC LIMIT ?)",
+                    (excesso,),
+                )
+                logging.info(f"🧹 Cache de OCR: {excesso} entradas antigas removidas")
+            self._conexao.commit()
+            self._pendentes = 0
+
+    def fechar(self):
+        """Aplica a poda, grava as alterações pendentes e fecha o banco."""
+        self.podar()
+        with self._lock:
+            self._conexao.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
@@ -0,0 +1,303 @@
+"""Linha de comando do gerenciador (modo sem interface gráfica).
+
+Exemplos::
+
+    python -m gerenciador ocr-rename PASTA [PASTA ...]
+    python -m gerenciador ocr-watch PASTA
+    python -m gerenciador csv-move ARQUIVO.csv [--somente-existentes]
+    python -m gerenciador csv-check ARQUIVO.csv [--relatorio DIFERENCAS.csv]
+    python -m gerenciador fpk-copy PARTE1 PARTE2
+    python -m gerenciador fpk-copy-folder PARTE1 PARTE2
+    python -m gerenciador fpk-lookup PARTE1 "Nome do Jogador"
+    python -m gerenciador list-folders PASTA
+    python -m gerenciador list-folders PASTA --recursivo --formato csv
+    python -m gerenciador undo csv-move ARQUIVO.csv
+    python -m gerenciador --metricas metricas.json fpk-copy PARTE1 PARTE2
+"""
+
+import argparse
+import json
+import logging
+import sys
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+
+from .cache_ocr import CacheOCR, versao_cache
+from .copia import MODO_PADRAO, MODOS_TRANSFERENCIA, TRABALHADORES_COPIA
+from .diario import Diario, caminho_diario, desfazer
+from .fpk import TRABALHADORES_BUSCA, IndiceFPK
+from .inventario import FORMATOS_INVENTARIO, inventariar_pastas
+from .metricas import Metricas
+from .ocr import (ALTURA_MAXIMA_PADRAO, IDIOMAS_PADRAO, TAMANHO_LOTE_PADRAO, TRABALHADORES_PADRAO, LeitorSobDemanda,
+                  MotorOCR, PreProcessamento, RegiaoInteresse, renomear_imagens)
+from .operacoes import (ErroCSV, conciliar_csv, copiar_conteudo_por_fpk, copiar_pasta_completa_por_fpk, listar_pastas,
+                        mover_por_csv)
+from .processos_ocr import MotorOCRProcessos
+from .registro import configurar_log, encerrar_log
+from .vigia import vigiar_pasta
+
+
+@dataclass
+class ConsultaFPK:
+    """Resposta do fpk-lookup: pastas (ou total de pastas) por jogador."""
+    jogador: str
+    pastas: object
+
+
+def _diario(args, alvo):
+    """Diário da execução (ou um contexto vazio com --sem-diario / --simular)."""
+    if args.sem_diario or getattr(args, "simular", False):
+        return nullcontext()
+    return Diario(caminho_diario(args.comando, alvo), operacao=args.comando, retomar=args.retomar)
+
+
+def _preprocessamento(args):
+    return PreProcessamento(altura_maxima=args.altura_maxima or None, cinza=not args.colorido,
+                            contraste=args.contraste, binarizar=args.binarizar)
+
+
+def _cache_ocr(args):
+    if args.sem_cache:
+        return None
+    return CacheOCR(args.cache, versao=versao_cache(args.idiomas, extra=_preprocessamento(args).assinatura))
+
+
+def _leitor(args):
+    """``easyocr.Reader`` do processo principal (None com --processos: cada processo carrega o seu)."""
+    if args.processos:
+        return None
+    return LeitorSobDemanda(args.idiomas, gpu=False if args.cpu else None).obter()
+
+
+@contextmanager
+def _motor_ocr(args, reader, cache):
+    regiao = RegiaoInteresse(args.regiao, aprender=not args.sem_regiao)
+    if args.processos:
+        with MotorOCRProcessos(args.idiomas, processos=args.processos, threads_por_processo=args.threads_por_processo,
+                               tamanho_lote=args.lote, regiao=regiao, cache=cache,
+                               preprocessamento=_preprocessamento(args)) as motor:
+            yield motor
+        return
+    yield MotorOCR(reader, tamanho_lote=args.lote, trabalhadores=args.trabalhadores, regiao=regiao, cache=cache,
+                   preprocessamento=_preprocessamento(args))
+
+
+def _cmd_ocr_rename(args, metricas):
+    reader = _leitor(args)
+    cache = _cache_ocr(args)
+    try:
+        resumos = []
+        # Um motor para todas as pastas: modelo (ou processos) carregado uma vez e região aprendida preservada
+        with _motor_ocr(args, reader, cache) as motor:
+            for pasta in args.pastas:
+                with _diario(args, pasta) as diario:
+                    resumos.append(renomear_imagens(pasta, motor, diario=diario, metricas=metricas))
+        return resumos
+    finally:
+        if cache is not None:
+            cache.fechar()
+
+
+def _cmd_ocr_watch(args, metricas):
+    reader = _leitor(args)
+    cache = _cache_ocr(args)
+    try:
+        with _motor_ocr(args, reader, cache) as motor, _diario(args, args.pasta) as diario:
+            return [vigiar_pasta(args.pasta, motor, diario=diario, metricas=metricas,
+                                 incluir_existentes=args.incluir_existentes, usar_inotify=not args.varredura)]
+    finally:
+        if cache is not None:
+            cache.fechar()
+
+
+def _cmd_csv_move(args, metricas):
+    resumos = []
+    for arquivo in args.arquivos:
+        with _diario(args, arquivo) as diario:
+            resumos.append(mover_por_csv(arquivo, somente_existentes=args.somente_existentes, simular=args.simular,
+                                         diario=diario, metricas=metricas))
+    return resumos
+
+
+def _cmd_csv_check(args, metricas):
+    return [conciliar_csv(arquivo, arquivo_relatorio=args.relatorio, metricas=metricas) for arquivo in args.arquivos]
+
+
+def _cmd_fpk_copy(args, metricas):
+    with _diario(args, args.parte1) as diario:
+        return [copiar_conteudo_por_fpk(args.parte1, args.parte2, usar_indice=not args.sem_indice,
+                                        trabalhadores_copia=args.trabalhadores_copia, modo=args.modo,
+                                        simular=args.simular, diario=diario, metricas=metricas)]
+
+
+def _cmd_fpk_copy_folder(args, metricas):
+    with _diario(args, args.parte1) as diario:
+        return [copiar_pasta_completa_por_fpk(args.parte1, args.parte2, usar_indice=not args.sem_indice,
+                                              trabalhadores_copia=args.trabalhadores_copia, modo=args.modo,
+                                              simular=args.simular, diario=diario, metricas=metricas)]
+
+
+def _cmd_undo(args, metricas):
+    return [desfazer(caminho_diario(args.operacao, args.alvo))]
+
+
+def _cmd_fpk_lookup(args, metricas):
+    with IndiceFPK(args.parte1) as indice:
+        if args.atualizar:
+            for _ in indice.percorrer():
+                pass
+        if args.jogador is None:
+            return [ConsultaFPK(jogador=nome, pastas=total) for nome, total in indice.jogadores().items()]
+        pastas = indice.pastas_do_jogador(args.jogador)
+    return [ConsultaFPK(jogador=args.jogador, pastas=[pasta.name for pasta in pastas])]
+
+
+def _cmd_list_folders(args, metricas):
+    if args.recursivo or args.profundidade:
+        return [inventariar_pastas(pasta, formato=args.formato, profundidade=args.profundidade,
+                                   trabalhadores=args.trabalhadores, metricas=metricas)
+                for pasta in args.pastas]
+    return [listar_pastas(pasta) for pasta in args.pastas]
+
+
+OPERACOES_COM_DIARIO = ("ocr-rename", "ocr-watch", "csv-move", "fpk-copy", "fpk-copy-folder")
+
+
+def _argumentos_ocr(p):
+    p.add_argument("--idiomas", nargs="+", default=list(IDIOMAS_PADRAO),
+                   help="idiomas do EasyOCR (padrão: pt en; 'en' basta para o recorte só com dígitos)")
+    p.add_argument("--lote", type=int, default=TAMANHO_LOTE_PADRAO, help="imagens por lote de inferência")
+    p.add_argument("--trabalhadores", type=int, default=TRABALHADORES_PADRAO, help="threads de decodificação")
+    p.add_argument("--regiao", type=float, nargs=4, metavar=("X0", "Y0", "X1", "Y1"),
+                   help="recorte do ID em frações da imagem (padrão: aprender automaticamente)")
+    p.add_argument("--sem-regiao", action="store_true", help="não aprender recorte; sempre OCR da imagem inteira")
+    p.add_argument("--cache", help="arquivo SQLite do cache de OCR (padrão: diretório de cache do usuário)")
+    p.add_argument("--sem-cache", action="store_true", help="não usar o cache de OCR")
+    p.add_argument("--cpu", action="store_true", help="não usar GPU mesmo se disponível")
+    p.add_argument("--processos", type=int, default=0,
+                   help="OCR na CPU em N processos, cada um com seu leitor (ex.: o número de núcleos); 0 = um leitor só")
+    p.add_argument("--threads-por-processo", type=int,
+                   help="threads do torch em cada processo (padrão: núcleos / processos)")
+    p.add_argument("--altura-maxima", type=int, default=ALTURA_MAXIMA_PADRAO,
+                   help="reduz imagens mais altas que isso (pixels) antes do OCR; 0 mantém o tamanho original")
+    p.add_argument("--colorido", action="store_true", help="passa a imagem colorida ao OCR (padrão: tons de cinza)")
+    p.add_argument("--contraste", action="store_true", help="realça o contraste (CLAHE) antes do OCR")
+    p.add_argument("--binarizar", action="store_true", help="binariza a imagem (limiar de Otsu) antes do OCR")
+
+
+def _argumentos_diario(p):
+    p.add_argument("--retomar", action="store_true", help="continua a execução interrompida, pulando o que o diário já registra")
+    p.add_argument("--sem-diario", action="store_true", help="não gravar o diário (sem retomar/desfazer)")
+
+
+def criar_parser():
+    parser = argparse.ArgumentParser(prog="menu", description="Gerenciador de Pastas e Imagens (modo linha de comando)")
+    parser.add_argument("--json", action="store_true", help="imprime os resumos em JSON")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log detalhado (DEBUG): uma linha por item")
+    parser.add_argument("--log", metavar="ARQUIVO", help="arquivo do log (rotativo; padrão: logs/ no diretório de cache)")
+    parser.add_argument("--sem-log", action="store_true", help="log só no console, sem arquivo")
+    parser.add_argument("--metricas", metavar="ARQUIVO",
+                        help="grava em JSON as métricas da execução (tempo por etapa, itens/s, bytes/s)")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("ocr-rename", help="renomeia imagens pelo 'JOGADOR ID' lido via OCR")
+    p.add_argument("pastas", nargs="+", metavar="PASTA")
+    _argumentos_ocr(p)
+    _argumentos_diario(p)
+    p.set_defaults(executar=_cmd_ocr_rename)
+
+    p = sub.add_parser("ocr-watch", help="vigia a pasta e renomeia cada imagem nova pelo 'JOGADOR ID' (Ctrl+C para parar)")
+    p.add_argument("pasta")
+    p.add_argument("--incluir-existentes", action="store_true", help="processa também as imagens que já estão na pasta")
+    p.add_argument("--varredura", action="store_true", help="varre a pasta periodicamente em vez de usar o inotify")
+    _argumentos_ocr(p)
+    p.add_argument("--sem-diario", action="store_true", help="não gravar o diário (sem desfazer)")
+    p.set_defaults(executar=_cmd_ocr_watch, retomar=False)
+
+    p = sub.add_parser("csv-move", help="move pastas/arquivos por Id para pastas por Name conforme CSV")
+    p.add_argument("arquivos", nargs="+", metavar="ARQUIVO_CSV")
+    p.add_argument("--somente-existentes", action="store_true",
+                   help="só cria a pasta do Name quando a pasta do Id existe")
+    p.add_argument("--simular", action="store_true", help="dry-run: só mostra o plano (itens e bytes), sem alterar o disco")
+    _argumentos_diario(p)
+    p.set_defaults(executar=_cmd_csv_move)
+
+    p = sub.add_parser("csv-check", help="confere os Ids do CSV com as pastas e arquivos do diretório, sem alterar nada")
+    p.add_argument("arquivos", nargs="+", metavar="ARQUIVO_CSV")
+    p.add_argument("--relatorio", help="grava todas as diferenças neste CSV (tipo;nome)")
+    p.set_defaults(executar=_cmd_csv_check)
+
+    p = sub.add_parser("fpk-copy", help="copia o conteúdo da pasta do jogador (PARTE 2) para cada face.fpk (PARTE 1)")
+    p.add_argument("parte1")
+    p.add_argument("parte2")
+    p.add_argument("--sem-indice", action="store_true", help="reler todos os face.fpk sem usar o índice salvo")
+    p.add_argument("--trabalhadores-copia", type=int, default=TRABALHADORES_COPIA, help="threads de cópia em paralelo")
+    p.add_argument("--modo", choices=MODOS_TRANSFERENCIA, default=MODO_PADRAO,
+                   help="copia, reflink, hardlink (arquivos compartilhados), mover ou auto (reflink no mesmo volume, senão copia)")
+    p.add_argument("--simular", action="store_true", help="dry-run: só mostra o plano (itens e bytes), sem alterar o disco")
+    _argumentos_diario(p)
+    p.set_defaults(executar=_cmd_fpk_copy)
+
+    p = sub.add_parser("fpk-copy-folder", help="copia a pasta completa do jogador (PARTE 2) para cada face.fpk (PARTE 1)")
+    p.add_argument("parte1")
+    p.add_argument("parte2")
+    p.add_argument("--sem-indice", action="store_true", help="reler todos os face.fpk sem usar o índice salvo")
+    p.add_argument("--trabalhadores-copia", type=int, default=TRABALHADORES_COPIA, help="threads de cópia em paralelo")
+    p.add_argument("--modo", choices=MODOS_TRANSFERENCIA, default=MODO_PADRAO,
+                   help="copia, reflink, hardlink (arquivos compartilhados), mover ou auto (reflink no mesmo volume, senão copia)")
+    p.add_argument("--simular", action="store_true", help="dry-run: só mostra o plano (itens e bytes), sem alterar o disco")
+    _argumentos_diario(p)
+    p.set_defaults(executar=_cmd_fpk_copy_folder)
+
+    p = sub.add_parser("fpk-lookup", help="consulta no índice salvo quais pastas (IDs) apontam para um jogador")
+    p.add_argument("parte1")
+    p.add_argument("jogador", nargs="?", help="nome do jogador (sem ele, lista os jogadores e o total de pastas)")
+    p.add_argument("--atualizar", action="store_true", help="percorre a PARTE 1 e atualiza o índice antes de consultar")
+    p.set_defaults(executar=_cmd_fpk_lookup)
+
+    p = sub.add_parser("undo", help="desfaz a última execução registrada no diário de uma operação")
+    p.add_argument("operacao", choices=OPERACOES_COM_DIARIO)
+    p.add_argument("alvo", help="PASTA, ARQUIVO_CSV ou PARTE1 usado na execução")
+    p.set_defaults(executar=_cmd_undo)
+
+    p = sub.add_parser("list-folders", help="grava as subpastas em lista_pastas.txt (ou o inventário recursivo)")
+    p.add_argument("pastas", nargs="+", metavar="PASTA")
+    p.add_argument("--recursivo", action="store_true",
+                   help="inventário de todas as subpastas com quantidade de itens e tamanho em inventario_pastas.FORMATO")
+    p.add_argument("--profundidade", type=int,
+                   help="grava só as pastas até este nível (os totais incluem a subárvore inteira); implica --recursivo")
+    p.add_argument("--formato", choices=FORMATOS_INVENTARIO, default="csv", help="formato do inventário (padrão: csv)")
+    p.add_argument("--trabalhadores", type=int, default=TRABALHADORES_BUSCA, help="listagens simultâneas no inventário")
+    p.set_defaults(executar=_cmd_list_folders)
+
+    return parser
+
+
+def main(argv=None):
+    args = criar_parser().parse_args(argv)
+    configurar_log(logging.DEBUG if args.verbose else logging.INFO, arquivo=False if args.sem_log else args.log)
+
+    metricas = Metricas(args.comando)
+    try:
+        resumos = args.executar(args, metricas)
+    except (ErroCSV, OSError) as e:
+        logging.error(str(e))
+        return 2
+    finally:
+        metricas.encerrar()
+        if args.metricas:
+            metricas.exportar(args.metricas)
+
+    metricas.registrar_no_log()
+    encerrar_log()  # O log termina de ser escrito antes dos resumos na saída
+
+    for resumo in resumos:
+        if args.json:
+            print(json.dumps(asdict(resumo), ensure_ascii=False, default=str))
+        else:
+            print(resumo)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,448 @@
+"""Cópia concorrente de arquivos e pastas (usada nas operações por FPK).
+
+Modos de transferência:
+
+- ``copia``: duplica os dados.
+- ``reflink``: clone copy-on-write (FICLONE; Btrfs, XFS, bcachefs...), sem espaço extra.
+- ``hardlink``: link físico; as cópias passam a compartilhar o mesmo arquivo
+  (alterar uma altera todas e a origem). Só é usado quando pedido explicitamente.
+- ``mover``: move os arquivos (a origem deixa de existir).
+- ``auto``: no mesmo volume tenta reflink (cópia independente sem espaço extra),
+  senão copia.
+
+Quando um modo não é suportado, a transferência recai na cópia comum. Cópias
+e clones são gravados num nome temporário e só então renomeados para o nome
+final: um arquivo de destino que existe está completo.
+"""
+
+import errno
+import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+TRABALHADORES_COPIA = 8
+TAMANHO_BUFFER = 1024 * 1024
+MODOS_TRANSFERENCIA = ("auto", "copia", "reflink", "hardlink", "mover")
+MODO_PADRAO = "auto"
+# Sufixo do arquivo em transferência, renomeado para o nome final quando termina
+SUFIXO_TEMPORARIO = ".copiando"
+# ioctl do Linux que clona um arquivo inteiro (_IOW(0x94, 9, int))
+FICLONE = 0x40049409
+# Erros que indicam que a chamada rápida não é suportada para este par de arquivos
+_ERROS_SEM_SUPORTE = {
+    getattr(errno, nome)
+    for nome in ("EXDEV", "ENOSYS", "EINVAL", "EOPNOTSUPP", "ENOTSUP", "EBADF", "ENOTSOCK", "ENOTTY", "EPERM")
+    if hasattr(errno, nome)
+}
+
+
+@dataclass
+class EstatisticasCopia:
+    """Totais de uma sessão de cópia (``bytes`` conta só os dados realmente duplicados)."""
+    arquivos: int = 0
+    bytes: int = 0
+    erros: int = 0
+    por_modo: dict = field(default_factory=dict)
+
+
+def _copiar_com(chamada, origem_fd, destino_fd, tamanho):
+    """Copia até ``tamanho`` bytes com ``chamada(origem_fd, destino_fd, restante)``; retorna o total copiado."""
+    copiados = 0
+    while copiados < tamanho:
+        enviados = chamada(origem_fd, destino_fd, tamanho - copiados)
+        if enviados == 0:
+            break
+        copiados += enviados
+    return copiados
+
+
+def copiar_dados(origem, destino):
+    """Copia o conteúdo de ``origem`` para ``destino`` e retorna os bytes copiados.
+
+    No Linux tenta ``os.copy_file_range`` (cópia no kernel, ou no servidor em
+    NFS/SMB recentes) e depois ``os.sendfile``; nos demais casos usa leitura e
+    escrita com buffer grande.
+    """
+    with open(origem, 'rb', buffering=0) as arquivo_origem, open(destino, 'wb', buffering=0) as arquivo_destino:
+        origem_fd, destino_fd = arquivo_origem.fileno(), arquivo_destino.fileno()
+        tamanho = os.fstat(origem_fd).st_size
+        copiados = 0
+
+        rapidas = []
+        if hasattr(os, "copy_file_range"):
+            rapidas.append(lambda o, d, n: os.copy_file_range(o, d, n))
+        if hasattr(os, "sendfile") and os.name != "nt":
+            rapidas.append(lambda o, d, n: os.sendfile(d, o, None, n))
+
+        for chamada in rapidas:
+            if copiados >= tamanho:
+                break
+            try:
+                copiados += _copiar_com(chamada, origem_fd, destino_fd, tamanho - copiados)
+            except OSError as e:
+                if e.errno not in _ERROS_SEM_SUPORTE:
+                    raise
+
+        # Restante (ou tudo, sem chamadas rápidas) continua dos offsets atuais
+        while True:
+            bloco = arquivo_origem.read(TAMANHO_BUFFER)
+            if not bloco:
+                break
+            arquivo_destino.write(bloco)
+            copiados += len(bloco)
+    return copiados
+
+
+def copiar_arquivo(origem, destino):
+    """Equivalente a ``shutil.copy2`` usando ``copiar_dados``; retorna os bytes copiados."""
+    copiados = copiar_dados(origem, destino)
+    shutil.copystat(origem, destino)
+    return copiados
+
+
+def clonar_arquivo(origem, destino):
+    """Cria ``destino`` como clone copy-on-write de ``origem`` (FICLONE).
+
+    Levanta ``OSError`` (ENOTSUP) quando o sistema não oferece o ioctl.
+    """
+    if fcntl is None:
+        raise OSError(errno.ENOTSUP, "reflink não suportado nesta plataforma", str(destino))
+    with open(origem, 'rb', buffering=0) as arquivo_origem, open(destino, 'xb', buffering=0) as arquivo_destino:
+        try:
+            fcntl.ioctl(arquivo_destino.fileno(), FICLONE, arquivo_origem.fileno())
+        except OSError:
+            arquivo_destino.close()
+            os.unlink(destino)
+            raise
+    shutil.copystat(origem, destino)
+
+
+def _via_temporario(transferir):
+    """Faz ``transferir(origem, destino)`` gravar num nome temporário da pasta de destino e depois renomeá-lo.
+
+    Uma transferência interrompida deixa só o temporário (``.<nome>.copiando``,
+    sobrescrito na próxima tentativa), nunca um destino pela metade.
+    """
+    def transferir_via_temporario(origem, destino):
+        pasta, nome = os.path.split(destino)
+        temporario = os.path.join(pasta, f".{nome}{SUFIXO_TEMPORARIO}")
+        with suppress(FileNotFoundError):
+            os.unlink(temporario)  # Sobra de uma execução interrompida
+        try:
+            copiados = transferir(origem, temporario)
+            os.replace(temporario, destino)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(temporario)
+            raise
+        return copiados
+    return transferir_via_temporario
+
+
+_copiar_via_temporario = _via_temporario(copiar_arquivo)
+
+
+def _mover_arquivo(origem, destino):
+    """Renomeia no mesmo volume; entre volumes copia e apaga a origem. Retorna os bytes copiados."""
+    try:
+        os.rename(origem, destino)
+        return 0
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    copiados = _copiar_via_temporario(origem, destino)
+    os.unlink(origem)
+    return copiados
+
+
+def tentativas_por_modo(modo, mesmo_volume):
+    """Ordem dos métodos tentados para ``modo``; a cópia comum é sempre o último recurso."""
+    if modo not in MODOS_TRANSFERENCIA:
+        raise ValueError(f"Modo de transferência inválido: {modo!r} (use {', '.join(MODOS_TRANSFERENCIA)})")
+    if modo == "auto":
+        # Nunca hardlink: as "cópias" passariam a compartilhar o arquivo com a PARTE 2
+        return ("reflink", "copia") if mesmo_volume else ("copia",)
+    if modo == "mover":
+        return ("mover",)
+    if modo == "copia" or not mesmo_volume:
+        return ("copia",)
+    return (modo, "copia")
+
+
+_METODOS = {
+    "copia": _copiar_via_temporario,
+    "reflink": _via_temporario(lambda origem, destino: clonar_arquivo(origem, destino) or 0),
+    "hardlink": lambda origem, destino: os.link(origem, destino) or 0,
+    "mover": _mover_arquivo,
+}
+
+
+@dataclass
+class Arvore:
+    """Conteúdo de uma pasta: subpastas (pai antes do filho) e arquivos, relativos à raiz."""
+    subpastas: list = field(default_factory=list)
+    arquivos: list = field(default_factory=list)
+    bytes: int = 0
+
+
+def listar_arvore(origem):
+    """Percorre ``origem`` uma vez com ``os.scandir`` (seguindo links, como ``copytree``)."""
+    arvore = Arvore()
+    pendentes = [""]
+    while pendentes:
+        relativa = pendentes.pop()
+        with os.scandir(os.path.join(origem, relativa)) as entradas:
+            for entrada in entradas:
+                caminho = os.path.join(relativa, entrada.name)
+                if entrada.is_dir():
+                    arvore.subpastas.append(caminho)
+                    pendentes.append(caminho)
+                else:
+                    arvore.arquivos.append(caminho)
+                    arvore.bytes += entrada.stat().st_size
+    return arvore
+
+
+class ReservasDestino:
+    """Destinos já existentes ou reservados nesta execução (regra de não sobrescrever).
+
+    Cada pasta de destino é listada uma única vez: o mesmo jogador costuma ir
+    para dezenas de IDs, e o que a própria execução cria já fica nas reservas.
+    ``retomar`` são destinos que existem mas ficaram incompletos numa execução
+    interrompida (segundo o diário): podem ser reservados para terminar a cópia.
+    """
+
+    def __init__(self, retomar=()):
+        self._lock = threading.Lock()
+        self._reservados = set()
+        self._existentes = {}  # pasta de destino -> nomes já presentes
+        self._retomar = {os.path.normcase(os.path.abspath(destino)) for destino in retomar}
+
+    def reservar(self, destino):
+        """True se ``destino`` não existe nem foi reservado; nesse caso fica reservado."""
+        pasta, nome = os.path.split(os.path.abspath(destino))
+        chave = os.path.normcase(os.path.join(pasta, nome))
+        with self._lock:
+            if chave in self._reservados:
+                return False
+            existentes = self._existentes.get(pasta)
+            if existentes is None:
+                try:
+                    existentes = {os.path.normcase(item) for item in os.listdir(pasta)}
+                except OSError:
+                    existentes = set()
+                self._existentes[pasta] = existentes
+            if os.path.normcase(nome) in existentes and chave not in self._retomar:
+                return False
+            self._reservados.add(chave)
+            return True
+
+
+@dataclass
+class _PastaEmCopia:
+    """Pasta agendada por ``copiar_arvore`` e quantos de seus arquivos ainda estão em transferência."""
+    origem: str
+    destino: str
+    pendentes: int
+    erros: int = 0
+
+
+class AgendadorCopia:
+    """Pool limitado de threads para copiar muitos arquivos em paralelo.
+
+    A latência por arquivo de compartilhamentos de rede deixa de somar em série:
+    pastas com milhares de texturas pequenas são copiadas por vários
+    trabalhadores ao mesmo tempo. A regra de não sobrescrever fica com quem
+    agenda (``Plano.reservas``, um ``ReservasDestino``). As
+    pastas são criadas na thread chamadora (pai antes do filho) e seus
+    metadados aplicados em ``aguardar``, depois de todos os arquivos.
+
+    ``modo`` escolhe a transferência (veja ``MODOS_TRANSFERENCIA``). O volume de
+    origem e destino é comparado a cada chamada, e um método que falha por falta
+    de suporte não é tentado de novo para o mesmo par de volumes. Com um
+    ``Diario``, cada arquivo transferido e cada pasta criada são registrados,
+    e cada pasta agendada por ``copiar_arvore`` recebe um registro
+    ``copiar_pasta`` quando todos os seus arquivos terminam sem erro; numa
+    retomada, as pastas criadas sem esse registro são completadas.
+    Com ``Metricas``, os bytes transferidos são contados assim que cada arquivo
+    termina e o tempo fica na etapa ``transferencia_<método>``.
+    """
+
+    def __init__(self, trabalhadores=TRABALHADORES_COPIA, modo=MODO_PADRAO, diario=None, metricas=None):
+        tentativas_por_modo(modo, True)  # valida o modo antes de abrir o pool
+        self.trabalhadores = max(1, int(trabalhadores))
+        self.modo = modo
+        self.diario = diario
+        self.metricas = metricas
+        self.estatisticas = EstatisticasCopia()
+        self._executor = ThreadPoolExecutor(max_workers=self.trabalhadores, thread_name_prefix="copia")
+        self._vagas = threading.BoundedSemaphore(self.trabalhadores * 4)
+        self._lock = threading.Lock()
+        self._pastas = []
+        self._origens_movidas = []
+        self._sem_suporte = set()  # (dispositivo_origem, dispositivo_destino, método)
+        self._arvores = {}  # pasta de origem -> Arvore (listada uma vez por execução)
+        self._volumes = {}  # pasta -> st_dev
+        self._incompletas = diario.pastas_incompletas() if diario is not None else set()
+        self._copiados_antes = diario.concluidas("copiar") if self._incompletas else set()
+
+    def _volume(self, pasta):
+        volume = self._volumes.get(pasta)
+        if volume is None:
+            volume = self._volumes[pasta] = os.stat(pasta).st_dev
+        return volume
+
+    def _transferir(self, origem, destino):
+        """Transfere um arquivo pelo primeiro método suportado; retorna ``(método, bytes)``."""
+        volumes = (self._volume(os.path.dirname(origem)), self._volume(os.path.dirname(destino)))
+        tentativas = tentativas_por_modo(self.modo, volumes[0] == volumes[1])
+        for metodo in tentativas:
+            if metodo != tentativas[-1] and (*volumes, metodo) in self._sem_suporte:
+                continue
+            try:
+                return metodo, _METODOS[metodo](origem, destino)
+            except OSError as e:
+                if metodo == tentativas[-1]:
+                    raise
+                if e.errno in _ERROS_SEM_SUPORTE:
+                    logging.debug(f"{metodo} indisponível entre os volumes {volumes}: {e}")
+                    with self._lock:
+                        self._sem_suporte.add((*volumes, metodo))
+                elif e.errno != errno.EMLINK:  # limite de links do arquivo: só este recai na cópia
+                    raise
+
+    def _executar(self, origem, destino, pasta):
+        sucesso = False
+        try:
+            inicio = time.perf_counter()
+            metodo, copiados = self._transferir(origem, destino)
+            if self.metricas is not None:
+                self.metricas.somar(f"transferencia_{metodo}", time.perf_counter() - inicio)
+                self.metricas.contar(bytes=copiados)
+            if self.diario is not None:
+                self.diario.registrar("mover" if metodo == "mover" else "copiar", origem, destino)
+            with self._lock:
+                self.estatisticas.arquivos += 1
+                self.estatisticas.bytes += copiados
+                self.estatisticas.por_modo[metodo] = self.estatisticas.por_modo.get(metodo, 0) + 1
+            sucesso = True
+        except Exception as e:
+            logging.error(f"❌ Erro ao copiar {Path(origem).name}: {e}")
+            with self._lock:
+                self.estatisticas.erros += 1
+        finally:
+            if pasta is not None:
+                self._concluir_arquivo_da_pasta(pasta, sucesso)
+            self._vagas.release()
+
+    def copiar_arquivo(self, origem, destino, pasta=None):
+        """Agenda a transferência de um arquivo (bloqueia se a fila estiver cheia)."""
+        self._vagas.acquire()
+        self._executor.submit(self._executar, str(origem), str(destino), pasta)
+
+    def _concluir_arquivo_da_pasta(self, pasta, sucesso):
+        with self._lock:
+            pasta.pendentes -= 1
+            pasta.erros += not sucesso
+            terminou = not pasta.pendentes and not pasta.erros
+        if terminou:
+            self._registrar_pasta_copiada(pasta)
+
+    def _registrar_pasta_copiada(self, pasta):
+        if self.diario is not None:
+            self.diario.registrar("copiar_pasta", pasta.origem, pasta.destino)
+
+    def copiar_arvore(self, origem, destino, arvore=None):
+        """Agenda a transferência de uma pasta inteira; retorna o número de arquivos agendados.
+
+        Como ``shutil.copytree``, falha se ``destino`` já existir e segue links
+        simbólicos, a menos que ``destino`` seja uma pasta incompleta de uma
+        execução interrompida: aí só os arquivos que ainda não existem são
+        transferidos. ``arvore`` reaproveita uma listagem já feita de ``origem``.
+        No modo ``mover`` as pastas de origem esvaziadas são removidas em ``aguardar``.
+        """
+        origem, destino = str(origem), str(destino)
+        if arvore is None:
+            arvore = self._arvores.get(origem)
+            if arvore is None:
+                arvore = self._arvores[origem] = listar_arvore(origem)
+        retomando = os.path.abspath(destino) in self._incompletas
+        self._criar_pasta(origem, destino, retomando, raiz=True)
+        for relativa in arvore.subpastas:
+            self._criar_pasta(os.path.join(origem, relativa), os.path.join(destino, relativa), retomando)
+        arquivos = []
+        for relativa in arvore.arquivos:
+            if retomando and os.path.lexists(os.path.join(destino, relativa)):
+                self._registrar_copia_anterior(os.path.join(origem, relativa), os.path.join(destino, relativa))
+            else:
+                arquivos.append(relativa)
+        pasta = _PastaEmCopia(origem, destino, len(arquivos))
+        if not arquivos:
+            self._registrar_pasta_copiada(pasta)
+        for relativa in arquivos:
+            self.copiar_arquivo(os.path.join(origem, relativa), os.path.join(destino, relativa), pasta)
+        if self.modo == "mover":
+            self._origens_movidas.append(origem)
+        return len(arquivos)
+
+    def _registrar_copia_anterior(self, origem, destino):
+        """Registra um arquivo que a execução interrompida copiou sem chegar a gravar no diário."""
+        if self.diario is not None and (os.path.abspath(origem), os.path.abspath(destino)) not in self._copiados_antes:
+            self.diario.registrar("copiar", origem, destino)
+
+    def _criar_pasta(self, origem, destino, retomando, raiz=False):
+        if retomando and os.path.isdir(destino):
+            self._pastas.append((origem, destino))
+            if not raiz and self.diario is not None:
+                # Dentro de uma pasta incompleta, as subpastas também foram criadas pela execução interrompida
+                self.diario.registrar("criar_pasta", destino=destino)
+            return
+        if raiz:
+            os.makedirs(destino)
+        else:
+            os.mkdir(destino)
+        self._pastas.append((origem, destino))
+        if self.diario is not None:
+            self.diario.registrar("criar_pasta", destino=destino)
+            if raiz:
+                # A retomada reconhece a pasta incompleta por este registro: não pode ficar no buffer
+                self.diario.sincronizar()
+
+    def _remover_origens_vazias(self):
+        for raiz in self._origens_movidas:
+            for pasta, _, _ in os.walk(raiz, topdown=False):
+                try:
+                    os.rmdir(pasta)
+                except OSError:
+                    pass  # Sobrou algo (erro de transferência): a origem é mantida
+        self._origens_movidas.clear()
+
+    def aguardar(self):
+        """Espera todas as transferências e aplica os metadados das pastas; retorna as estatísticas."""
+        self._executor.shutdown(wait=True)
+        for pasta_origem, pasta_destino in reversed(self._pastas):
+            try:
+                if os.path.exists(pasta_origem):
+                    shutil.copystat(pasta_origem, pasta_destino)
+            except OSError:
+                pass
+        self._pastas.clear()
+        self._remover_origens_vazias()
+        return self.estatisticas
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.aguardar()
@@ -0,0 +1,199 @@
+"""Diário de execução: registro das ações concluídas para retomar ou desfazer.
+
+Cada execução grava, em JSON Lines e só acrescentando, uma linha por ação
+concluída (``mover``, ``renomear``, ``criar_pasta``, ``copiar``...) e, nas
+cópias de pastas, ``copiar_pasta`` quando todos os arquivos da pasta terminam. As linhas
+são enviadas ao disco com ``fsync`` em lotes; se o programa cair, no máximo o
+último lote se perde e a linha incompleta do fim é ignorada na leitura.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from .cache_ocr import diretorio_cache_padrao
+
+# Linhas acumuladas antes de um fsync
+LINHAS_POR_FSYNC = 50
+
+
+def caminho_diario(operacao, alvo):
+    """Arquivo do diário de ``operacao`` sobre ``alvo`` no diretório de cache do usuário."""
+    chave = hashlib.blake2b(str(Path(alvo).resolve()).encode('utf-8'), digest_size=8).hexdigest()
+    return diretorio_cache_padrao() / "diarios" / f"{operacao}-{chave}.jsonl"
+
+
+def _absoluto(caminho):
+    return os.path.abspath(caminho) if caminho is not None else None
+
+
+def ler_diario(caminho):
+    """Registros do diário na ordem em que foram gravados (lista vazia se não existir)."""
+    registros = []
+    try:
+        with open(caminho, encoding='utf-8') as f:
+            for linha in f:
+                try:
+                    registros.append(json.loads(linha))
+                except json.JSONDecodeError:
+                    break  # Linha cortada por uma queda: o resto não é confiável
+    except FileNotFoundError:
+        pass
+    return registros
+
+
+def execucao_incompleta(registros):
+    """True se o diário tem registros e não termina com ``fim`` (a execução foi interrompida)."""
+    return bool(registros) and registros[-1].get("acao") != "fim"
+
+
+class Diario:
+    """Diário append-only de uma execução.
+
+    Sem ``retomar`` o diário anterior do mesmo caminho é guardado como
+    ``.anterior.jsonl`` e um novo é iniciado; com ``retomar`` ele continua e
+    ``anteriores`` traz o que já foi feito, para a operação pular esse trabalho.
+    Pode ser usado de várias threads.
+    """
+
+    def __init__(self, caminho, operacao="", retomar=False, linhas_por_fsync=LINHAS_POR_FSYNC):
+        self.caminho = Path(caminho)
+        self.operacao = operacao
+        self.retomar = retomar
+        self.anteriores = ler_diario(self.caminho) if retomar else []
+        self.linhas_por_fsync = linhas_por_fsync
+        self._lock = threading.Lock()
+        self._pendentes = 0
+        self._arquivo = None  # Aberto na primeira ação: uma execução cancelada não mexe no diário anterior
+
+    def _abrir(self):
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        if not self.retomar and self.caminho.exists():
+            self.caminho.replace(self.caminho.with_suffix(".anterior.jsonl"))
+        self._arquivo = open(self.caminho, 'a', encoding='utf-8')
+        self._escrever({"acao": "inicio", "quando": round(time.time(), 3), "operacao": self.operacao,
+                        "retomada": bool(self.anteriores)})
+        self._sincronizar()
+        logging.info(f"📓 Diário da execução: {self.caminho}")
+
+    def _escrever(self, registro):
+        self._arquivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        self._pendentes += 1
+
+    def concluidas(self, *acoes):
+        """Pares ``(origem, destino)`` (caminhos absolutos) já registrados para as ``acoes`` (todas, se nenhuma)."""
+        return {(_absoluto(registro.get("origem")), _absoluto(registro.get("destino"))) for registro in self.anteriores
+                if not acoes or registro.get("acao") in acoes}
+
+    def pastas_incompletas(self):
+        """Pastas criadas (``criar_pasta``) cuja cópia não chegou ao registro ``copiar_pasta``."""
+        criadas = {_absoluto(registro.get("destino")) for registro in self.anteriores
+                   if registro.get("acao") == "criar_pasta"}
+        return criadas - {_absoluto(registro.get("destino")) for registro in self.anteriores
+                          if registro.get("acao") == "copiar_pasta"}
+
+    def registrar(self, acao, origem=None, destino=None, **extra):
+        """Registra uma ação concluída; os caminhos são gravados absolutos (o desfazer pode rodar de outra pasta)."""
+        registro = {"acao": acao, "quando": round(time.time(), 3)}
+        if origem is not None:
+            registro["origem"] = _absoluto(origem)
+        if destino is not None:
+            registro["destino"] = _absoluto(destino)
+        registro.update(extra)
+        with self._lock:
+            if self._arquivo is None:
+                self._abrir()
+            self._escrever(registro)
+            if self._pendentes >= self.linhas_por_fsync:
+                self._sincronizar()
+
+    def _sincronizar(self):
+        if self._arquivo is None or self._arquivo.closed:
+            return
+        self._arquivo.flush()
+        os.fsync(self._arquivo.fileno())
+        self._pendentes = 0
+
+    def sincronizar(self):
+        """Envia ao disco as linhas pendentes."""
+        with self._lock:
+            self._sincronizar()
+
+    def concluir(self):
+        """Marca a execução como terminada (uma retomada não é mais necessária)."""
+        if self._arquivo is None and not self.retomar:
+            return  # Nada foi feito: o diário anterior continua valendo
+        self.registrar("fim")
+        self.sincronizar()
+
+    def fechar(self):
+        with self._lock:
+            if self._arquivo is not None and not self._arquivo.closed:
+                self._sincronizar()
+                self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+@dataclass
+class ResumoDesfazer:
+    """Totais de um desfazer a partir do diário."""
+    desfeitas: int = 0
+    ignoradas: int = 0
+    erros: int = 0
+
+
+def desfazer(caminho):
+    """Desfaz as ações do diário, da última para a primeira.
+
+    Movimentações e renomeações voltam para a origem (se o destino ainda
+    existe e a origem está livre), cópias são apagadas e pastas criadas são
+    removidas se estiverem vazias. O diário desfeito é renomeado para
+    ``.desfeito.jsonl``.
+    """
+    caminho = Path(caminho)
+    resumo = ResumoDesfazer()
+    for registro in reversed(ler_diario(caminho)):
+        acao, origem, destino = registro.get("acao"), registro.get("origem"), registro.get("destino")
+        try:
+            if acao in ("mover", "renomear"):
+                if not os.path.lexists(destino) or os.path.lexists(origem):
+                    logging.warning(f"⏭️ Não é possível desfazer {Path(destino).name}: destino ausente ou origem ocupada")
+                    resumo.ignoradas += 1
+                    continue
+                os.makedirs(os.path.dirname(origem), exist_ok=True)
+                shutil.move(destino, origem)
+                logging.info(f"↩️ Desfeito: {Path(destino).name} → {origem}")
+            elif acao == "copiar":
+                if not os.path.lexists(destino):
+                    resumo.ignoradas += 1
+                    continue
+                os.unlink(destino)
+            elif acao == "criar_pasta":
+                try:
+                    os.rmdir(destino)
+                except OSError:
+                    resumo.ignoradas += 1  # Não está vazia (ou já foi removida): é mantida
+                    continue
+            else:
+                continue
+            resumo.desfeitas += 1
+        except Exception as e:
+            logging.error(f"❌ Erro ao desfazer {acao} {destino}: {e}")
+            resumo.erros += 1
+
+    if caminho.exists():
+        caminho.replace(caminho.with_suffix(".desfeito.jsonl"))
+    logging.info(f"↩️ Desfazer concluído: {resumo.desfeitas} ações desfeitas, {resumo.ignoradas} ignoradas, "
+                 f"{resumo.erros} erros")
+    return resumo
@@ -0,0 +1,283 @@
+"""Busca de face.fpk na PARTE 1, extração do nome do jogador e índice persistente."""
+
+import hashlib
+import logging
+import mmap
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+
+from .cache_ocr import diretorio_cache_padrao
+
+MARCADOR_FACE = 'Assets/pes16/model/character/face/real/'
+MARCADOR_FACE_BYTES = MARCADOR_FACE.encode('ascii')
+# Em minúsculas: a comparação com os nomes do disco é feita sem diferença de maiúsculas (Face.fpk, FACE.FPK)
+NOME_FACE_FPK = "face.fpk"
+# Bytes lidos do início do face.fpk antes de recorrer ao mmap do arquivo inteiro
+JANELA_CABECALHO = 64 * 1024
+TAMANHO_MAXIMO_NOME = 256
+# Listagens simultâneas durante a busca (maior ajuda em NAS/SMB)
+TRABALHADORES_BUSCA = 8
+
+
+@dataclass
+class EstatisticasBusca:
+    """Contadores atualizados durante a busca por face.fpk."""
+    diretorios_verificados: int = 0
+    pastas_com_face: int = 0
+    erros: int = 0
+
+
+def _assinatura(entrada):
+    """``(tamanho, mtime_ns)`` do face.fpk, usada para saber se ele mudou; ``(-1, -1)`` se indisponível."""
+    try:
+        estado = entrada.stat()
+        return estado.st_size, estado.st_mtime_ns
+    except OSError:
+        return -1, -1
+
+
+def _listar_diretorio(diretorio):
+    """Lê o diretório uma vez: retorna a assinatura do face.fpk (se houver) e as subpastas.
+
+    Usa o tipo em cache das entradas do ``os.scandir`` (o único ``stat`` é o do
+    próprio face.fpk) e não segue links simbólicos de diretório, evitando ciclos.
+    """
+    assinatura_face = None
+    subpastas = []
+    try:
+        with os.scandir(diretorio) as entradas:
+            for entrada in entradas:
+                if entrada.name.casefold() == NOME_FACE_FPK:
+                    assinatura_face = _assinatura(entrada)
+                try:
+                    if entrada.is_dir(follow_symlinks=False):
+                        subpastas.append(entrada.path)
+                except OSError:
+                    pass
+    except OSError as e:
+        return diretorio, assinatura_face, subpastas, e
+    return diretorio, assinatura_face, subpastas, None
+
+
+def percorrer_pastas_com_face(diretorio, trabalhadores=TRABALHADORES_BUSCA, estatisticas=None):
+    """Gera as pastas (abaixo de ``diretorio``) que contêm face.fpk, à medida que são encontradas.
+
+    Veja ``percorrer_faces``; esta versão entrega só o caminho da pasta.
+    """
+    for pasta_face, _ in percorrer_faces(diretorio, trabalhadores, estatisticas):
+        yield pasta_face
+
+
+def percorrer_faces(diretorio, trabalhadores=TRABALHADORES_BUSCA, estatisticas=None):
+    """Gera ``(pasta, assinatura)`` de cada pasta abaixo de ``diretorio`` que contém face.fpk.
+
+    A árvore é percorrida de forma iterativa por um pool de threads (útil em
+    compartilhamentos de rede, onde cada listagem espera pela latência do
+    servidor); uma thread coordenadora distribui as subpastas e entrega as
+    pastas encontradas por uma fila, então o consumo começa antes do fim da
+    busca. A ordem de entrega não é garantida. Erros ao listar subpastas são
+    registrados e ignorados; erro ao listar o próprio ``diretorio`` é levantado.
+    """
+    estatisticas = estatisticas if estatisticas is not None else EstatisticasBusca()
+    encontradas = queue.Queue()
+    parar = threading.Event()
+    fim = object()
+
+    def coordenar():
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, trabalhadores), thread_name_prefix="busca-fpk") as executor:
+                pendentes = {executor.submit(_listar_diretorio, str(diretorio)): True}
+                while pendentes and not parar.is_set():
+                    prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+                    for futuro in prontos:
+                        eh_raiz = pendentes.pop(futuro)
+                        caminho, assinatura_face, subpastas, erro = futuro.result()
+                        if erro is not None:
+                            if eh_raiz:
+                                raise erro
+                            logging.warning(f"⚠️ Erro ao listar {caminho}: {erro}")
+                            estatisticas.erros += 1
+                        if assinatura_face is not None and not eh_raiz:
+                            estatisticas.pastas_com_face += 1
+                            logging.debug("✅ face.fpk encontrado em: %s", caminho)
+                            encontradas.put((Path(caminho), assinatura_face))
+                        for subpasta in subpastas:
+                            estatisticas.diretorios_verificados += 1
+                            pendentes[executor.submit(_listar_diretorio, subpasta)] = False
+                for futuro in pendentes:
+                    futuro.cancel()
+        except Exception as e:
+            encontradas.put(e)
+        finally:
+            encontradas.put(fim)
+
+    coordenador = threading.Thread(target=coordenar, name="busca-fpk-coordenador", daemon=True)
+    coordenador.start()
+    try:
+        while True:
+            item = encontradas.get()
+            if item is fim:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        parar.set()
+        coordenador.join()
+
+
+def _nome_apos_marcador(dados, posicao):
+    """Nome entre o fim do marcador e o primeiro '/', quebra de linha ou NUL."""
+    inicio = posicao + len(MARCADOR_FACE_BYTES)
+    trecho = bytes(dados[inicio:inicio + TAMANHO_MAXIMO_NOME])
+    fim = len(trecho)
+    for separador in (b'/', b'\n', b'\r', b'\x00'):
+        indice = trecho.find(separador)
+        if indice != -1 and indice < fim:
+            fim = indice
+    return trecho[:fim].decode('utf-8', errors='ignore').strip() or None
+
+
+def extrair_nome_jogador(face_fpk_path):
+    """Extrai o nome do jogador do caminho após 'Assets/pes16/model/character/face/real/'.
+
+    O face.fpk é binário: a busca é feita em bytes, primeiro numa janela do
+    início do arquivo e, se o marcador não estiver lá, no arquivo inteiro via
+    ``mmap`` (sem decodificar o conteúdo). Retorna None se não encontrar.
+    """
+    with open(face_fpk_path, 'rb') as f:
+        cabecalho = f.read(JANELA_CABECALHO)
+        posicao = cabecalho.find(MARCADOR_FACE_BYTES)
+        if posicao != -1 and posicao + len(MARCADOR_FACE_BYTES) + TAMANHO_MAXIMO_NOME <= len(cabecalho):
+            return _nome_apos_marcador(cabecalho, posicao)
+        if len(cabecalho) < JANELA_CABECALHO:
+            # Arquivo inteiro já está no cabeçalho
+            return _nome_apos_marcador(cabecalho, posicao) if posicao != -1 else None
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            posicao = mapa.find(MARCADOR_FACE_BYTES)
+            if posicao == -1:
+                return None
+            return _nome_apos_marcador(mapa, posicao)
+
+
+def caminho_face_fpk(pasta_face):
+    """Caminho do face.fpk da pasta com a grafia usada no disco (ex.: ``Face.fpk``)."""
+    with os.scandir(pasta_face) as entradas:
+        for entrada in entradas:
+            if entrada.name.casefold() == NOME_FACE_FPK:
+                return Path(entrada.path)
+    return Path(pasta_face) / NOME_FACE_FPK
+
+
+def ler_nome_jogador(pasta_face):
+    """Nome do jogador do face.fpk da pasta; registra o problema e retorna None se falhar."""
+    try:
+        try:
+            nome_jogador = extrair_nome_jogador(pasta_face / NOME_FACE_FPK)
+        except FileNotFoundError:
+            # Grafia diferente num sistema de arquivos que diferencia maiúsculas (ex.: Face.fpk no Linux)
+            nome_jogador = extrair_nome_jogador(caminho_face_fpk(pasta_face))
+    except Exception as e:
+        logging.warning(f"⚠️ Erro ao ler face.fpk em {pasta_face.name}: {e}")
+        return None
+    if not nome_jogador:
+        logging.warning(f"⚠️ Nome do jogador não encontrado em {pasta_face.name}")
+    return nome_jogador
+
+
+def caminho_indice_fpk(raiz):
+    """Arquivo do índice da PARTE 1 no diretório de cache do usuário (um por raiz)."""
+    chave = hashlib.blake2b(str(Path(raiz).resolve()).encode('utf-8'), digest_size=8).hexdigest()
+    return diretorio_cache_padrao() / "indices_fpk" / f"{chave}.sqlite"
+
+
+class IndiceFPK:
+    """Índice persistente ``pasta com face.fpk → nome do jogador`` de uma PARTE 1.
+
+    Guarda, por pasta (relativa à raiz), o tamanho e o mtime do face.fpk e o
+    nome extraído. A cada ``percorrer()`` a árvore é listada de novo, mas só os
+    face.fpk novos ou com tamanho/mtime diferentes são lidos; pastas que
+    sumiram são removidas ao final de uma busca completa. ``pastas_do_jogador``
+    consulta o índice sem percorrer a árvore.
+    """
+
+    def __init__(self, raiz, caminho=None):
+        self.raiz = Path(raiz)
+        self.caminho = Path(caminho) if caminho else caminho_indice_fpk(self.raiz)
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        self.reaproveitados = 0
+        self.analisados = 0
+        self._conexao = sqlite3.connect(str(self.caminho))
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute(
+            "CREATE TABLE IF NOT EXISTS faces ("
+            " pasta TEXT PRIMARY KEY, tamanho INTEGER, mtime_ns INTEGER, nome_jogador TEXT, rodada INTEGER)"
+        )
+        self._conexao.execute("CREATE INDEX IF NOT EXISTS idx_nome_jogador ON faces (nome_jogador)")
+        self._conexao.execute("CREATE TABLE IF NOT EXISTS meta (chave TEXT PRIMARY KEY, valor TEXT)")
+        self._conexao.execute("INSERT OR REPLACE INTO meta VALUES ('raiz', ?)", (str(self.raiz.resolve()),))
+        self._conexao.commit()
+
+    def percorrer(self, trabalhadores=TRABALHADORES_BUSCA, estatisticas=None):
+        """Gera ``(pasta, nome_jogador)`` para cada face.fpk da raiz, atualizando o índice."""
+        rodada = time.time_ns()
+        pendentes = 0
+        for pasta_face, assinatura in percorrer_faces(self.raiz, trabalhadores, estatisticas):
+            relativa = pasta_face.relative_to(self.raiz).as_posix()
+            linha = self._conexao.execute(
+                "SELECT tamanho, mtime_ns, nome_jogador FROM faces WHERE pasta = ?", (relativa,)
+            ).fetchone()
+            if linha is not None and tuple(linha[:2]) == tuple(assinatura) and assinatura[0] >= 0:
+                nome_jogador = linha[2]
+                self.reaproveitados += 1
+            else:
+                nome_jogador = ler_nome_jogador(pasta_face)
+                self.analisados += 1
+
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO faces (pasta, tamanho, mtime_ns, nome_jogador, rodada) VALUES (?, ?, ?, ?, ?)",
+                (relativa, assinatura[0], assinatura[1], nome_jogador, rodada),
+            )
+            pendentes += 1
+            if pendentes >= 500:
+                self._conexao.commit()
+                pendentes = 0
+            yield pasta_face, nome_jogador
+
+        # Só chega aqui se a busca terminou: o que não foi visto nesta rodada não existe mais
+        removidas = self._conexao.execute("DELETE FROM faces WHERE rodada != ?", (rodada,)).rowcount
+        self._conexao.commit()
+        logging.info(f"🗂️ Índice FPK: {self.reaproveitados} reaproveitados, {self.analisados} lidos, "
+                     f"{removidas} removidos")
+
+    def pastas_do_jogador(self, nome_jogador):
+        """Pastas (com face.fpk) que apontam para o jogador, segundo o índice."""
+        linhas = self._conexao.execute(
+            "SELECT pasta FROM faces WHERE nome_jogador = ? ORDER BY pasta", (nome_jogador,)
+        ).fetchall()
+        return [self.raiz / pasta for pasta, in linhas]
+
+    def jogadores(self):
+        """Contagem de pastas por jogador, segundo o índice."""
+        linhas = self._conexao.execute(
+            "SELECT nome_jogador, COUNT(*) FROM faces WHERE nome_jogador IS NOT NULL"
+            " GROUP BY nome_jogador ORDER BY nome_jogador"
+        ).fetchall()
+        return dict(linhas)
+
+    def fechar(self):
+        self._conexao.commit()
+        self._conexao.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
@@ -0,0 +1,75 @@
+"""Índice de arquivos por prefixo de ID usado nas movimentações via CSV."""
+
+import os
+from pathlib import Path
+
+
+class IndicePrefixos:
+    """Associa cada item do diretório base ao ID do CSV que é seu dono.
+
+    O diretório é lido uma única vez com ``os.scandir``. Pastas pertencem ao ID
+    de mesmo nome; arquivos pertencem ao ID que é prefixo do seu nome. Quando
+    mais de um ID é prefixo do mesmo arquivo (ex.: ``12`` e ``1234`` para
+    ``1234_a.png``), o arquivo pertence sempre ao ID mais longo, independente
+    da ordem das linhas do CSV. Os itens sem dono ficam em ``pastas_sem_id`` e
+    ``arquivos_sem_dono`` (nomes), para a conciliação com o CSV.
+    """
+
+    def __init__(self, diretorio, ids):
+        self.diretorio = Path(diretorio)
+        self.ids = {str(id_pasta).strip() for id_pasta in ids}
+        self.ids.discard("")
+        # Tamanhos distintos de ID, do maior para o menor, para a busca do dono
+        self._tamanhos = sorted({len(id_pasta) for id_pasta in self.ids}, reverse=True)
+        self._pastas = set()
+        self._arquivos = {}
+        self.pastas_sem_id = []
+        self.arquivos_sem_dono = []
+        self._indexar()
+
+    def _indexar(self):
+        with os.scandir(self.diretorio) as entradas:
+            for entrada in entradas:
+                if entrada.is_dir():
+                    if entrada.name in self.ids:
+                        self._pastas.add(entrada.name)
+                    else:
+                        self.pastas_sem_id.append(entrada.name)
+                elif entrada.is_file():
+                    dono = self.dono(entrada.name)
+                    if dono is not None:
+                        self._arquivos.setdefault(dono, []).append(entrada.name)
+                    else:
+                        self.arquivos_sem_dono.append(entrada.name)
+
+        for nomes in self._arquivos.values():
+            nomes.sort()
+
+    def dono(self, nome):
+        """Retorna o ID mais longo que é prefixo de ``nome`` (ou None)."""
+        for tamanho in self._tamanhos:
+            if tamanho > len(nome):
+                continue
+            prefixo = nome[:tamanho]
+            if prefixo in self.ids:
+                return prefixo
+        return None
+
+    def ids_com_pasta(self):
+        """IDs cuja pasta existe (e ainda não foi retirada)."""
+        return set(self._pastas)
+
+    def ids_com_arquivos(self):
+        """IDs que têm arquivos (ainda não retirados)."""
+        return set(self._arquivos)
+
+    def retirar_pasta(self, id_pasta):
+        """Retorna o caminho da pasta do ID e a remove do índice (ou None)."""
+        if id_pasta not in self._pastas:
+            return None
+        self._pastas.discard(id_pasta)
+        return self.diretorio / id_pasta
+
+    def retirar_arquivos(self, id_pasta):
+        """Retorna os arquivos do ID e os remove do índice."""
+        return [self.diretorio / nome for nome in self._arquivos.pop(id_pasta, [])]
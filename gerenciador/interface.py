@@ -0,0 +1,663 @@
+"""Interface gráfica (Tkinter) do Gerenciador de Pastas e Imagens.
+
+Só este módulo depende do Tk; as operações vêm de ``gerenciador.operacoes``.
+"""
+
+import logging
+import threading
+import time
+import tkinter as tk
+from contextlib import contextmanager
+from pathlib import Path
+from tkinter import filedialog, messagebox, ttk
+
+from .cache_ocr import CacheOCR, versao_cache
+from .diario import Diario, caminho_diario, execucao_incompleta, ler_diario
+from .inventario import inventariar_pastas
+from .metricas import Metricas, formatar_bytes
+from .ocr import (IDIOMAS_PADRAO, LeitorSobDemanda, MotorOCR, PreProcessamento, RegiaoInteresse, gpu_disponivel,
+                  renomear_imagens)
+from .operacoes import (ErroCSV, conciliar_csv, copiar_conteudo_por_fpk, copiar_pasta_completa_por_fpk, listar_pastas,
+                        mover_por_csv)
+from .processos_ocr import MotorOCRProcessos
+from .tarefas import Cancelado, Tarefa
+from .vigia import vigiar_pasta
+
+# ===== Configuração do OCR =====
+OCR_IDIOMAS = list(IDIOMAS_PADRAO)  # ['en'] basta quando o ID é lido só no recorte
+OCR_PRECARREGAR = False  # Carregar o modelo ao abrir o programa em vez de no primeiro uso
+OCR_USAR_CACHE = True  # Reaproveitar resultados de imagens já reconhecidas (cache em disco)
+OCR_TAMANHO_LOTE = 8  # Imagens por lote de inferência
+OCR_TRABALHADORES = 4  # Threads de decodificação das imagens
+OCR_REGIAO = None  # Recorte fixo do ID em frações (x0, y0, x1, y1); None = aprender automaticamente
+OCR_APRENDER_REGIAO = True  # Aprender o recorte do ID pelas primeiras imagens reconhecidas
+OCR_ALTURA_MAXIMA = 1080  # Reduzir imagens mais altas que isso (pixels) antes do OCR; None = tamanho original
+OCR_CINZA = True  # Passar a imagem em tons de cinza ao OCR
+OCR_CONTRASTE = False  # Realçar o contraste (CLAHE) antes do OCR
+OCR_BINARIZAR = False  # Binarizar a imagem (limiar de Otsu) antes do OCR
+OCR_PROCESSOS_CPU = 0  # Sem GPU: processos de OCR, cada um com seu leitor (ex.: os.cpu_count()); 0 = um leitor só
+
+# ===== Configuração das operações em lote (CSV e FPK) =====
+CONFIRMAR_PLANO = True  # Mostrar o plano (itens e bytes) e pedir confirmação antes de alterar o disco
+USAR_DIARIO = True  # Registrar as ações concluídas para retomar execuções interrompidas (ou desfazer pela linha de comando)
+FPK_MODO_TRANSFERENCIA = "auto"  # copia, reflink, hardlink (arquivos compartilhados), mover ou auto (reflink no mesmo volume)
+
+# ===== Interface =====
+INTERVALO_PROGRESSO_MS = 100  # Frequência com que as janelas de progresso consultam as tarefas
+TEMPO_ENCERRAR_TAREFAS = 5  # Segundos de espera pelas tarefas canceladas ao sair
+EXPORTAR_METRICAS = True  # Gravar as métricas de cada operação (JSON) no diretório de cache ao terminar
+
+leitor_ocr = LeitorSobDemanda(OCR_IDIOMAS)
+
+# ===== Tempos de inicialização (segundos desde o início do processo) =====
+tempos_inicializacao = {"janela": None, "ocr_pronto": None}
+_inicio_processo = time.perf_counter()
+# Marcado pela thread que carrega o OCR; o rodapé é atualizado pela consulta na thread do Tk
+_status_ocr_mudou = threading.Event()
+
+# ===== Widgets criados em iniciar() =====
+janela = None
+status_label = None
+
+# ===== Operações rodando em segundo plano =====
+tarefas_ativas = set()
+
+# ================== TELA DE CARREGAMENTO COM PROGRESSO ==================
+def criar_tela_progresso(janela_pai, texto="Processando...", subtitulo="", ao_cancelar=None):
+    """Cria janela de progresso (não modal: outras operações podem ser iniciadas ao mesmo tempo)."""
+    splash = tk.Toplevel(janela_pai)
+    splash.title("Aguarde")
+    splash.geometry("400x260" if ao_cancelar else "400x220")
+    splash.resizable(False, False)
+
+    # Centralizar janela
+    splash.transient(janela_pai)
+
+    tk.Label(splash, text=texto, font=("Arial", 12, "bold")).pack(pady=10)
+    if subtitulo:
+        tk.Label(splash, text=subtitulo, font=("Arial", 10), fg="gray").pack(pady=2)
+
+    barra = ttk.Progressbar(splash, orient="horizontal", mode="determinate", length=350)
+    barra.pack(pady=10)
+    percentual_label = tk.Label(splash, text="0%", font=("Arial", 10, "bold"), wraplength=380)
+    percentual_label.pack()
+
+    if ao_cancelar:
+        tk.Button(splash, text="Cancelar", command=ao_cancelar, width=12).pack(pady=8)
+        splash.protocol("WM_DELETE_WINDOW", ao_cancelar)
+    return splash, barra, percentual_label
+
+def atualizar_progresso(splash, barra, percentual_label, atual, total, status="", detalhes=""):
+    """Atualiza progresso com status e detalhes (velocidade, previsão) opcionais; sem ``total`` mostra só a contagem.
+
+    Não força o redesenho: quem chama está no loop do Tk, que desenha a janela.
+    """
+    if total:
+        progresso = int((atual / total) * 100)
+        barra.config(mode="determinate")
+        barra["value"] = progresso
+        linhas = [f"{progresso}% ({atual}/{total})"]
+    else:
+        barra.config(mode="indeterminate")
+        barra.step(5)
+        linhas = [f"{atual} processados"]
+    if status:
+        linhas.append(str(status))
+    if detalhes:
+        linhas.append(detalhes)
+    percentual_label.config(text="\n".join(linhas))
+
+def executar_em_segundo_plano(funcao, texto, subtitulo="", ao_concluir=None, titulo_erro="Falha na operação",
+                              operacao=""):
+    """Roda ``funcao(tarefa)`` numa ``Tarefa`` com janela de progresso própria.
+
+    A janela consulta a tarefa a cada ``INTERVALO_PROGRESSO_MS`` e desenha só
+    o progresso mais recente, com a velocidade e a previsão de término de
+    ``tarefa.metricas``; perguntas feitas com ``tarefa.na_interface`` são
+    atendidas nessa mesma consulta. Ao terminar, as métricas são exportadas e
+    ``ao_concluir(resultado)`` roda na thread do Tk (erros e cancelamento são
+    mostrados aqui).
+    """
+    tarefa = Tarefa(funcao, nome=texto, metricas=Metricas(operacao))
+    ultimo = None
+
+    def cancelar():
+        tarefa.cancelar()
+        percentual_label.config(text="Cancelando...")
+
+    splash, barra, percentual_label = criar_tela_progresso(janela, texto, subtitulo, ao_cancelar=cancelar)
+    tarefas_ativas.add(tarefa)
+
+    def acompanhar():
+        nonlocal ultimo
+        tarefa.atender_pedidos()
+        ultimo = tarefa.progresso_recente() or ultimo
+        if ultimo is not None and not tarefa.terminada:
+            atual, total, status = ultimo
+            # Uma amostra por consulta (mesmo sem evento novo) mantém a vazão de bytes atualizada
+            tarefa.metricas.progresso(atual, total)
+            atualizar_progresso(splash, barra, percentual_label, atual, total, status,
+                                tarefa.metricas.texto_progresso())
+        if not tarefa.terminada:
+            janela.after(INTERVALO_PROGRESSO_MS, acompanhar)
+            return
+
+        tarefas_ativas.discard(tarefa)
+        splash.destroy()
+        _exportar_metricas(tarefa.metricas)
+        if tarefa.cancelada:
+            logging.info(f"⛔ Operação cancelada: {texto}")
+            messagebox.showinfo("Cancelado", "Operação cancelada.\nO que já foi feito está no diário da execução.")
+        elif isinstance(tarefa.erro, ErroCSV):
+            messagebox.showerror("Erro", str(tarefa.erro))
+        elif tarefa.erro is not None:
+            logging.error(f"❌ {titulo_erro}: {tarefa.erro}")
+            messagebox.showerror("Erro", f"{titulo_erro}:\n{tarefa.erro}")
+        elif ao_concluir:
+            ao_concluir(tarefa.resultado)
+
+    tarefa.iniciar()
+    janela.after(INTERVALO_PROGRESSO_MS, acompanhar)
+    return tarefa
+
+def _exportar_metricas(metricas):
+    if not EXPORTAR_METRICAS:
+        return
+    try:
+        metricas.exportar()
+        metricas.registrar_no_log()
+    except OSError as e:
+        logging.warning(f"⚠️ Não foi possível gravar as métricas: {e}")
+
+def _abrir_diario(operacao, alvo):
+    """Abre o diário da operação; se a execução anterior não terminou, pergunta se deve ser retomada."""
+    if not USAR_DIARIO:
+        return None
+    caminho = caminho_diario(operacao, alvo)
+    retomar = execucao_incompleta(ler_diario(caminho)) and messagebox.askyesno(
+        "Retomar", "A execução anterior desta operação não terminou.\nRetomar de onde parou?")
+    return Diario(caminho, operacao=operacao, retomar=retomar)
+
+def _fechar_diario(diario):
+    if diario is not None:
+        diario.fechar()
+
+def _confirmar_plano(plano):
+    """Mostra o relatório do plano e pergunta se ele deve ser executado."""
+    if not CONFIRMAR_PLANO:
+        return True
+    return messagebox.askyesno("Confirmar operação", "\n".join(plano.relatorio()) + "\n\nExecutar agora?")
+
+def _confirmar_na_interface(tarefa):
+    """``confirmar`` das operações: a pergunta é feita na thread do Tk, a tarefa espera a resposta."""
+    def confirmar(plano):
+        tarefa.verificar_cancelamento()  # Cancelada durante o planejamento: nem pergunta
+        return tarefa.na_interface(_confirmar_plano, plano)
+    return confirmar
+
+# ================== FUNÇÃO MOVER PASTAS E ARQUIVOS ==================
+def _executar_movimentacao_csv(somente_existentes, texto, ao_concluir):
+    arquivo_csv = filedialog.askopenfilename(
+        title="Selecione o arquivo CSV",
+        filetypes=[("Arquivos CSV", "*.csv")],
+    )
+
+    if not arquivo_csv:
+        messagebox.showinfo("Cancelado", "Nenhum arquivo selecionado.")
+        return
+
+    diario = _abrir_diario("csv-move", arquivo_csv)
+
+    def executar(tarefa):
+        try:
+            return mover_por_csv(arquivo_csv, somente_existentes=somente_existentes, ao_progredir=tarefa.ao_progredir,
+                                 confirmar=_confirmar_na_interface(tarefa), diario=diario, metricas=tarefa.metricas)
+        finally:
+            _fechar_diario(diario)
+
+    def concluir(resumo):
+        if resumo.simulado:
+            messagebox.showinfo("Cancelado", "Nenhuma alteração foi feita.")
+            return
+        ao_concluir(resumo)
+
+    executar_em_segundo_plano(executar, texto, ao_concluir=concluir, titulo_erro="Falha ao mover pelo CSV",
+                              operacao="csv-move")
+
+def mover_pastas_por_csv():
+    def concluir(resumo):
+        messagebox.showinfo("Concluído", f"Processo finalizado!\nTempo total: {resumo.tempo}s")
+
+    _executar_movimentacao_csv(False, "Movendo pastas e arquivos...", concluir)
+
+# ================== FUNÇÃO MOVER PASTAS APENAS SE EXISTIREM ==================
+def mover_pastas_por_csv_se_existir():
+    def concluir(resumo):
+        messagebox.showinfo("Concluído",
+                           f"Processo finalizado!\n"
+                           f"Pastas movidas: {resumo.pastas_movidas}\n"
+                           f"Pastas não encontradas: {resumo.pastas_nao_encontradas}\n"
+                           f"Tempo total: {resumo.tempo}s")
+
+    _executar_movimentacao_csv(True, "Movendo pastas existentes...", concluir)
+
+# ================== FUNÇÃO CONFERIR CSV COM AS PASTAS ==================
+def conferir_csv_com_pastas():
+    """Confere os Ids do CSV com as pastas e arquivos do diretório, sem mover nada."""
+    arquivo_csv = filedialog.askopenfilename(
+        title="Selecione o arquivo CSV",
+        filetypes=[("Arquivos CSV", "*.csv")],
+    )
+
+    if not arquivo_csv:
+        messagebox.showinfo("Cancelado", "Nenhum arquivo selecionado.")
+        return
+
+    def executar(tarefa):
+        conciliacao = conciliar_csv(arquivo_csv, metricas=tarefa.metricas)
+        if not conciliacao.conciliado:
+            csv_path = Path(arquivo_csv)
+            conciliacao.exportar(csv_path.with_name(f"conciliacao_{csv_path.stem}.csv"))
+        return conciliacao
+
+    def concluir(conciliacao):
+        texto = "\n".join(conciliacao.relatorio()[1:])
+        if conciliacao.arquivo is not None:
+            texto += f"\n\nLista completa: {conciliacao.arquivo.name}"
+        messagebox.showinfo("Conferência do CSV", texto)
+
+    executar_em_segundo_plano(executar, "Conferindo o CSV com as pastas...", ao_concluir=concluir,
+                              titulo_erro="Falha ao conferir o CSV", operacao="csv-check")
+
+# ================== FUNÇÃO RENOMEAR IMAGENS ==================
+@contextmanager
+def _motor_ocr(tarefa, regiao):
+    """Motor de OCR configurado pelas constantes ``OCR_*``; fecha o cache e os processos no fim.
+
+    Com ``OCR_PROCESSOS_CPU`` e sem GPU, o OCR roda em vários processos, cada
+    um com seu leitor; senão usa o leitor compartilhado ``leitor_ocr``.
+    """
+    preprocessamento = PreProcessamento(OCR_ALTURA_MAXIMA, cinza=OCR_CINZA, contraste=OCR_CONTRASTE,
+                                        binarizar=OCR_BINARIZAR)
+    cache = CacheOCR(versao=versao_cache(OCR_IDIOMAS, extra=preprocessamento.assinatura)) if OCR_USAR_CACHE else None
+    try:
+        if OCR_PROCESSOS_CPU and not gpu_disponivel():
+            with MotorOCRProcessos(OCR_IDIOMAS, processos=OCR_PROCESSOS_CPU, tamanho_lote=OCR_TAMANHO_LOTE,
+                                   regiao=regiao, cache=cache, preprocessamento=preprocessamento) as motor:
+                yield motor
+            return
+        # ✅ O modelo só é carregado aqui, no primeiro uso do OCR
+        reader = leitor_ocr.obter()
+        _ocr_carregado(leitor_ocr)
+        tarefa.verificar_cancelamento()
+        yield MotorOCR(reader, tamanho_lote=OCR_TAMANHO_LOTE, trabalhadores=OCR_TRABALHADORES,
+                       regiao=regiao, cache=cache, preprocessamento=preprocessamento)
+    finally:
+        if cache is not None:
+            cache.fechar()
+
+def renomear_imagens_por_id():
+    pasta = filedialog.askdirectory(title="Selecione a pasta com imagens")
+    if not pasta:
+        messagebox.showinfo("Cancelado", "Nenhuma pasta selecionada.")
+        return
+
+    if leitor_ocr.pronto:
+        subtitulo = f"Usando {'GPU (CUDA)' if leitor_ocr.usando_gpu else 'CPU'}"
+    else:
+        subtitulo = "Carregando o modelo de OCR..."
+
+    diario = _abrir_diario("ocr-rename", pasta)
+    regiao = RegiaoInteresse(OCR_REGIAO, aprender=OCR_APRENDER_REGIAO)
+
+    def executar(tarefa):
+        def ao_progredir(atual, total, resultado):
+            tarefa.ao_progredir(atual, total, resultado.arquivo.name)
+
+        try:
+            with _motor_ocr(tarefa, regiao) as motor:
+                return renomear_imagens(pasta, motor, ao_progredir, diario=diario, metricas=tarefa.metricas)
+        finally:
+            _fechar_diario(diario)
+
+    def concluir(resumo):
+        status_gpu = f"Usando {'GPU (CUDA)' if leitor_ocr.usando_gpu else 'CPU'}"
+        messagebox.showinfo("Concluído", f"Renomeação finalizada!\n{status_gpu}\nTempo total: {resumo.tempo}s")
+
+    executar_em_segundo_plano(executar, "Renomeando imagens...", subtitulo, ao_concluir=concluir,
+                              titulo_erro="Falha ao renomear imagens", operacao="ocr-rename")
+
+# ================== FUNÇÃO VIGIAR PASTA ==================
+def vigiar_pasta_e_renomear():
+    """Renomeia cada imagem nova que chega à pasta até o usuário clicar em Cancelar."""
+    pasta = filedialog.askdirectory(title="Selecione a pasta a vigiar")
+    if not pasta:
+        messagebox.showinfo("Cancelado", "Nenhuma pasta selecionada.")
+        return
+
+    incluir_existentes = messagebox.askyesno(
+        "Imagens existentes", "Renomear também as imagens que já estão na pasta?")
+    diario = Diario(caminho_diario("ocr-watch", pasta), operacao="ocr-watch") if USAR_DIARIO else None
+    regiao = RegiaoInteresse(OCR_REGIAO, aprender=OCR_APRENDER_REGIAO)
+
+    def executar(tarefa):
+        parar = threading.Event()
+
+        def ao_progredir(atual, total, status):
+            # ✅ Cancelar encerra a vigia depois do lote atual, mantendo o resumo da sessão
+            try:
+                tarefa.ao_progredir(atual, total, status)
+            except Cancelado:
+                parar.set()
+
+        try:
+            with _motor_ocr(tarefa, regiao) as motor:
+                return vigiar_pasta(pasta, motor, ao_progredir, diario=diario, metricas=tarefa.metricas, parar=parar,
+                                    incluir_existentes=incluir_existentes)
+        finally:
+            _fechar_diario(diario)
+
+    def concluir(resumo):
+        messagebox.showinfo("Concluído",
+                           f"Vigia encerrada!\n"
+                           f"Imagens renomeadas: {resumo.renomeados}\n"
+                           f"Sem ID: {resumo.sem_id}\n"
+                           f"Erros: {resumo.erros}\n"
+                           f"Tempo total: {resumo.tempo}s")
+
+    executar_em_segundo_plano(executar, "Vigiando a pasta...", "Clique em Cancelar para parar",
+                              ao_concluir=concluir, titulo_erro="Falha ao vigiar a pasta", operacao="ocr-watch")
+
+
+# ================== FUNÇÃO LISTAR PASTAS EM ARQUIVO TXT ==================
+def listar_pastas_em_txt():
+    """Lista todas as pastas existentes em um arquivo .txt."""
+    pasta = filedialog.askdirectory(title="Selecione a pasta para listar as subpastas")
+    if not pasta:
+        messagebox.showinfo("Cancelado", "Nenhuma pasta selecionada.")
+        return
+
+    if messagebox.askyesno("Inventário",
+                           "Gerar o inventário recursivo (CSV com a quantidade de itens e o tamanho de cada "
+                           "subpasta, em todos os níveis)?\n\nNão: lista só os nomes das subpastas diretas."):
+        _inventariar_pastas(pasta)
+        return
+
+    try:
+        resumo = listar_pastas(pasta)
+    except Exception as e:
+        messagebox.showerror("Erro", f"Falha ao gerar lista de pastas:\n{e}")
+        logging.error(f"Erro ao gerar lista: {e}")
+        return
+
+    if not resumo.total_pastas:
+        messagebox.showinfo("Informação", "Nenhuma subpasta encontrada.")
+        return
+
+    messagebox.showinfo("Concluído",
+                       f"Lista de pastas gerada com sucesso!\n"
+                       f"Arquivo: {resumo.arquivo.name}\n"
+                       f"Total de pastas: {resumo.total_pastas}")
+
+def _inventariar_pastas(pasta):
+    def executar(tarefa):
+        return inventariar_pastas(pasta, ao_progredir=tarefa.ao_progredir, metricas=tarefa.metricas)
+
+    def concluir(resumo):
+        messagebox.showinfo("Concluído",
+                           f"Inventário gerado com sucesso!\n"
+                           f"Arquivo: {resumo.arquivo.name}\n"
+                           f"Pastas: {resumo.total_pastas}\n"
+                           f"Arquivos: {resumo.total_arquivos} ({formatar_bytes(resumo.total_bytes)})\n"
+                           f"Erros: {resumo.erros}\n"
+                           f"Tempo total: {resumo.tempo}s")
+
+    executar_em_segundo_plano(executar, "Inventariando pastas...", ao_concluir=concluir,
+                              titulo_erro="Falha ao gerar o inventário", operacao="list-folders")
+
+# ================== FUNÇÕES POR FPK ==================
+def _selecionar_diretorios_fpk():
+    """Pede os diretórios da PARTE 1 e da PARTE 2; retorna None se cancelado."""
+    # Selecionar diretório da parte 1 (faces)
+    diretorio_faces = filedialog.askdirectory(title="Selecione o diretório da PARTE 1 (onde estão as faces)")
+    if not diretorio_faces:
+        logging.info("❌ Nenhum diretório de faces selecionado - operação cancelada")
+        messagebox.showinfo("Cancelado", "Nenhum diretório de faces selecionado.")
+        return None
+
+    logging.info(f"📁 Diretório PARTE 1 selecionado: {diretorio_faces}")
+
+    # Selecionar diretório da parte 2 (arquivos)
+    diretorio_arquivos = filedialog.askdirectory(title="Selecione o diretório da PARTE 2 (onde estão os arquivos)")
+    if not diretorio_arquivos:
+        logging.info("❌ Nenhum diretório de arquivos selecionado - operação cancelada")
+        messagebox.showinfo("Cancelado", "Nenhum diretório de arquivos selecionado.")
+        return None
+
+    logging.info(f"📁 Diretório PARTE 2 selecionado: {diretorio_arquivos}")
+    return diretorio_faces, diretorio_arquivos
+
+def _executar_fpk(operacao, operacao_diario, subtitulo, ao_concluir):
+    diretorios = _selecionar_diretorios_fpk()
+    if diretorios is None:
+        return
+    diario = _abrir_diario(operacao_diario, diretorios[0])
+
+    def executar(tarefa):
+        try:
+            return operacao(*diretorios, ao_progredir=tarefa.ao_progredir, modo=FPK_MODO_TRANSFERENCIA,
+                            confirmar=_confirmar_na_interface(tarefa), diario=diario, metricas=tarefa.metricas)
+        finally:
+            _fechar_diario(diario)
+
+    def concluir(resumo):
+        if not resumo.pastas_com_face:
+            messagebox.showinfo("Informação", "Nenhuma pasta com face.fpk encontrada na parte 1.")
+            return
+        if resumo.simulado:
+            messagebox.showinfo("Cancelado", "Nenhuma alteração foi feita.")
+            return
+        ao_concluir(resumo)
+
+    executar_em_segundo_plano(executar, "Processando faces...", subtitulo, ao_concluir=concluir,
+                              titulo_erro="Falha ao processar as faces", operacao=operacao_diario)
+
+def mover_faces_por_fpk():
+    """Busca face.fpk em todas as pastas da parte 1, extrai nome do jogador e move arquivos da parte 2."""
+    def concluir(resumo):
+        messagebox.showinfo("Concluído",
+                           f"Processo de faces finalizado!\n"
+                           f"Faces processadas: {resumo.faces_processadas}\n"
+                           f"Total de arquivos movidos: {resumo.arquivos_copiados}\n"
+                           f"Erros encontrados: {resumo.erros}\n"
+                           f"Tempo total: {resumo.tempo}s")
+
+    _executar_fpk(copiar_conteudo_por_fpk, "fpk-copy", "Buscando e movendo arquivos", concluir)
+
+# ================== FUNÇÃO MOVER PASTA COMPLETA POR FPK ==================
+def mover_pasta_completa_por_fpk():
+    """Busca face.fpk em todas as pastas da parte 1, extrai nome do jogador e move a pasta completa da parte 2."""
+    def concluir(resumo):
+        messagebox.showinfo("Concluído",
+                           f"Processo de faces finalizado!\n"
+                           f"Faces processadas: {resumo.faces_processadas}\n"
+                           f"Pastas completas movidas: {resumo.pastas_copiadas}\n"
+                           f"Pastas ignoradas: {resumo.itens_ignorados}\n"
+                           f"Erros encontrados: {resumo.erros}\n"
+                           f"Tempo total: {resumo.tempo}s")
+
+    _executar_fpk(copiar_pasta_completa_por_fpk, "fpk-copy-folder", "Buscando e movendo pastas completas", concluir)
+
+# ================== TESTE CUDA AO INICIAR ==================
+def teste_cuda_inicial():
+    try:
+        import torch
+        if torch.cuda.is_available():
+            messagebox.showinfo("CUDA Detectado",
+                                f"Placa de vídeo: {torch.cuda.get_device_name(0)}\nCUDA ativo e pronto!")
+        else:
+            messagebox.showwarning("Sem CUDA",
+                                   "Nenhuma GPU CUDA detectada.\nO processamento será feito na CPU.")
+    except Exception as e:
+        messagebox.showwarning("Aviso", f"Não foi possível verificar CUDA:\n{e}")
+
+# ================== INICIALIZAR OCR ==================
+def _ocr_carregado(leitor):
+    """Registra o tempo até o OCR ficar pronto e pede a atualização do rodapé.
+
+    Chamado da thread que carregou o modelo: não toca no Tk, só marca
+    ``_status_ocr_mudou`` para ``_acompanhar_status_ocr``.
+    """
+    if leitor.pronto and tempos_inicializacao["ocr_pronto"] is None:
+        tempos_inicializacao["ocr_pronto"] = round(time.perf_counter() - _inicio_processo, 2)
+        logging.info(f"⏱️ OCR pronto {tempos_inicializacao['ocr_pronto']}s após o início "
+                     f"(carga do modelo: {leitor.tempo_carregamento}s)")
+    _status_ocr_mudou.set()
+
+def _acompanhar_status_ocr():
+    """Consulta, na thread do Tk, se o carregamento do OCR mudou de estado."""
+    if _status_ocr_mudou.is_set():
+        _status_ocr_mudou.clear()
+        _atualizar_status_ocr()
+    janela.after(INTERVALO_PROGRESSO_MS, _acompanhar_status_ocr)
+
+def _atualizar_status_ocr():
+    dispositivo = f"Usando {'GPU' if leitor_ocr.usando_gpu else 'CPU'}"
+    if leitor_ocr.pronto:
+        status_label.config(text=f"OCR pronto! ({dispositivo}, carregado em {leitor_ocr.tempo_carregamento}s)")
+    elif leitor_ocr.erro is not None:
+        status_label.config(text="Falha ao inicializar OCR")
+    elif leitor_ocr.carregando:
+        status_label.config(text="OCR inicializando...")
+    else:
+        status_label.config(text="OCR será carregado no primeiro uso")
+
+def inicializar_ocr_em_segundo_plano():
+    """Pré-carrega o modelo de OCR sem bloquear a janela."""
+    leitor_ocr.precarregar(ao_concluir=_ocr_carregado)
+    _atualizar_status_ocr()
+
+# ================== MENU PRINCIPAL ==================
+def sair():
+    if tarefas_ativas:
+        if not messagebox.askyesno("Sair", f"Há {len(tarefas_ativas)} operação(ões) em andamento.\n"
+                                           "Cancelar e sair?"):
+            return
+        # O cancelamento vale a partir do próximo item; o diário registra o que já foi feito
+        for tarefa in list(tarefas_ativas):
+            tarefa.cancelar()
+        for tarefa in list(tarefas_ativas):
+            tarefa.aguardar(TEMPO_ENCERRAR_TAREFAS)
+    janela.quit()
+
+def iniciar(inicio_processo=None):
+    """Monta a janela principal e entra no loop do Tk.
+
+    ``inicio_processo`` (``time.perf_counter()`` do início do programa) é a
+    referência dos tempos em ``tempos_inicializacao``.
+    """
+    global janela, status_label, _inicio_processo
+
+    if inicio_processo is not None:
+        _inicio_processo = inicio_processo
+
+    janela = tk.Tk()
+    janela.title("Gerenciador de Pastas e Imagens v2.0")
+    janela.geometry("800x800")
+
+    # Centralizar janela
+    janela.update_idletasks()
+    x = (janela.winfo_screenwidth() // 2) - (800 // 2)
+    y = (janela.winfo_screenheight() // 2) - (800 // 2)
+    janela.geometry(f"800x800+{x}+{y}")
+
+    # Frame principal centralizado
+    main_frame = tk.Frame(janela)
+    main_frame.pack(fill=tk.BOTH, expand=True)
+
+    # Frame central para centralizar o conteúdo
+    center_frame = tk.Frame(main_frame)
+    center_frame.pack(expand=True, fill=tk.BOTH)
+
+    # Canvas para scroll centralizado
+    canvas = tk.Canvas(center_frame, width=600)  # Largura fixa para centralizar
+    scrollbar = tk.Scrollbar(center_frame, orient="vertical", command=canvas.yview)
+    scrollable_frame = tk.Frame(canvas)
+
+    scrollable_frame.bind(
+        "<Configure>",
+        lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+    )
+
+    # Centralizar o conteúdo no canvas
+    canvas.create_window((300, 0), window=scrollable_frame, anchor="n")  # 300 = 600/2 para centralizar
+    canvas.configure(yscrollcommand=scrollbar.set)
+
+    # Título principal centralizado
+    label = tk.Label(scrollable_frame, text="Gerenciador de Pastas e Imagens v2.0", font=("Arial", 16, "bold"), fg="darkblue")
+    label.pack(pady=20)
+
+    subtitle = tk.Label(scrollable_frame, text="Escolha uma opção:", font=("Arial", 12), fg="gray")
+    subtitle.pack(pady=10)
+
+    btn4 = tk.Button(scrollable_frame, text="1. Listar todas as pastas em um arquivo .txt", command=listar_pastas_em_txt, width=35, height=2, font=("Arial", 10), bg="plum")
+    btn4.pack(pady=8)
+
+    btn1 = tk.Button(scrollable_frame, text="2. Renomear imagens pelo ID do jogador", command=renomear_imagens_por_id, width=35, height=2, font=("Arial", 10), bg="lightgreen")
+    btn1.pack(pady=8)
+
+    btn_faces = tk.Button(scrollable_frame, text="3. Mover todo conteúdo do jogador por FPK", command=mover_faces_por_fpk, width=35, height=2, font=("Arial", 10), bg="orange")
+    btn_faces.pack(pady=8)
+
+    btn_faces_completa = tk.Button(scrollable_frame, text="4. Mover pasta completa do jogador por FPK", command=mover_pasta_completa_por_fpk, width=35, height=2, font=("Arial", 10), bg="darkorange")
+    btn_faces_completa.pack(pady=8)
+
+    btn0_1 = tk.Button(scrollable_frame, text="5. Mover apenas pastas existentes (CSV)", command=mover_pastas_por_csv_se_existir, width=35, height=2, font=("Arial", 10), bg="lightcyan")
+    btn0_1.pack(pady=8)
+
+    btn0 = tk.Button(scrollable_frame, text="6. Mover pastas e criar nova com base no CSV", command=mover_pastas_por_csv, width=35, height=2, font=("Arial", 10), bg="lightblue")
+    btn0.pack(pady=8)
+
+    btn_vigia = tk.Button(scrollable_frame, text="7. Vigiar pasta e renomear imagens novas", command=vigiar_pasta_e_renomear, width=35, height=2, font=("Arial", 10), bg="palegreen")
+    btn_vigia.pack(pady=8)
+
+    btn_conferir = tk.Button(scrollable_frame, text="8. Conferir CSV com as pastas (sem mover)", command=conferir_csv_com_pastas, width=35, height=2, font=("Arial", 10), bg="lightsteelblue")
+    btn_conferir.pack(pady=8)
+
+    btn5 = tk.Button(scrollable_frame, text="❌ Sair", command=sair, width=35, height=2, font=("Arial", 10), bg="lightcoral")
+    btn5.pack(pady=8)
+
+    # btn2 = tk.Button(scrollable_frame, text="⚡ Testar CUDA/GPU", command=teste_cuda_inicial, width=35, height=2, font=("Arial", 10), bg="lightyellow")
+    # btn2.pack(pady=8)
+
+    # ✅ Status do OCR no rodapé
+    status_label = tk.Label(scrollable_frame, text="", font=("Arial", 10), fg="blue")
+    status_label.pack(pady=10)
+
+    # Informações do sistema
+    info_label = tk.Label(scrollable_frame, text="Versão 2.3", font=("Arial", 8), fg="gray")
+    info_label.pack(pady=5)
+
+    # Empacotar canvas e scrollbar centralizados
+    canvas.pack(side="left", fill="both", expand=True, padx=(100, 0))  # Margem esquerda para centralizar
+    scrollbar.pack(side="right", fill="y", padx=(0, 100))  # Margem direita para centralizar
+
+    # Configurar scroll com mouse
+    def _on_mousewheel(event):
+        canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+
+    canvas.bind_all("<MouseWheel>", _on_mousewheel)
+
+    # ✅ Tempo até a janela aparecer
+    janela.update_idletasks()
+    tempos_inicializacao["janela"] = round(time.perf_counter() - _inicio_processo, 2)
+    logging.info(f"⏱️ Janela pronta em {tempos_inicializacao['janela']}s")
+
+    # OCR carregado em segundo plano ao abrir o programa ou só no primeiro uso
+    if OCR_PRECARREGAR:
+        inicializar_ocr_em_segundo_plano()
+    else:
+        _atualizar_status_ocr()
+    janela.after(INTERVALO_PROGRESSO_MS, _acompanhar_status_ocr)
+
+    janela.mainloop()
@@ -0,0 +1,238 @@
+"""Inventário recursivo de pastas: quantidade de itens e tamanho por pasta.
+
+A árvore é lida por um pool de threads com ``os.scandir`` (como a busca por
+face.fpk), com o ``stat`` de cada arquivo feito na própria thread que lista a
+pasta. Cada pasta guarda apenas seus contadores enquanto alguma subpasta ainda
+está sendo lida; quando a subárvore inteira termina, os totais sobem para a
+pasta de cima e a linha é escrita no arquivo de saída, então nem a árvore nem
+a lista de arquivos ficam na memória.
+"""
+
+import csv
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, astuple, dataclass, fields
+from datetime import datetime
+from pathlib import Path
+
+from .fpk import TRABALHADORES_BUSCA
+from .metricas import Metricas, formatar_bytes
+
+FORMATOS_INVENTARIO = ("txt", "csv", "jsonl")
+# Pastas concluídas entre duas chamadas de ``ao_progredir``
+INTERVALO_PROGRESSO_INVENTARIO = 200
+
+
+@dataclass
+class PastaInventario:
+    """Uma linha do inventário; ``caminho`` é relativo à pasta inventariada (com ``/``).
+
+    ``arquivos``, ``subpastas`` e ``bytes`` contam só o conteúdo direto; os
+    campos ``*_total`` incluem todas as subpastas. ``modificado`` é a data do
+    arquivo mais recente da subárvore (ISO 8601, vazio se não houver arquivos).
+    """
+    caminho: str
+    profundidade: int
+    arquivos: int = 0
+    subpastas: int = 0
+    bytes: int = 0
+    arquivos_total: int = 0
+    pastas_total: int = 0
+    bytes_total: int = 0
+    modificado: str = ""
+    erro: str = ""
+
+
+@dataclass
+class ResumoInventario:
+    """Totais do inventário de uma pasta."""
+    arquivo: Path = None
+    pastas_listadas: int = 0
+    total_pastas: int = 0
+    total_arquivos: int = 0
+    total_bytes: int = 0
+    erros: int = 0
+    tempo: float = 0.0
+
+
+class _No:
+    """Pasta já lida cuja subárvore ainda não terminou."""
+    __slots__ = ("registro", "pai", "pendentes", "mtime")
+
+    def __init__(self, registro, pai):
+        self.registro = registro
+        self.pai = pai
+        self.pendentes = 0
+        self.mtime = 0.0
+
+
+def _ler_pasta(caminho, ignorar):
+    """``(arquivos, bytes, mtime mais recente, subpastas, erro)`` do conteúdo direto da pasta.
+
+    Links simbólicos não são seguidos (contam como arquivos, pelo tamanho do
+    próprio link), evitando ciclos e contagem em dobro.
+    """
+    arquivos, total_bytes, mtime, subpastas = 0, 0, 0.0, []
+    try:
+        with os.scandir(caminho) as entradas:
+            for entrada in entradas:
+                if entrada.path == ignorar:
+                    continue
+                try:
+                    if entrada.is_dir(follow_symlinks=False):
+                        subpastas.append(entrada.path)
+                        continue
+                    info = entrada.stat(follow_symlinks=False)
+                except OSError:
+                    continue  # Removido durante a listagem
+                arquivos += 1
+                total_bytes += info.st_size
+                mtime = max(mtime, info.st_mtime)
+    except OSError as e:
+        return arquivos, total_bytes, mtime, subpastas, e
+    return arquivos, total_bytes, mtime, subpastas, None
+
+
+def percorrer_inventario(pasta, trabalhadores=TRABALHADORES_BUSCA, ignorar=None):
+    """Gera um ``PastaInventario`` por pasta (a própria ``pasta`` por último) quando sua subárvore termina.
+
+    As pastas saem em pós-ordem (toda subpasta antes da pasta que a contém),
+    mas a ordem entre pastas irmãs não é garantida. ``ignorar`` é um caminho
+    a não contar (ex.: o arquivo de saída sendo gravado dentro da pasta).
+    Erros ao listar subpastas ficam em ``erro`` da linha; erro ao listar a
+    própria ``pasta`` é levantado.
+    """
+    raiz = os.path.abspath(pasta)
+    ignorar = os.path.abspath(ignorar) if ignorar is not None else None
+    nos = {raiz: _No(PastaInventario(".", 0), None)}
+
+    def concluir(no):
+        """Entrega a pasta e sobe os totais enquanto as pastas de cima também terminam."""
+        while no is not None:
+            registro = no.registro
+            if no.mtime:
+                registro.modificado = datetime.fromtimestamp(no.mtime).isoformat(timespec="seconds")
+            yield registro
+            pai = no.pai
+            if pai is None:
+                return
+            pai.registro.arquivos_total += registro.arquivos_total
+            pai.registro.pastas_total += 1 + registro.pastas_total
+            pai.registro.bytes_total += registro.bytes_total
+            pai.mtime = max(pai.mtime, no.mtime)
+            pai.pendentes -= 1
+            if pai.pendentes:
+                return
+            no = pai
+
+    with ThreadPoolExecutor(max_workers=max(1, trabalhadores), thread_name_prefix="inventario") as executor:
+        pendentes = {executor.submit(_ler_pasta, raiz, ignorar): raiz}
+        try:
+            while pendentes:
+                prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    caminho = pendentes.pop(futuro)
+                    no = nos.pop(caminho)
+                    arquivos, total_bytes, mtime, subpastas, erro = futuro.result()
+                    if erro is not None:
+                        if no.pai is None:
+                            raise erro
+                        logging.warning(f"⚠️ Erro ao listar {caminho}: {erro}")
+                        no.registro.erro = str(erro)
+                    registro = no.registro
+                    registro.arquivos = registro.arquivos_total = arquivos
+                    registro.bytes = registro.bytes_total = total_bytes
+                    registro.subpastas = no.pendentes = len(subpastas)
+                    no.mtime = mtime
+                    for subpasta in subpastas:
+                        relativo = os.path.relpath(subpasta, raiz).replace(os.sep, "/")
+                        nos[subpasta] = _No(PastaInventario(relativo, registro.profundidade + 1), no)
+                        pendentes[executor.submit(_ler_pasta, subpasta, ignorar)] = subpasta
+                    if not subpastas:
+                        yield from concluir(no)
+        finally:
+            for futuro in pendentes:
+                futuro.cancel()
+
+
+class _EscritorInventario:
+    """Grava as linhas do inventário à medida que chegam, no formato escolhido."""
+
+    def __init__(self, arquivo, formato):
+        self._arquivo = open(arquivo, "w", encoding="utf-8", newline="")
+        self._formato = formato
+        if formato == "csv":
+            # Mesmo separador do CSV de IDs e nomes
+            self._csv = csv.writer(self._arquivo, delimiter=";")
+            self._csv.writerow([campo.name for campo in fields(PastaInventario)])
+
+    def escrever(self, registro):
+        if self._formato == "txt":
+            self._arquivo.write(f"{registro.caminho}\n")
+        elif self._formato == "csv":
+            self._csv.writerow(astuple(registro))
+        else:
+            self._arquivo.write(json.dumps(asdict(registro), ensure_ascii=False) + "\n")
+
+    def fechar(self):
+        self._arquivo.close()
+
+
+def formato_pelo_arquivo(arquivo):
+    """Formato pela extensão do arquivo de saída (``.txt`` se não for reconhecida)."""
+    extensao = Path(arquivo).suffix.lower().lstrip(".")
+    return extensao if extensao in FORMATOS_INVENTARIO else "txt"
+
+
+def inventariar_pastas(pasta, arquivo_saida=None, formato=None, profundidade=None, trabalhadores=TRABALHADORES_BUSCA,
+                       ao_progredir=None, metricas=None):
+    """Grava o inventário recursivo das subpastas de ``pasta`` em TXT, CSV ou JSONL.
+
+    TXT traz só os caminhos relativos; CSV (separado por ``;``) e JSONL trazem
+    também os campos de ``PastaInventario``. ``profundidade`` limita as pastas
+    gravadas (1: só as subpastas diretas), mas os totais de cada linha sempre
+    incluem a subárvore inteira. Sem ``arquivo_saida``, grava
+    ``inventario_pastas.<formato>`` dentro da pasta; sem ``formato``, usa a
+    extensão do arquivo (padrão: csv). ``ao_progredir(pastas, None, status)``
+    é chamado periodicamente durante a leitura.
+    """
+    if metricas is None:
+        metricas = Metricas()
+    pasta_path = Path(pasta)
+    if formato is None:
+        formato = formato_pelo_arquivo(arquivo_saida) if arquivo_saida else "csv"
+    if formato not in FORMATOS_INVENTARIO:
+        raise ValueError(f"Formato de inventário desconhecido: {formato}")
+
+    resumo = ResumoInventario()
+    resumo.arquivo = Path(arquivo_saida) if arquivo_saida else pasta_path / f"inventario_pastas.{formato}"
+    inicio = time.time()
+    escritor = _EscritorInventario(resumo.arquivo, formato)
+    try:
+        registros = percorrer_inventario(pasta_path, trabalhadores, ignorar=resumo.arquivo)
+        concluidas = 0
+        for registro in metricas.medir_iteracao("inventario", registros):
+            concluidas += 1
+            if registro.erro:
+                resumo.erros += 1
+            if registro.profundidade == 0:
+                resumo.total_pastas = registro.pastas_total
+                resumo.total_arquivos = registro.arquivos_total
+                resumo.total_bytes = registro.bytes_total
+            elif profundidade is None or registro.profundidade <= profundidade:
+                with metricas.etapa("escrita"):
+                    escritor.escrever(registro)
+                resumo.pastas_listadas += 1
+            if ao_progredir and concluidas % INTERVALO_PROGRESSO_INVENTARIO == 0:
+                ao_progredir(concluidas, None, f"Inventariando: {registro.caminho}")
+    finally:
+        escritor.fechar()
+
+    metricas.contar(itens=resumo.total_pastas)
+    resumo.tempo = round(time.time() - inicio, 2)
+    logging.info(f"✔️ Inventário gerado: {resumo.arquivo.name} com {resumo.pastas_listadas} pastas "
+                 f"({resumo.total_arquivos} arquivos, {formatar_bytes(resumo.total_bytes)})")
+    return resumo
@@ -0,0 +1,202 @@
+"""Métricas de uma execução: tempo por etapa, itens/s, bytes/s e previsão de término.
+
+As operações recebem um ``Metricas`` opcional (como o ``Diario``) e somam o
+tempo de cada etapa (``with metricas.etapa("leitura"):``), os itens concluídos
+e os bytes transferidos. Etapas medidas em várias threads ao mesmo tempo
+somam o tempo de todas elas. Quem mostra o progresso chama
+``progresso(atual, total)`` periodicamente e lê a velocidade e a previsão de
+término, calculadas numa janela móvel dos últimos segundos; no fim,
+``exportar()`` grava o detalhamento em JSON.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from .cache_ocr import diretorio_cache_padrao
+
+# Segundos de progresso usados na média móvel da velocidade e da previsão de término
+JANELA_MEDIA = 30
+
+
+def formatar_bytes(total):
+    """Tamanho legível (ex.: ``1.5 GB``)."""
+    tamanho = float(total)
+    for unidade in ("B", "KB", "MB", "GB"):
+        if tamanho < 1024:
+            return f"{tamanho:.0f} {unidade}" if unidade == "B" else f"{tamanho:.1f} {unidade}"
+        tamanho /= 1024
+    return f"{tamanho:.1f} TB"
+
+
+def formatar_duracao(segundos):
+    """Duração legível (``mm:ss`` ou ``h:mm:ss``)."""
+    minutos, segundos = divmod(int(round(segundos)), 60)
+    horas, minutos = divmod(minutos, 60)
+    return f"{horas}:{minutos:02d}:{segundos:02d}" if horas else f"{minutos:02d}:{segundos:02d}"
+
+
+class Metricas:
+    """Coletor das métricas de uma execução (pode ser usado de várias threads)."""
+
+    def __init__(self, operacao="", janela=JANELA_MEDIA):
+        self.operacao = operacao
+        self.janela = janela
+        self.itens = 0
+        self.bytes = 0
+        self.iniciada_em = time.time()
+        self._inicio = time.perf_counter()
+        self._fim = None
+        self._lock = threading.Lock()
+        self._etapas = {}  # nome -> [segundos, vezes, itens]
+        self._amostras = deque()  # (instante, atual, bytes) recentes
+        self._total = None
+
+    @contextmanager
+    def etapa(self, nome, itens=1):
+        """Mede o bloco e soma o tempo à etapa ``nome`` (``itens`` processados nele)."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.somar(nome, time.perf_counter() - inicio, itens)
+
+    def somar(self, nome, segundos, itens=1):
+        with self._lock:
+            etapa = self._etapas.setdefault(nome, [0.0, 0, 0])
+            etapa[0] += segundos
+            etapa[1] += 1
+            etapa[2] += itens
+
+    def tempos_etapas(self):
+        """Cópia de ``{etapa: (segundos, vezes, itens)}``, para somar em outro ``Metricas`` (ex.: de outro processo)."""
+        with self._lock:
+            return {nome: tuple(etapa) for nome, etapa in self._etapas.items()}
+
+    def incorporar(self, etapas):
+        """Soma as etapas de ``tempos_etapas()`` de outro coletor."""
+        with self._lock:
+            for nome, (segundos, vezes, itens) in etapas.items():
+                etapa = self._etapas.setdefault(nome, [0.0, 0, 0])
+                etapa[0] += segundos
+                etapa[1] += vezes
+                etapa[2] += itens
+
+    def medir_iteracao(self, nome, iteravel):
+        """Repassa os itens de ``iteravel`` somando à etapa ``nome`` o tempo gasto esperando cada um."""
+        iterador = iter(iteravel)
+        while True:
+            inicio = time.perf_counter()
+            try:
+                item = next(iterador)
+            except StopIteration:
+                self.somar(nome, time.perf_counter() - inicio, 0)
+                return
+            self.somar(nome, time.perf_counter() - inicio)
+            yield item
+
+    def contar(self, itens=0, bytes=0):
+        """Soma itens concluídos e bytes transferidos."""
+        with self._lock:
+            self.itens += itens
+            self.bytes += bytes
+
+    def progresso(self, atual, total):
+        """Registra uma amostra do andamento; um ``total`` diferente (nova fase) reinicia a janela."""
+        agora = time.perf_counter()
+        if total != self._total or (self._amostras and atual < self._amostras[-1][1]):
+            self._amostras.clear()
+            self._total = total
+        self._amostras.append((agora, atual, self.bytes))
+        while len(self._amostras) > 2 and agora - self._amostras[0][0] > self.janela:
+            self._amostras.popleft()
+
+    def velocidades(self):
+        """``(itens/s, bytes/s)`` na janela recente (``(None, None)`` com menos de duas amostras)."""
+        if len(self._amostras) < 2:
+            return None, None
+        (t0, atual0, bytes0), (t1, atual1, bytes1) = self._amostras[0], self._amostras[-1]
+        if t1 <= t0:
+            return None, None
+        return (atual1 - atual0) / (t1 - t0), (bytes1 - bytes0) / (t1 - t0)
+
+    def previsao(self):
+        """Segundos restantes pela velocidade recente (None sem total ou sem velocidade)."""
+        itens_por_s, _ = self.velocidades()
+        if not self._total or not itens_por_s:
+            return None
+        return max(0, self._total - self._amostras[-1][1]) / itens_por_s
+
+    def texto_progresso(self):
+        """Linha curta com velocidade, vazão e previsão de término para a tela de progresso."""
+        itens_por_s, bytes_por_s = self.velocidades()
+        partes = []
+        if itens_por_s is not None:
+            partes.append(f"{itens_por_s:.1f} itens/s")
+        if bytes_por_s:
+            partes.append(f"{formatar_bytes(bytes_por_s)}/s")
+        previsao = self.previsao()
+        if previsao is not None:
+            partes.append(f"faltam {formatar_duracao(previsao)}")
+        return " · ".join(partes)
+
+    def encerrar(self):
+        if self._fim is None:
+            self._fim = time.perf_counter()
+
+    @property
+    def duracao(self):
+        return (self._fim if self._fim is not None else time.perf_counter()) - self._inicio
+
+    def resumo(self):
+        """Dicionário com totais, vazões e o detalhamento por etapa (o conteúdo do JSON)."""
+        duracao = self.duracao
+        with self._lock:
+            etapas = {
+                nome: {
+                    "segundos": round(segundos, 3),
+                    "vezes": vezes,
+                    "itens": itens,
+                    "ms_por_item": round(segundos * 1000 / itens, 2) if itens else None,
+                }
+                for nome, (segundos, vezes, itens) in self._etapas.items()
+            }
+            itens, total_bytes = self.itens, self.bytes
+        return {
+            "operacao": self.operacao,
+            "inicio": datetime.fromtimestamp(self.iniciada_em).isoformat(timespec="seconds"),
+            "duracao_s": round(duracao, 3),
+            "itens": itens,
+            "bytes": total_bytes,
+            "itens_por_s": round(itens / duracao, 2) if duracao else None,
+            "bytes_por_s": round(total_bytes / duracao) if duracao else None,
+            "etapas": etapas,
+        }
+
+    def registrar_no_log(self):
+        """Registra no log o tempo de cada etapa."""
+        resumo = self.resumo()
+        for nome, etapa in resumo["etapas"].items():
+            media = f" ({etapa['ms_por_item']} ms/item)" if etapa["ms_por_item"] is not None else ""
+            logging.info(f"⏱️ Etapa {nome}: {etapa['segundos']}s{media}")
+        if resumo["bytes"]:
+            logging.info(f"📈 Vazão média: {formatar_bytes(resumo['bytes_por_s'])}/s "
+                         f"({formatar_bytes(resumo['bytes'])} em {resumo['duracao_s']}s)")
+
+    def exportar(self, caminho=None):
+        """Grava ``resumo()`` em JSON; sem ``caminho``, em ``<cache>/metricas/<operacao>-<data>.json``."""
+        self.encerrar()
+        if caminho is None:
+            nome = f"{self.operacao or 'execucao'}-{datetime.fromtimestamp(self.iniciada_em):%Y%m%d-%H%M%S}.json"
+            caminho = diretorio_cache_padrao() / "metricas" / nome
+        caminho = Path(caminho)
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump(self.resumo(), f, ensure_ascii=False, indent=2)
+        logging.info(f"📈 Métricas gravadas em {caminho}")
+        return caminho
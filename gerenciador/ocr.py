@@ -0,0 +1,637 @@
+"""Motor de OCR em lote usado na renomeação de imagens pelo ID do jogador."""
+
+import logging
+import queue
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .cache_ocr import hash_conteudo
+from .metricas import Metricas
+from .registro import LogPeriodico
+from .renomeacao import executar_renomeacoes, planejar_renomeacoes
+
+EXTENSOES_IMAGEM = ('.jpg', '.jpeg', '.png')
+PADRAO_ID_JOGADOR = re.compile(r"JOGADOR\s*ID\s*=?\s*(\d+)", re.IGNORECASE)
+PADRAO_ROTULO_ID = re.compile(r"JOGADOR\s*ID", re.IGNORECASE)
+PADRAO_DIGITOS = re.compile(r"\d+")
+DIGITOS = "0123456789"
+
+# Valores padrão do pipeline (podem ser alterados por chamada)
+IDIOMAS_PADRAO = ('pt', 'en')
+TAMANHO_LOTE_PADRAO = 8
+TRABALHADORES_PADRAO = 4
+ALTURA_MAXIMA_PADRAO = 1080
+# Confiança mínima do OCR no recorte para aceitar o número sem ler a imagem inteira
+CONFIANCA_MINIMA_REGIAO = 0.5
+# Imagens lidas (ou segundos) acumuladas antes de aplicar as renomeações durante a execução
+RENOMEACOES_POR_VEZ = 200
+INTERVALO_RENOMEACOES = 10
+# Lotes de imagens decodificadas que podem esperar agrupados por dimensão antes de um grupo incompleto ser lido
+LOTES_AGRUPADOS = 2
+
+
+@dataclass
+class ResultadoOCR:
+    """Texto e ID do jogador extraídos de uma imagem."""
+    arquivo: Path
+    texto: str = ""
+    id_jogador: str = None
+    erro: str = None
+    origem: str = "completa"  # "regiao" quando o ID veio do recorte, "cache" quando já era conhecido
+
+
+@dataclass
+class ResumoRenomeacao:
+    """Totais de uma execução de renomeação."""
+    total: int = 0
+    renomeados: int = 0
+    sem_id: int = 0
+    erros: int = 0
+    tempo: float = 0.0
+    renomeacoes: list = field(default_factory=list)
+    ja_processados: int = 0
+    ja_nomeados: int = 0
+
+
+def listar_imagens(pasta):
+    """Lista as imagens (.jpg/.jpeg/.png) diretamente dentro da pasta."""
+    return [f for f in Path(pasta).iterdir() if f.is_file() and f.suffix.lower() in EXTENSOES_IMAGEM]
+
+
+def extrair_id_jogador(texto):
+    """Retorna o número após 'JOGADOR ID' no texto extraído (ou None)."""
+    depois_id = PADRAO_ID_JOGADOR.search(texto)
+    return depois_id.group(1) if depois_id else None
+
+
+def gpu_disponivel():
+    """True se o torch encontra uma GPU CUDA."""
+    import torch
+
+    return torch.cuda.is_available()
+
+
+def criar_leitor(idiomas, gpu=None):
+    """Cria o ``easyocr.Reader``; com ``gpu=None`` usa CUDA se disponível.
+
+    Retorna ``(reader, usando_gpu)``.
+    """
+    import easyocr
+
+    usando_gpu = gpu_disponivel() if gpu is None else bool(gpu)
+    return easyocr.Reader(list(idiomas), gpu=usando_gpu), usando_gpu
+
+
+class LeitorSobDemanda:
+    """Cria o ``easyocr.Reader`` só quando o OCR é usado pela primeira vez.
+
+    ``easyocr`` e ``torch`` só são importados na carga. ``precarregar()`` faz
+    a carga em segundo plano; ``obter()`` bloqueia até o leitor estar pronto.
+    Para IDs lidos no recorte com lista de dígitos, ``idiomas=['en']`` é
+    suficiente e carrega um modelo a menos.
+    """
+
+    def __init__(self, idiomas=IDIOMAS_PADRAO, gpu=None):
+        self.idiomas = list(idiomas)
+        self.gpu = gpu
+        self.reader = None
+        self.usando_gpu = False
+        self.erro = None
+        self.tempo_carregamento = None  # segundos gastos criando o leitor
+        self._lock = threading.Lock()
+
+    @property
+    def pronto(self):
+        return self.reader is not None
+
+    @property
+    def carregando(self):
+        return self._lock.locked()
+
+    def obter(self):
+        """Retorna o leitor, criando-o na primeira chamada."""
+        with self._lock:
+            if self.reader is None:
+                inicio = time.perf_counter()
+                try:
+                    self.reader, self.usando_gpu = criar_leitor(self.idiomas, gpu=self.gpu)
+                    self.erro = None
+                except Exception as e:
+                    self.erro = e
+                    raise
+                self.tempo_carregamento = round(time.perf_counter() - inicio, 2)
+                logging.info(f"✅ EasyOCR ({', '.join(self.idiomas)}) carregado em {self.tempo_carregamento}s "
+                             f"(Usando {'GPU' if self.usando_gpu else 'CPU'})")
+            return self.reader
+
+    def precarregar(self, ao_concluir=None):
+        """Carrega o leitor em uma thread; ``ao_concluir(leitor)`` é chamado no fim (com sucesso ou erro)."""
+        def carregar():
+            try:
+                self.obter()
+            except Exception as e:
+                logging.error(f"⚠️ Falha ao inicializar OCR: {e}")
+            if ao_concluir:
+                ao_concluir(self)
+
+        thread = threading.Thread(target=carregar, name="ocr-carregamento", daemon=True)
+        thread.start()
+        return thread
+
+
+def decodificar_imagem(dados, cinza=False):
+    """Decodifica o conteúdo de um arquivo de imagem para um array BGR (ou em tons de cinza)."""
+    import cv2
+    import numpy as np
+
+    imagem = cv2.imdecode(np.frombuffer(dados, dtype=np.uint8), cv2.IMREAD_GRAYSCALE if cinza else cv2.IMREAD_COLOR)
+    if imagem is None:
+        raise ValueError("formato de imagem não suportado")
+    return imagem
+
+
+class PreProcessamento:
+    """Preparo da imagem decodificada antes da inferência.
+
+    Imagens mais altas que ``altura_maxima`` pixels são reduzidas
+    proporcionalmente (capturas em 4K viram 1080p: o texto continua legível e
+    a inferência fica bem mais rápida e leve). Com ``cinza`` a imagem já é
+    decodificada em tons de cinza. ``contraste`` (CLAHE) e ``binarizar``
+    (limiar de Otsu) ajudam em capturas escuras ou com fundo texturizado;
+    ambos trabalham em tons de cinza. ``altura_maxima=None`` mantém o tamanho.
+    """
+
+    def __init__(self, altura_maxima=ALTURA_MAXIMA_PADRAO, cinza=True, contraste=False, binarizar=False):
+        self.altura_maxima = altura_maxima
+        self.cinza = cinza or contraste or binarizar
+        self.contraste = contraste
+        self.binarizar = binarizar
+
+    @property
+    def assinatura(self):
+        """Texto que identifica os parâmetros (entra na versão do cache de OCR)."""
+        partes = [f"altura={self.altura_maxima or 0}"]
+        partes += [nome for nome in ("cinza", "contraste", "binarizar") if getattr(self, nome)]
+        return "pre:" + ",".join(partes)
+
+    def decodificar(self, dados):
+        return decodificar_imagem(dados, cinza=self.cinza)
+
+    def aplicar(self, imagem):
+        """Retorna a imagem reduzida e realçada conforme os parâmetros."""
+        import cv2
+
+        altura, largura = imagem.shape[:2]
+        if self.altura_maxima and altura > self.altura_maxima:
+            escala = self.altura_maxima / altura
+            imagem = cv2.resize(imagem, (max(1, round(largura * escala)), self.altura_maxima),
+                                interpolation=cv2.INTER_AREA)
+        if self.contraste:
+            imagem = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8)).apply(imagem)
+        if self.binarizar:
+            _, imagem = cv2.threshold(imagem, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+        return imagem
+
+
+class RegiaoInteresse:
+    """Recorte da imagem onde fica o número do 'JOGADOR ID'.
+
+    ``coordenadas`` são frações da imagem ``(x0, y0, x1, y1)``. Sem coordenadas
+    (e com ``aprender=True``) a região é aprendida das caixas detectadas nas
+    primeiras ``amostras`` imagens em que o OCR completo encontrou o ID. A caixa
+    aprendida é alargada por ``margem`` (fração do tamanho da caixa) para
+    acomodar IDs com mais dígitos.
+
+    O número lido no recorte só é aceito (``aceita``) com confiança de pelo
+    menos ``confianca_minima`` e, depois que o OCR completo encontrou algum ID,
+    com uma quantidade de dígitos já vista nesses IDs; caso contrário a imagem
+    passa pelo OCR completo, que também ensina novas quantidades de dígitos.
+    """
+
+    def __init__(self, coordenadas=None, aprender=True, amostras=3, margem=0.5,
+                 confianca_minima=CONFIANCA_MINIMA_REGIAO):
+        self.coordenadas = tuple(coordenadas) if coordenadas else None
+        self.aprender = aprender
+        self.amostras = amostras
+        self.margem = margem
+        self.confianca_minima = confianca_minima
+        self.quantidades_digitos = set()
+        self._caixas = []
+
+    @property
+    def ativa(self):
+        return self.coordenadas is not None
+
+    def aceita(self, id_jogador, confianca):
+        """Indica se o número lido no recorte pode ser usado sem o OCR da imagem inteira."""
+        if not id_jogador or confianca < self.confianca_minima:
+            return False
+        return not self.quantidades_digitos or len(id_jogador) in self.quantidades_digitos
+
+    def recortar(self, imagem):
+        """Retorna o recorte da região na imagem."""
+        altura, largura = imagem.shape[:2]
+        x0, y0, x1, y1 = self.coordenadas
+        return imagem[int(y0 * altura):max(int(y1 * altura), int(y0 * altura) + 1),
+                      int(x0 * largura):max(int(x1 * largura), int(x0 * largura) + 1)]
+
+    def registrar(self, deteccoes, formato, id_jogador=None):
+        """Aprende a posição e a quantidade de dígitos do ID a partir do OCR completo."""
+        if id_jogador:
+            self.quantidades_digitos.add(len(id_jogador))
+        if self.ativa or not self.aprender:
+            return
+        caixa = caixa_do_id(deteccoes)
+        if caixa is None:
+            return
+        altura, largura = formato[:2]
+        x0, y0, x1, y1 = caixa
+        self._caixas.append((x0 / largura, y0 / altura, x1 / largura, y1 / altura))
+        if len(self._caixas) < self.amostras:
+            return
+
+        x0 = min(c[0] for c in self._caixas)
+        y0 = min(c[1] for c in self._caixas)
+        x1 = max(c[2] for c in self._caixas)
+        y1 = max(c[3] for c in self._caixas)
+        margem_x = (x1 - x0) * self.margem
+        margem_y = (y1 - y0) * self.margem
+        self.coordenadas = (max(0.0, x0 - margem_x), max(0.0, y0 - margem_y),
+                            min(1.0, x1 + margem_x), min(1.0, y1 + margem_y))
+        logging.info(f"🎯 Região do ID aprendida: {tuple(round(c, 3) for c in self.coordenadas)}")
+
+
+def caixa_do_id(deteccoes):
+    """Caixa (x0, y0, x1, y1) em pixels dos dígitos do 'JOGADOR ID' (ou None).
+
+    Se rótulo e número vieram na mesma detecção, a parte dos dígitos é estimada
+    pela posição dos caracteres no texto.
+    """
+    for i, (pontos, texto, _) in enumerate(deteccoes):
+        if not PADRAO_ROTULO_ID.search(texto):
+            continue
+        xs = [p[0] for p in pontos]
+        ys = [p[1] for p in pontos]
+        x0, y0, x1, y1 = min(xs), min(ys), max(xs), max(ys)
+
+        depois_id = PADRAO_ID_JOGADOR.search(texto)
+        if depois_id:
+            proporcao = depois_id.start(1) / len(texto)
+            return x0 + (x1 - x0) * proporcao, y0, x1, y1
+
+        # Número em uma detecção separada logo após o rótulo
+        for proximos_pontos, proximo_texto, _ in deteccoes[i + 1:i + 3]:
+            if PADRAO_DIGITOS.search(proximo_texto):
+                xs = [p[0] for p in proximos_pontos]
+                ys = [p[1] for p in proximos_pontos]
+                return min(xs), min(ys), max(xs), max(ys)
+    return None
+
+
+def extrair_digitos(texto):
+    """Maior sequência de dígitos do texto (ou None)."""
+    sequencias = PADRAO_DIGITOS.findall(texto)
+    return max(sequencias, key=len) if sequencias else None
+
+
+def digitos_com_confianca(deteccoes):
+    """``(dígitos, confiança)`` da maior sequência de dígitos entre as detecções (``(None, 0.0)`` se não houver)."""
+    melhor, confianca = None, 0.0
+    for _, texto, confianca_deteccao in deteccoes:
+        digitos = extrair_digitos(texto)
+        if digitos and (melhor is None or len(digitos) > len(melhor)):
+            melhor, confianca = digitos, confianca_deteccao
+    return melhor, confianca
+
+
+class MotorOCR:
+    """Pipeline de OCR: decodificação em paralelo alimentando inferência em lote.
+
+    Um pool de threads decodifica as imagens enquanto a thread chamadora agrupa
+    as já decodificadas por dimensão (exigência do ``readtext_batched``) e
+    executa a inferência assim que um lote enche. A quantidade de imagens
+    decodificadas em memória é limitada pelo tamanho do lote e dos trabalhadores:
+    com resoluções variadas, quando os grupos juntos passam de
+    ``LOTES_AGRUPADOS`` lotes, o maior grupo é reconhecido mesmo incompleto.
+
+    Com uma ``RegiaoInteresse`` ativa, cada lote é reconhecido primeiro apenas
+    no recorte do ID com lista de caracteres restrita a dígitos; só as imagens
+    em que o recorte não traz um número aceito pela região (confiança baixa ou
+    quantidade de dígitos diferente da aprendida) passam pelo OCR da imagem
+    inteira.
+
+    Com um ``PreProcessamento``, as imagens são reduzidas e realçadas nas
+    threads de decodificação, antes de chegar ao leitor.
+
+    Com um ``CacheOCR``, imagens cujo conteúdo já foi reconhecido são
+    respondidas pelo cache sem decodificação nem inferência.
+
+    Com ``Metricas``, ``reconhecer`` soma o tempo das etapas ``leitura``,
+    ``cache``, ``decodificacao``, ``preprocessamento``, ``inferencia`` (e
+    ``inferencia_regiao``) e ``regex``, por imagem.
+    """
+
+    def __init__(self, reader, tamanho_lote=TAMANHO_LOTE_PADRAO, trabalhadores=TRABALHADORES_PADRAO,
+                 regiao=None, cache=None, preprocessamento=None):
+        self.reader = reader
+        self.tamanho_lote = max(1, int(tamanho_lote))
+        self.trabalhadores = max(1, int(trabalhadores))
+        self.regiao = regiao
+        self.cache = cache
+        self.preprocessamento = preprocessamento
+
+    def _decodificar(self, arquivo, metricas, dados=None):
+        """Retorna ``(arquivo, imagem, chave, resultado)``; ``resultado`` só vem preenchido
+        quando não há inferência a fazer (erro de leitura ou acerto no cache).
+
+        ``dados`` é o conteúdo já lido do arquivo (quem chamou já o leu), evitando ler de novo.
+        """
+        try:
+            if dados is None:
+                with metricas.etapa("leitura"):
+                    dados = arquivo.read_bytes()
+            chave = None
+            if self.cache is not None:
+                with metricas.etapa("cache"):
+                    chave = hash_conteudo(dados)
+                    em_cache = self.cache.obter(chave)
+                if em_cache is not None:
+                    texto, id_jogador = em_cache
+                    return arquivo, None, chave, ResultadoOCR(arquivo, texto=texto, id_jogador=id_jogador,
+                                                              origem="cache")
+            if self.preprocessamento is None:
+                with metricas.etapa("decodificacao"):
+                    return arquivo, decodificar_imagem(dados), chave, None
+            with metricas.etapa("decodificacao"):
+                imagem = self.preprocessamento.decodificar(dados)
+            with metricas.etapa("preprocessamento"):
+                return arquivo, self.preprocessamento.aplicar(imagem), chave, None
+        except Exception as e:
+            return arquivo, None, None, ResultadoOCR(arquivo, erro=str(e))
+
+    def _guardar(self, chave, resultado, metricas):
+        if self.cache is not None and chave is not None:
+            with metricas.etapa("cache"):
+                self.cache.guardar(chave, resultado.texto, resultado.id_jogador)
+
+    def _ler_lote(self, imagens, **opcoes):
+        if len(imagens) == 1:
+            return [self.reader.readtext(imagens[0], **opcoes)]
+        return self.reader.readtext_batched(imagens, batch_size=self.tamanho_lote, **opcoes)
+
+    def _inferir_regiao(self, lote, metricas):
+        """Lê só o recorte do ID; retorna resultados dos acertos e o restante do lote."""
+        recortes = [self.regiao.recortar(imagem) for _, imagem, _ in lote]
+        try:
+            with metricas.etapa("inferencia_regiao", itens=len(lote)):
+                deteccoes = self._ler_lote(recortes, allowlist=DIGITOS)
+        except Exception as e:
+            logging.warning(f"⚠️ Falha no OCR da região, usando imagem inteira: {e}")
+            return [], lote
+
+        with metricas.etapa("regex", itens=len(lote)):
+            textos = [" ".join([res[1] for res in resultado]) for resultado in deteccoes]
+            lidos = [digitos_com_confianca(resultado) for resultado in deteccoes]
+
+        resultados, restantes = [], []
+        for (arquivo, imagem, chave), texto, (id_jogador, confianca) in zip(lote, textos, lidos):
+            if self.regiao.aceita(id_jogador, confianca):
+                resultado_ocr = ResultadoOCR(arquivo, texto=texto, id_jogador=id_jogador, origem="regiao")
+                self._guardar(chave, resultado_ocr, metricas)
+                resultados.append(resultado_ocr)
+            else:
+                restantes.append((arquivo, imagem, chave))
+        return resultados, restantes
+
+    def _inferir(self, lote, metricas):
+        resultados = []
+        if self.regiao is not None and self.regiao.ativa:
+            resultados, lote = self._inferir_regiao(lote, metricas)
+            if not lote:
+                return resultados
+
+        try:
+            with metricas.etapa("inferencia", itens=len(lote)):
+                deteccoes = self._ler_lote([imagem for _, imagem, _ in lote])
+        except Exception as e:
+            return resultados + [ResultadoOCR(arquivo, erro=str(e)) for arquivo, _, _ in lote]
+
+        with metricas.etapa("regex", itens=len(lote)):
+            textos = [" ".join([res[1] for res in resultado]) for resultado in deteccoes]
+            ids = [extrair_id_jogador(texto) for texto in textos]
+
+        for (arquivo, imagem, chave), resultado, texto, id_jogador in zip(lote, deteccoes, textos, ids):
+            if id_jogador and self.regiao is not None:
+                self.regiao.registrar(resultado, imagem.shape, id_jogador)
+            resultado_ocr = ResultadoOCR(arquivo, texto=texto, id_jogador=id_jogador)
+            self._guardar(chave, resultado_ocr, metricas)
+            resultados.append(resultado_ocr)
+        return resultados
+
+    def reconhecer(self, arquivos, metricas=None, conteudos=None):
+        """Gera um ResultadoOCR por arquivo, na ordem em que os lotes ficam prontos.
+
+        ``conteudos`` (``{arquivo: bytes}``) traz imagens já lidas, que não são lidas de novo do disco.
+        """
+        if metricas is None:
+            metricas = Metricas()
+        conteudos = conteudos or {}
+        arquivos = iter(arquivos)
+        limite_pendentes = self.trabalhadores + self.tamanho_lote
+        limite_agrupadas = self.tamanho_lote * LOTES_AGRUPADOS
+        pendentes = deque()
+        grupos = {}
+        agrupadas = 0
+
+        with ThreadPoolExecutor(max_workers=self.trabalhadores, thread_name_prefix="ocr-decodificacao") as executor:
+            def abastecer():
+                while len(pendentes) < limite_pendentes:
+                    arquivo = next(arquivos, None)
+                    if arquivo is None:
+                        return
+                    dados = conteudos.pop(arquivo, None)
+                    pendentes.append(executor.submit(self._decodificar, arquivo, metricas, dados))
+
+            abastecer()
+            while pendentes:
+                arquivo, imagem, chave, resultado = pendentes.popleft().result()
+                abastecer()
+                if resultado is not None:
+                    yield resultado
+                    continue
+
+                grupo = grupos.setdefault(imagem.shape, [])
+                grupo.append((arquivo, imagem, chave))
+                agrupadas += 1
+                if len(grupo) >= self.tamanho_lote:
+                    formato = imagem.shape
+                elif agrupadas >= limite_agrupadas:
+                    # Muitas dimensões diferentes: lê o maior grupo em vez de acumular imagens de todas
+                    formato = max(grupos, key=lambda chave_grupo: len(grupos[chave_grupo]))
+                else:
+                    continue
+                grupo = grupos.pop(formato)
+                agrupadas -= len(grupo)
+                yield from self._inferir(grupo, metricas)
+
+        for grupo in grupos.values():
+            yield from self._inferir(grupo, metricas)
+
+
+def _ja_processadas(diario):
+    """Nomes das imagens que uma execução anterior já renomeou ou leu sem ID."""
+    renomeadas = {Path(destino).name for _, destino in diario.concluidas("renomear")}
+    sem_id = {Path(origem).name for origem, _ in diario.concluidas("sem_id")}
+    return renomeadas | sem_id
+
+
+def _aplicar_renomeacoes(pasta, pedidos, resumo, diario, metricas, log):
+    """Decide na memória os nomes das imagens lidas em ``pedidos`` e as renomeia numa única passada.
+
+    Os nomes ocupados são relidos da pasta a cada chamada; as imagens ainda não
+    lidas continuam ocupando os seus nomes e não são renomeadas.
+    """
+    if not pedidos:
+        return
+    with metricas.etapa("renomear", itens=len(pedidos)):
+        try:
+            renomeacoes = planejar_renomeacoes(pasta, pedidos)
+        except OSError as e:
+            logging.error(f"Erro ao listar {pasta}: {e}")
+            resumo.erros += len(pedidos)
+            return
+        mantidos = sum(1 for arquivo, novo in renomeacoes if arquivo == novo)
+        if mantidos:
+            log.contar("já nomeadas", mantidos)
+            resumo.ja_nomeados += mantidos
+
+        def registrar(origem, destino):
+            if diario is not None:
+                diario.registrar("renomear", origem, destino)
+
+        for arquivo, novo_nome, erro in executar_renomeacoes(renomeacoes, registrar):
+            if erro is not None:
+                logging.error(f"Erro ao renomear {arquivo.name}: {erro}")
+                resumo.erros += 1
+                continue
+            logging.debug("✔️ Renomeado: %s → %s", arquivo.name, novo_nome.name)
+            log.contar("renomeadas")
+            resumo.renomeados += 1
+            resumo.renomeacoes.append((arquivo, novo_nome))
+
+
+def renomear_imagens(pasta, motor, ao_progredir=None, diario=None, metricas=None, arquivos=None,
+                     concluir_diario=True):
+    """Renomeia as imagens da pasta pelo ID do jogador encontrado via OCR.
+
+    A inferência roda em uma thread produtora enquanto a thread chamadora
+    junta os IDs encontrados. A cada ``RENOMEACOES_POR_VEZ`` imagens lidas (ou
+    ``INTERVALO_RENOMEACOES`` segundos), e no fim (também se a execução for
+    interrompida), os nomes finais das imagens já lidas são decididos na
+    memória (``planejar_renomeacoes``) e as renomeações são aplicadas numa
+    única passada, sem sobrescrever nada e sem renomear imagens ainda não
+    lidas; assim uma queda perde no máximo as renomeações da última vez.
+    Uma imagem que já tem um nome do próprio ID o mantém.
+    ``ao_progredir(atual, total, resultado)`` é chamado após cada imagem.
+
+    Com um ``Diario``, cada renomeação (e cada imagem sem ID) é registrada;
+    ao retomar, as imagens já processadas na execução anterior são puladas.
+    Com ``concluir_diario=False`` o fim não é marcado no diário (a vigia de
+    pasta chama a função a cada lote e marca o fim só ao encerrar).
+
+    Com ``Metricas``, além das etapas do ``MotorOCR`` são medidas ``listagem``,
+    ``renomear`` e ``espera_ocr`` (tempo em que a thread chamadora ficou
+    parada esperando resultados da inferência).
+
+    ``arquivos`` restringe a renomeação a essas imagens da pasta, sem listá-la
+    (usado pela vigia de pasta para processar só as que chegaram).
+    """
+    if metricas is None:
+        metricas = Metricas()
+    pasta_path = Path(pasta)
+    if arquivos is None:
+        with metricas.etapa("listagem", itens=0):
+            arquivos = listar_imagens(pasta_path)
+    else:
+        arquivos = [Path(arquivo) for arquivo in arquivos]
+    ja_processados = 0
+    if diario is not None and diario.anteriores:
+        processadas = _ja_processadas(diario)
+        pendentes = [arquivo for arquivo in arquivos if arquivo.name not in processadas]
+        ja_processados = len(arquivos) - len(pendentes)
+        arquivos = pendentes
+        logging.info(f"⏭️ Retomando: {ja_processados} imagens já processadas, {len(arquivos)} pendentes")
+    resumo = ResumoRenomeacao(total=len(arquivos), ja_processados=ja_processados)
+    inicio = time.time()
+
+    fila = queue.Queue(maxsize=motor.tamanho_lote * 4)
+    fim_da_fila = object()
+    parar = threading.Event()
+    log = LogPeriodico("🖼️ Renomeação por OCR")
+
+    def produzir():
+        try:
+            for resultado in motor.reconhecer(arquivos, metricas):
+                if parar.is_set():
+                    break
+                fila.put(resultado)
+        except Exception as e:
+            logging.error(f"Erro no pipeline de OCR: {e}")
+        finally:
+            fila.put(fim_da_fila)
+
+    threading.Thread(target=produzir, name="ocr-inferencia", daemon=True).start()
+
+    atual = 0
+    concluido = False
+    pedidos = []  # (imagem, ID) lidas e ainda não renomeadas
+    ultima_aplicacao = time.monotonic()
+    try:
+        while True:
+            with metricas.etapa("espera_ocr", itens=0):
+                resultado = fila.get()
+            if resultado is fim_da_fila:
+                concluido = True
+                break
+            atual += 1
+            arquivo = resultado.arquivo
+            if resultado.erro is not None:
+                logging.error(f"Erro ao processar {arquivo.name}: {resultado.erro}")
+                resumo.erros += 1
+            elif resultado.id_jogador is None:
+                logging.warning(f"⚠️ ID não encontrado em {arquivo.name}")
+                log.contar("sem ID")
+                resumo.sem_id += 1
+                if diario is not None:
+                    diario.registrar("sem_id", arquivo)
+            else:
+                pedidos.append((arquivo, resultado.id_jogador))
+                if (len(pedidos) >= RENOMEACOES_POR_VEZ
+                        or time.monotonic() - ultima_aplicacao >= INTERVALO_RENOMEACOES):
+                    _aplicar_renomeacoes(pasta_path, pedidos, resumo, diario, metricas, log)
+                    pedidos.clear()
+                    ultima_aplicacao = time.monotonic()
+
+            metricas.contar(itens=1)
+            if ao_progredir:
+                ao_progredir(atual, resumo.total, resultado)
+    finally:
+        if not concluido:
+            # ✅ Interrompido (ex.: cancelado em ao_progredir): parar a inferência antes de sair
+            parar.set()
+            while fila.get() is not fim_da_fila:
+                pass
+        # ✅ As imagens lidas desde a última vez são renomeadas mesmo se a execução foi interrompida
+        _aplicar_renomeacoes(pasta_path, pedidos, resumo, diario, metricas, log)
+        log.encerrar()
+
+    # ✅ Só marca o fim se todas as imagens passaram pelo OCR (falha no pipeline permite retomar)
+    if diario is not None and concluir_diario and atual == resumo.total:
+        diario.concluir()
+    resumo.tempo = round(time.time() - inicio, 2)
+    return resumo
@@ -0,0 +1,669 @@
+"""Operações do gerenciador sem dependência de interface gráfica.
+
+Cada operação recebe caminhos e opções explícitos, informa o andamento por
+``ao_progredir(atual, total, status)`` e retorna um objeto de resumo. ``total``
+é None quando ainda não é conhecido (itens descobertos durante a execução).
+As operações em lote montam um ``Plano`` completo antes de alterar o disco.
+Todas aceitam um ``Metricas`` opcional com o tempo de cada etapa.
+"""
+
+import csv
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .copia import MODO_PADRAO, TRABALHADORES_COPIA, ReservasDestino, listar_arvore
+from .fpk import NOME_FACE_FPK, EstatisticasBusca, IndiceFPK, ler_nome_jogador, percorrer_pastas_com_face
+from .indice import IndicePrefixos
+from .metricas import Metricas
+from .plano import COPIAR_ARQUIVO, COPIAR_PASTA, CRIAR_PASTA, MOVER, Plano, executar_plano
+from .registro import LogPeriodico
+
+# Linhas do CSV por lote na leitura em streaming
+LINHAS_POR_LOTE = 5000
+COLUNA_ID, COLUNA_NOME = 'Id', 'Name'
+# Exemplos mostrados nos avisos agregados (IDs em conflito, diferenças da conciliação)
+EXEMPLOS_AVISO = 5
+_CARACTERES_INVALIDOS = str.maketrans('', '', r'<>:"/\|?*')
+# Forma de um ID na conciliação: pastas com esse nome e arquivos com esse prefixo sem linha no CSV são avisados
+PADRAO_ID = re.compile(r"\d+")
+
+
+class ErroCSV(ValueError):
+    """CSV ausente, ilegível ou sem as colunas esperadas."""
+
+
+@dataclass
+class ResumoCSV:
+    """Totais de uma movimentação por CSV (``bytes_estimados`` é None quando os tamanhos não foram medidos)."""
+    total_linhas: int = 0
+    pastas_movidas: int = 0
+    pastas_nao_encontradas: int = 0
+    arquivos_movidos: int = 0
+    erros: int = 0
+    tempo: float = 0.0
+    simulado: bool = False
+    bytes_estimados: int = 0
+    pastas_sem_linha: int = 0
+    arquivos_orfaos: int = 0
+
+
+@dataclass
+class Conciliacao:
+    """Diferenças entre os Ids do CSV e o conteúdo do diretório base.
+
+    ``ids_sem_pasta``: Ids sem pasta (dos quais ``ids_sem_itens`` também não
+    têm arquivos, então nada será movido para eles); ``pastas_sem_linha``:
+    pastas com nome de ID (``PADRAO_ID``) que não estão no CSV;
+    ``arquivos_orfaos``: arquivos iniciados por um ID que não é de nenhuma
+    linha do CSV.
+    """
+    diretorio: Path = None
+    ids_csv: int = 0
+    ids_sem_pasta: list = field(default_factory=list, repr=False)
+    ids_sem_itens: list = field(default_factory=list, repr=False)
+    pastas_sem_linha: list = field(default_factory=list, repr=False)
+    arquivos_orfaos: list = field(default_factory=list, repr=False)
+    arquivo: Path = None
+
+    @property
+    def conciliado(self):
+        return not (self.ids_sem_pasta or self.pastas_sem_linha or self.arquivos_orfaos)
+
+    def relatorio(self):
+        """Linhas do resumo da conciliação, com alguns exemplos de cada diferença."""
+        linhas = [f"🔎 Conciliação: {self.ids_csv} Ids do CSV em {self.diretorio}"]
+        if self.conciliado:
+            linhas.append("✅ Todo Id do CSV tem pasta e todo item com ID no diretório está no CSV")
+            return linhas
+        for descricao, nomes in (("Ids do CSV sem pasta", self.ids_sem_pasta),
+                                 ("Ids do CSV sem pasta nem arquivos", self.ids_sem_itens),
+                                 ("Pastas de ID sem linha no CSV", self.pastas_sem_linha),
+                                 ("Arquivos com ID fora do CSV", self.arquivos_orfaos)):
+            if nomes:
+                linhas.append(f"⚠️ {descricao}: {len(nomes)} (ex.: {', '.join(nomes[:EXEMPLOS_AVISO])})")
+        return linhas
+
+    def exportar(self, arquivo):
+        """Grava todas as diferenças em CSV (``tipo;nome``, separado por ';')."""
+        self.arquivo = Path(arquivo)
+        with open(self.arquivo, 'w', newline='', encoding='utf-8') as f:
+            escritor = csv.writer(f, delimiter=';')
+            escritor.writerow(["tipo", "nome"])
+            for tipo, nomes in (("id_sem_pasta", self.ids_sem_pasta), ("id_sem_itens", self.ids_sem_itens),
+                                ("pasta_sem_linha", self.pastas_sem_linha),
+                                ("arquivo_orfao", self.arquivos_orfaos)):
+                escritor.writerows((tipo, nome) for nome in nomes)
+        return self.arquivo
+
+
+@dataclass
+class ResumoListagem:
+    """Resultado da listagem de subpastas."""
+    arquivo: Path = None
+    total_pastas: int = 0
+
+
+@dataclass
+class ResumoFPK:
+    """Totais de uma cópia de conteúdo por face.fpk."""
+    diretorios_verificados: int = 0
+    pastas_com_face: int = 0
+    faces_processadas: int = 0
+    arquivos_copiados: int = 0
+    pastas_copiadas: int = 0
+    itens_ignorados: int = 0
+    erros: int = 0
+    tempo: float = 0.0
+    bytes_copiados: int = 0
+    arquivos_por_modo: dict = field(default_factory=dict)
+    simulado: bool = False
+    bytes_estimados: int = 0
+
+
+def limpar_nome(nome):
+    """Remove caracteres inválidos para nomes de arquivos/pastas."""
+    return nome.translate(_CARACTERES_INVALIDOS)
+
+
+def _limpar_lote(linhas):
+    """Pares ``(id, nome)`` de um lote de linhas cruas, sem espaços nas pontas e com o nome limpo."""
+    tabela = _CARACTERES_INVALIDOS
+    return [(id_pasta.strip(), nome.strip().translate(tabela)) for id_pasta, nome in linhas]
+
+
+def ler_csv_em_lotes(arquivo_csv, tamanho_lote=LINHAS_POR_LOTE):
+    """Gera lotes de pares ``(id, nome)`` do CSV (separado por ';') sem carregar o arquivo inteiro.
+
+    O cabeçalho é validado antes do primeiro lote (colunas ``Id`` e ``Name``,
+    em qualquer posição). Linhas em branco são puladas; os nomes já vêm limpos
+    (``limpar_nome``). Um BOM no início (CSV salvo pelo Excel) é ignorado.
+    """
+    try:
+        arquivo = open(arquivo_csv, newline='', encoding='utf-8-sig')
+    except OSError as e:
+        raise ErroCSV(f"Falha ao ler CSV:\n{e}") from e
+
+    with arquivo:
+        leitor = csv.reader(arquivo, delimiter=';')
+        try:
+            cabecalho = [coluna.strip() for coluna in next(leitor, [])]
+            # Validar se tem as colunas necessárias
+            if COLUNA_ID not in cabecalho or COLUNA_NOME not in cabecalho:
+                raise ErroCSV("CSV deve conter as colunas 'Id' e 'Name'")
+            posicao_id, posicao_nome = cabecalho.index(COLUNA_ID), cabecalho.index(COLUNA_NOME)
+            minimo = max(posicao_id, posicao_nome) + 1
+
+            lote = []
+            for linha in leitor:
+                if not any(linha):
+                    continue
+                if len(linha) < minimo:
+                    linha = linha + [""] * (minimo - len(linha))
+                lote.append((linha[posicao_id], linha[posicao_nome]))
+                if len(lote) >= tamanho_lote:
+                    yield _limpar_lote(lote)
+                    lote = []
+            if lote:
+                yield _limpar_lote(lote)
+        except (csv.Error, UnicodeDecodeError) as e:
+            raise ErroCSV(f"Falha ao ler CSV (linha {leitor.line_num}):\n{e}") from e
+
+
+def ler_csv(arquivo_csv):
+    """Lê o CSV (separado por ';') e retorna a lista de pares ``(id, nome)``."""
+    linhas = [par for lote in ler_csv_em_lotes(arquivo_csv) for par in lote]
+    if not linhas:
+        raise ErroCSV("CSV está vazio")
+    return linhas
+
+
+def mapear_csv(arquivo_csv, tamanho_lote=LINHAS_POR_LOTE):
+    """Lê o CSV em lotes e retorna ``({id: nome}, linhas_lidas)``, validado antes de alterar o disco.
+
+    Linhas sem Id ou sem Name (depois de limpo) são ignoradas com aviso, assim
+    como um Id repetido com o mesmo Name. Um Id repetido com Names diferentes
+    interrompe com ``ErroCSV``, com alguns exemplos. Names que só diferem em
+    maiúsculas/minúsculas são avisados: no Windows eles são a mesma pasta e os
+    IDs serão reunidos nela.
+    """
+    mapa = {}
+    conflitos = []
+    pastas = {}  # nome da pasta sem diferença de maiúsculas -> primeiro nome visto
+    avisados = set()
+    linhas_lidas = incompletas = repetidas = 0
+    for lote in ler_csv_em_lotes(arquivo_csv, tamanho_lote):
+        linhas_lidas += len(lote)
+        for id_pasta, nome in lote:
+            if not id_pasta or not nome:
+                incompletas += 1
+                continue
+            anterior = mapa.get(id_pasta)
+            if anterior is not None:
+                if anterior == nome:
+                    repetidas += 1
+                else:
+                    conflitos.append(f"{id_pasta}: '{anterior}' e '{nome}'")
+                continue
+            mapa[id_pasta] = nome
+
+            primeiro = pastas.setdefault(nome.casefold(), nome)
+            if primeiro != nome and nome not in avisados:
+                avisados.add(nome)
+                logging.warning(f"⚠️ '{nome}' e '{primeiro}' resultam na mesma pasta; os IDs serão reunidos nela")
+
+    if not linhas_lidas:
+        raise ErroCSV("CSV está vazio")
+    if conflitos:
+        exemplos = "\n".join(conflitos[:EXEMPLOS_AVISO])
+        raise ErroCSV(f"CSV tem {len(conflitos)} IDs repetidos com nomes diferentes, por exemplo:\n{exemplos}")
+    if incompletas:
+        logging.warning(f"⚠️ {incompletas} linhas sem Id ou Name ignoradas")
+    if repetidas:
+        logging.warning(f"⚠️ {repetidas} linhas repetidas (mesmo Id e Name) ignoradas")
+    if not mapa:
+        raise ErroCSV("CSV não tem linhas com Id e Name preenchidos")
+    return mapa, linhas_lidas
+
+
+def _conciliar(mapa, indice):
+    """Compara os Ids do CSV com o índice do diretório base (antes de qualquer item ser retirado dele)."""
+    com_pasta = indice.ids_com_pasta()
+    ids_sem_pasta = mapa.keys() - com_pasta
+    # Uma pasta com o nome de um destino (de uma execução anterior) não é uma pasta de ID sem linha
+    destinos = {nome.casefold() for nome in mapa.values()}
+    return Conciliacao(
+        diretorio=indice.diretorio,
+        ids_csv=len(mapa),
+        ids_sem_pasta=sorted(ids_sem_pasta),
+        ids_sem_itens=sorted(ids_sem_pasta - indice.ids_com_arquivos()),
+        pastas_sem_linha=sorted(nome for nome in indice.pastas_sem_id
+                                if PADRAO_ID.fullmatch(nome) and nome.casefold() not in destinos),
+        arquivos_orfaos=sorted(nome for nome in indice.arquivos_sem_dono if PADRAO_ID.match(nome)),
+    )
+
+
+def conciliar_csv(arquivo_csv, arquivo_relatorio=None, metricas=None):
+    """Confere os Ids do CSV com o diretório do CSV sem alterar nada; retorna a ``Conciliacao``.
+
+    Uma única leitura do diretório é cruzada com os Ids por conjuntos. Com
+    ``arquivo_relatorio``, todas as diferenças são gravadas em CSV.
+    """
+    if metricas is None:
+        metricas = Metricas()
+    with metricas.etapa("conciliacao", itens=0):
+        mapa, _ = mapear_csv(arquivo_csv)
+        conciliacao = _conciliar(mapa, IndicePrefixos(Path(arquivo_csv).parent, mapa))
+    for linha in conciliacao.relatorio():
+        logging.info(linha)
+    if arquivo_relatorio:
+        conciliacao.exportar(arquivo_relatorio)
+        logging.info(f"📄 Diferenças gravadas em {conciliacao.arquivo}")
+    return conciliacao
+
+
+def _planejar_csv(arquivo_csv, somente_existentes, medir):
+    """Monta o plano da movimentação por CSV sem alterar o disco."""
+    mapa, linhas_lidas = mapear_csv(arquivo_csv)
+    diretorio_base = Path(arquivo_csv).parent
+    resumo = ResumoCSV(total_linhas=linhas_lidas)
+    plano = Plano(f"movimentação por CSV ({Path(arquivo_csv).name})", medido=medir)
+    pastas_nome = set()
+
+    # ✅ Uma única leitura do diretório base para todas as linhas do CSV
+    indice = IndicePrefixos(diretorio_base, mapa)
+    conciliacao = _conciliar(mapa, indice)
+    plano.observacoes.extend(conciliacao.relatorio())
+    resumo.pastas_sem_linha = len(conciliacao.pastas_sem_linha)
+    resumo.arquivos_orfaos = len(conciliacao.arquivos_orfaos)
+
+    for id_pasta, nome_completo in mapa.items():
+        nova_pasta_path = diretorio_base / nome_completo
+        pasta_id_path = indice.retirar_pasta(id_pasta)
+
+        if pasta_id_path is None:
+            logging.debug("⚠️ Pasta não encontrada: %s", id_pasta)
+            resumo.pastas_nao_encontradas += 1
+
+        # ✅ Verificar se a pasta com ID existe antes de planejar a movimentação
+        if pasta_id_path is None and somente_existentes:
+            continue
+
+        if nova_pasta_path not in pastas_nome:
+            pastas_nome.add(nova_pasta_path)
+            if not nova_pasta_path.is_dir():
+                plano.adicionar(CRIAR_PASTA, nova_pasta_path)
+
+        # ✅ Mover pasta com o ID
+        if pasta_id_path is not None:
+            arvore = listar_arvore(pasta_id_path) if medir else None
+            plano.adicionar(MOVER, nova_pasta_path / id_pasta, origem=pasta_id_path,
+                            arquivos=len(arvore.arquivos) if arvore else 0, tamanho=arvore.bytes if arvore else 0)
+            resumo.pastas_movidas += 1
+
+        # ✅ Mover arquivos com o ID no início do nome
+        for arquivo in indice.retirar_arquivos(id_pasta):
+            plano.adicionar(MOVER, nova_pasta_path / arquivo.name, origem=arquivo,
+                            arquivos=1, tamanho=arquivo.stat().st_size if medir else 0)
+            resumo.arquivos_movidos += 1
+
+    return plano, resumo
+
+
+def _aprovar_plano(plano, resumo, simular, confirmar):
+    """Registra o relatório do plano; False quando ele não deve ser executado."""
+    for linha in plano.relatorio():
+        logging.info(linha)
+    resumo.bytes_estimados = plano.bytes_estimados if plano.medido else None
+    if simular or (plano.acoes and confirmar is not None and not confirmar(plano)):
+        resumo.simulado = True
+        logging.info("🧪 Plano não executado: nenhuma alteração foi feita no disco")
+        return False
+    return True
+
+
+def mover_por_csv(arquivo_csv, somente_existentes=False, ao_progredir=None, simular=False, confirmar=None,
+                  diario=None, metricas=None):
+    """Move as pastas ``<Id>`` e os arquivos iniciados pelo Id para a pasta ``<Name>``.
+
+    O diretório base é o diretório do CSV. Com ``somente_existentes``, a pasta
+    ``<Name>`` só é criada (e os arquivos só são movidos) quando a pasta do Id existe.
+
+    Primeiro é montado o plano completo (``Plano``). Com ``simular`` só o
+    relatório é registrado; ``confirmar(plano)`` pode recusar a execução
+    retornando False. Os tamanhos só são medidos para o relatório de
+    ``simular``/``confirmar``; sem eles, o relatório traz só as quantidades.
+    Com um ``Diario``, as ações concluídas são registradas
+    (para retomar ou desfazer) e as já registradas são puladas.
+    ``metricas`` recebe as etapas ``planejamento`` e as da execução do plano.
+    """
+    if metricas is None:
+        metricas = Metricas()
+    inicio = time.time()
+    medir = simular or confirmar is not None
+    with metricas.etapa("planejamento", itens=0):
+        plano, resumo = _planejar_csv(arquivo_csv, somente_existentes, medir)
+    if _aprovar_plano(plano, resumo, simular, confirmar):
+        resumo.erros, _ = executar_plano(plano, ao_progredir=ao_progredir, diario=diario, metricas=metricas)
+        if diario is not None:
+            diario.concluir()
+
+    resumo.tempo = round(time.time() - inicio, 2)
+    return resumo
+
+
+def listar_pastas(pasta, arquivo_saida=None):
+    """Grava os nomes das subpastas (um nível) em ``lista_pastas.txt`` dentro da pasta.
+
+    Se não houver subpastas, nenhum arquivo é gerado e o total é zero.
+    """
+    pasta_path = Path(pasta)
+    subpastas = [d for d in pasta_path.iterdir() if d.is_dir()]
+    resumo = ResumoListagem(total_pastas=len(subpastas))
+    if not subpastas:
+        return resumo
+
+    # Criar arquivo de lista
+    resumo.arquivo = Path(arquivo_saida) if arquivo_saida else pasta_path / "lista_pastas.txt"
+    with open(resumo.arquivo, 'w', encoding='utf-8') as f:
+        for subpasta in subpastas:
+            f.write(f"{subpasta.name}\n")
+
+    logging.info(f"✔️ Lista de pastas gerada: {resumo.arquivo.name} com {len(subpastas)} pastas")
+    return resumo
+
+
+def _registrar_busca(estatisticas):
+    logging.info(f"📊 Resumo da busca: {estatisticas.pastas_com_face} pastas com face.fpk encontradas em {estatisticas.diretorios_verificados} diretórios verificados")
+    if not estatisticas.pastas_com_face:
+        logging.warning("⚠️ Nenhuma pasta com face.fpk encontrada na parte 1")
+
+
+def _faces_com_nome(diretorio_faces, estatisticas, usar_indice):
+    """Gera ``(pasta_face, nome_jogador)``; com índice só lê os face.fpk novos ou alterados."""
+    if usar_indice:
+        with IndiceFPK(diretorio_faces) as indice:
+            yield from indice.percorrer(estatisticas=estatisticas)
+        return
+
+    for pasta_face in percorrer_pastas_com_face(Path(diretorio_faces), estatisticas=estatisticas):
+        logging.debug("📄 Lendo arquivo: %s", pasta_face / NOME_FACE_FPK)
+        yield pasta_face, ler_nome_jogador(pasta_face)
+
+
+def _localizar_pasta_jogador(nome_jogador, diretorio_arquivos_path):
+    """Retorna a pasta do jogador na PARTE 2 (ou None)."""
+    if not nome_jogador:
+        return None
+    logging.debug("🎯 Nome do jogador encontrado: '%s'", nome_jogador)
+
+    # Buscar pasta do jogador na parte 2
+    pasta_jogador = diretorio_arquivos_path / nome_jogador
+    logging.debug("🔍 Procurando pasta do jogador: %s", pasta_jogador)
+
+    if not pasta_jogador.exists() or not pasta_jogador.is_dir():
+        logging.warning(f"⚠️ Pasta do jogador '{nome_jogador}' não encontrada na parte 2")
+        return None
+
+    logging.debug("✅ Pasta do jogador encontrada: %s", pasta_jogador)
+    return pasta_jogador
+
+
+class _PastasJogadores:
+    """Pasta de cada jogador na PARTE 2 e seu conteúdo, lidos uma vez por execução.
+
+    Quando várias face.fpk apontam para o mesmo jogador, a PARTE 2 é consultada
+    só na primeira; as demais reaproveitam a pasta, a listagem e os tamanhos.
+    """
+
+    def __init__(self, diretorio_arquivos):
+        self.diretorio = Path(diretorio_arquivos)
+        self._pastas = {}
+        self._itens = {}
+        self._arvores = {}
+
+    def localizar(self, nome_jogador):
+        if nome_jogador in self._pastas:
+            logging.debug("🎯 Nome do jogador encontrado: '%s' (pasta já localizada)", nome_jogador)
+            return self._pastas[nome_jogador]
+        pasta_jogador = self._pastas[nome_jogador] = _localizar_pasta_jogador(nome_jogador, self.diretorio)
+        return pasta_jogador
+
+    def arvore(self, pasta):
+        if pasta not in self._arvores:
+            self._arvores[pasta] = listar_arvore(pasta)
+        return self._arvores[pasta]
+
+    def itens(self, pasta_jogador):
+        """Lista de ``(caminho, é_arquivo, é_pasta, bytes, arvore)`` do conteúdo da pasta do jogador."""
+        if pasta_jogador not in self._itens:
+            itens = []
+            with os.scandir(pasta_jogador) as entradas:
+                for entrada in entradas:
+                    caminho = Path(entrada.path)
+                    if entrada.is_dir():
+                        arvore = self.arvore(caminho)
+                        itens.append((caminho, False, True, arvore.bytes, arvore))
+                    else:
+                        eh_arquivo = entrada.is_file()
+                        itens.append((caminho, eh_arquivo, False, entrada.stat().st_size if eh_arquivo else 0, None))
+            self._itens[pasta_jogador] = itens
+        return self._itens[pasta_jogador]
+
+
+def _registrar_copia(resumo, estatisticas_copia):
+    resumo.bytes_copiados = estatisticas_copia.bytes
+    resumo.arquivos_por_modo = dict(estatisticas_copia.por_modo)
+    if estatisticas_copia.por_modo:
+        modos = ", ".join(f"{modo}: {total}" for modo, total in sorted(estatisticas_copia.por_modo.items()))
+        logging.info(f"🔗 Arquivos transferidos por modo: {modos} ({estatisticas_copia.bytes / 2**20:.1f} MB duplicados)")
+
+
+def _registrar_resumo_final(resumo, linhas_especificas):
+    # Log final detalhado
+    logging.info("=" * 60)
+    logging.info("📊 RESUMO FINAL DO PROCESSAMENTO")
+    logging.info("=" * 60)
+    logging.info(f"🔍 Total de diretórios verificados: {resumo.diretorios_verificados}")
+    logging.info(f"📁 Total de pastas com face.fpk encontradas: {resumo.pastas_com_face}")
+    logging.info(f"✅ Faces processadas com sucesso: {resumo.faces_processadas}")
+    for linha in linhas_especificas:
+        logging.info(linha)
+    logging.info(f"❌ Erros encontrados: {resumo.erros}")
+    logging.info(f"⏱️ Tempo total de processamento: {resumo.tempo}s")
+    logging.info("=" * 60)
+
+
+def _processar_por_fpk(descricao, planejar_face, diretorio_faces, diretorio_arquivos, ao_progredir, usar_indice,
+                       trabalhadores_copia, modo, simular, confirmar, diario, metricas):
+    """Planeja as transferências de cada face.fpk com ``planejar_face`` e executa o plano.
+
+    Nas métricas, ``busca`` é o tempo esperando a próxima face.fpk (varredura da
+    PARTE 1 e leitura dos nomes) e ``planejamento`` o da consulta à PARTE 2.
+    """
+    if metricas is None:
+        metricas = Metricas()
+    jogadores = _PastasJogadores(diretorio_arquivos)
+    # Numa retomada, as pastas que a execução interrompida criou sem terminar voltam a ser destinos válidos
+    plano = Plano(descricao, reservas=ReservasDestino(diario.pastas_incompletas() if diario is not None else ()))
+    resumo = ResumoFPK()
+    inicio = time.time()
+    movidas = set()
+
+    # ✅ O plano é montado enquanto a busca por face.fpk continua. O destino é sempre
+    # um ancestral da pasta encontrada (já listado) e nada é alterado antes do fim da
+    # busca, então a execução do plano não interfere nela.
+    logging.info("🔍 Iniciando busca por face.fpk...")
+    estatisticas = EstatisticasBusca()
+    log = LogPeriodico("🔍 Planejamento por face.fpk")
+    faces = metricas.medir_iteracao("busca", _faces_com_nome(diretorio_faces, estatisticas, usar_indice))
+    for i, (pasta_face, nome_jogador) in enumerate(faces, start=1):
+        inicio_face = time.perf_counter()
+        try:
+            logging.debug("🔍 Processando pasta %d: %s", i, pasta_face.name)
+            pasta_jogador = jogadores.localizar(nome_jogador)
+            if pasta_jogador is None:
+                log.contar("sem pasta de jogador")
+                continue
+
+            # Ao mover, cada pasta de jogador vai só para o primeiro destino
+            if pasta_jogador in movidas:
+                logging.debug("⏭️ Pasta do jogador já foi movida para outro destino, ignorando: %s", nome_jogador)
+                resumo.itens_ignorados += 1
+                log.contar("ignoradas")
+                continue
+            if planejar_face(plano, resumo, jogadores, pasta_face, nome_jogador, pasta_jogador):
+                log.contar("faces planejadas")
+                if modo == "mover":
+                    movidas.add(pasta_jogador)
+            else:
+                log.contar("sem itens novos")
+
+        except Exception as e:
+            logging.error(f"❌ Erro ao processar {pasta_face.name}: {e}")
+            resumo.erros += 1
+
+        finally:
+            metricas.somar("planejamento", time.perf_counter() - inicio_face)
+            if ao_progredir:
+                ao_progredir(i, None, f"Processando: {pasta_face.name}")
+
+    log.encerrar()
+    resumo.diretorios_verificados = estatisticas.diretorios_verificados
+    resumo.pastas_com_face = estatisticas.pastas_com_face
+    _registrar_busca(estatisticas)
+
+    if _aprovar_plano(plano, resumo, simular, confirmar):
+        erros, estatisticas_copia = executar_plano(plano, trabalhadores_copia, modo, ao_progredir, diario, metricas)
+        resumo.erros += erros
+        if diario is not None:
+            diario.concluir()
+        _registrar_copia(resumo, estatisticas_copia)
+    resumo.tempo = round(time.time() - inicio, 2)
+    return resumo
+
+
+def _planejar_conteudo(plano, resumo, jogadores, pasta_face, nome_jogador, pasta_jogador):
+    # Copiar todo o conteúdo da pasta do jogador para o mesmo diretório onde está a pasta ID (não dentro dela)
+    diretorio_destino = pasta_face.parent  # Diretório pai da pasta ID
+    logging.debug("📁 Diretório de destino: %s", diretorio_destino)
+
+    arquivos_copiados_pasta = 0
+    pastas_copiadas_pasta = 0
+    itens_ignorados = 0
+
+    # Processar todos os itens (arquivos e pastas) dentro da pasta do jogador
+    for item, eh_arquivo, eh_pasta, tamanho, arvore in jogadores.itens(pasta_jogador):
+        destino = diretorio_destino / item.name
+
+        # Verificar se o item já existe (ou já está no plano) - se existir, não copiar
+        if not plano.reservas.reservar(destino):
+            logging.debug("⏭️ Item já existe, ignorando: %s", item.name)
+            itens_ignorados += 1
+            continue
+
+        if eh_arquivo:
+            plano.adicionar(COPIAR_ARQUIVO, destino, origem=item, arquivos=1, tamanho=tamanho)
+            arquivos_copiados_pasta += 1
+        elif eh_pasta:
+            plano.adicionar(COPIAR_PASTA, destino, origem=item, arquivos=len(arvore.arquivos), tamanho=tamanho,
+                            arvore=arvore)
+            pastas_copiadas_pasta += 1
+
+    resumo.itens_ignorados += itens_ignorados
+    plano.ignorados += itens_ignorados
+    if arquivos_copiados_pasta + pastas_copiadas_pasta > 0:
+        resumo.arquivos_copiados += arquivos_copiados_pasta
+        resumo.pastas_copiadas += pastas_copiadas_pasta
+        resumo.faces_processadas += 1
+        logging.debug("✅ %s: %d arquivos e %d pastas a mover para %s", pasta_face.name, arquivos_copiados_pasta,
+                      pastas_copiadas_pasta, diretorio_destino)
+        if itens_ignorados > 0:
+            logging.debug("⏭️ %d itens ignorados por já existirem", itens_ignorados)
+        return True
+    if itens_ignorados > 0:
+        logging.debug("⏭️ %s: Todos os %d itens já existem, nada será movido", pasta_face.name, itens_ignorados)
+    else:
+        logging.warning(f"⚠️ {pasta_face.name}: Nenhum item para mover de '{nome_jogador}'")
+    return False
+
+
+def _planejar_pasta_completa(plano, resumo, jogadores, pasta_face, nome_jogador, pasta_jogador):
+    # Copiar a pasta completa do jogador para um nível acima do diretório onde está a pasta ID
+    diretorio_destino = pasta_face.parent.parent  # Diretório pai do diretório pai da pasta ID
+    logging.debug("📁 Diretório de destino: %s", diretorio_destino)
+
+    # Verificar se a pasta do jogador já existe (ou já está no plano) no destino
+    destino_pasta_completa = diretorio_destino / nome_jogador
+    if not plano.reservas.reservar(destino_pasta_completa):
+        logging.debug("⏭️ Pasta do jogador já existe, ignorando: %s", nome_jogador)
+        resumo.itens_ignorados += 1
+        plano.ignorados += 1
+        return False
+
+    arvore = jogadores.arvore(pasta_jogador)
+    plano.adicionar(COPIAR_PASTA, destino_pasta_completa, origem=pasta_jogador, arquivos=len(arvore.arquivos),
+                    tamanho=arvore.bytes, arvore=arvore)
+    resumo.arquivos_copiados += len(arvore.arquivos)
+    resumo.pastas_copiadas += 1
+    resumo.faces_processadas += 1
+    logging.debug("✅ %s: Pasta completa '%s' a copiar com %d arquivos", pasta_face.name, nome_jogador,
+                  len(arvore.arquivos))
+    return True
+
+
+def copiar_conteudo_por_fpk(diretorio_faces, diretorio_arquivos, ao_progredir=None, usar_indice=True,
+                            trabalhadores_copia=TRABALHADORES_COPIA, modo=MODO_PADRAO, simular=False, confirmar=None,
+                            diario=None, metricas=None):
+    """Busca face.fpk na PARTE 1, extrai o nome do jogador e copia o conteúdo da pasta
+    do jogador na PARTE 2 para o diretório pai de cada pasta com face.fpk.
+
+    Itens que já existem no destino não são copiados. Com ``usar_indice``, os
+    nomes já extraídos em execuções anteriores vêm do ``IndiceFPK`` da PARTE 1.
+    As cópias rodam em paralelo em ``trabalhadores_copia`` threads; ``modo``
+    escolhe entre copiar, clonar (reflink), criar hardlinks ou mover (veja
+    ``gerenciador.copia``). Ao mover, cada pasta de jogador vai só para o
+    primeiro destino encontrado. ``simular``, ``confirmar``, ``diario`` e
+    ``metricas`` funcionam como em ``mover_por_csv`` (no diário, cada arquivo
+    transferido).
+    """
+    logging.info("🚀 Iniciando cópia de conteúdo por FPK")
+    resumo = _processar_por_fpk("cópia de conteúdo por FPK", _planejar_conteudo, diretorio_faces, diretorio_arquivos,
+                                ao_progredir, usar_indice, trabalhadores_copia, modo, simular, confirmar, diario,
+                                metricas)
+    _registrar_resumo_final(resumo, [
+        f"📋 Total de arquivos movidos: {resumo.arquivos_copiados}",
+        f"⏭️ Total de itens ignorados (já existiam): {resumo.itens_ignorados}",
+    ])
+    logging.info(f"✅ Processo de faces concluído: {resumo.faces_processadas} faces, {resumo.arquivos_copiados} arquivos movidos em {resumo.tempo}s")
+    return resumo
+
+
+def copiar_pasta_completa_por_fpk(diretorio_faces, diretorio_arquivos, ao_progredir=None, usar_indice=True,
+                                  trabalhadores_copia=TRABALHADORES_COPIA, modo=MODO_PADRAO, simular=False,
+                                  confirmar=None, diario=None, metricas=None):
+    """Busca face.fpk na PARTE 1, extrai o nome do jogador e copia a pasta completa do
+    jogador na PARTE 2 para um nível acima do diretório pai de cada pasta com face.fpk.
+
+    Pastas de jogador que já existem no destino não são copiadas. Com
+    ``usar_indice``, os nomes já extraídos vêm do ``IndiceFPK`` da PARTE 1.
+    As cópias rodam em paralelo em ``trabalhadores_copia`` threads; ``modo``
+    escolhe entre copiar, clonar (reflink), criar hardlinks ou mover (veja
+    ``gerenciador.copia``). Ao mover, cada pasta de jogador vai só para o
+    primeiro destino encontrado. ``simular``, ``confirmar``, ``diario`` e
+    ``metricas`` funcionam como em ``mover_por_csv`` (no diário, cada arquivo
+    transferido).
+    """
+    logging.info("🚀 Iniciando cópia de pasta completa por FPK")
+    resumo = _processar_por_fpk("cópia de pasta completa por FPK", _planejar_pasta_completa, diretorio_faces,
+                                diretorio_arquivos, ao_progredir, usar_indice, trabalhadores_copia, modo, simular,
+                                confirmar, diario, metricas)
+    _registrar_resumo_final(resumo, [
+        f"📁 Total de pastas completas movidas: {resumo.pastas_copiadas}",
+        f"⏭️ Total de pastas ignoradas (já existiam): {resumo.itens_ignorados}",
+    ])
+    logging.info(f"✅ Processo de faces concluído: {resumo.faces_processadas} faces, {resumo.pastas_copiadas} pastas completas movidas em {resumo.tempo}s")
+    return resumo
@@ -0,0 +1,158 @@
+"""Planos das operações em lote: decidir tudo antes de alterar o disco.
+
+Cada operação primeiro descobre o que fazer e monta um ``Plano`` (pastas a
+criar, itens a mover ou transferir, com tamanhos). Só depois o plano é
+executado por ``executar_plano``, o que permite simular (dry-run), mostrar os
+totais antes de começar e ordenar/paralelizar as ações independentes.
+"""
+
+import logging
+import os
+import shutil
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .copia import MODO_PADRAO, TRABALHADORES_COPIA, AgendadorCopia, Arvore, ReservasDestino
+from .metricas import Metricas, formatar_bytes
+from .registro import LogPeriodico
+
+CRIAR_PASTA = "criar_pasta"
+MOVER = "mover"
+COPIAR_ARQUIVO = "copiar_arquivo"
+COPIAR_PASTA = "copiar_pasta"
+
+_DESCRICOES = {
+    CRIAR_PASTA: "📁 Pastas a criar",
+    MOVER: "🚚 Itens a mover",
+    COPIAR_ARQUIVO: "📋 Arquivos a transferir",
+    COPIAR_PASTA: "📂 Pastas a transferir",
+}
+# Eventos do resumo periódico do log por tipo de ação
+_EVENTOS_LOG = {
+    CRIAR_PASTA: "pastas criadas",
+    MOVER: "itens movidos",
+    COPIAR_ARQUIVO: "arquivos enviados para transferência",
+    COPIAR_PASTA: "pastas enviadas para transferência",
+}
+# Pastas primeiro, depois movimentações, por fim as transferências em paralelo
+_FASES = {CRIAR_PASTA: 0, MOVER: 1, COPIAR_ARQUIVO: 2, COPIAR_PASTA: 2}
+
+
+@dataclass
+class Acao:
+    """Uma alteração planejada no disco."""
+    tipo: str
+    destino: Path
+    origem: Path = None
+    arquivos: int = 0
+    tamanho: int = 0
+    arvore: Arvore = field(default=None, repr=False)
+
+
+@dataclass
+class Plano:
+    """Lista de ações de uma operação, com as reservas de destino já feitas.
+
+    ``observacoes`` são linhas extras do relatório (ex.: a conciliação do CSV).
+    Com ``medido=False`` os tamanhos não foram levantados e o relatório traz
+    só a quantidade de ações.
+    """
+    descricao: str
+    acoes: list = field(default_factory=list)
+    ignorados: int = 0
+    observacoes: list = field(default_factory=list)
+    reservas: ReservasDestino = field(default_factory=ReservasDestino, repr=False)
+    medido: bool = True
+
+    def adicionar(self, tipo, destino, origem=None, arquivos=0, tamanho=0, arvore=None):
+        acao = Acao(tipo, Path(destino), Path(origem) if origem is not None else None, arquivos, tamanho, arvore)
+        self.acoes.append(acao)
+        return acao
+
+    @property
+    def bytes_estimados(self):
+        return sum(acao.tamanho for acao in self.acoes)
+
+    def totais(self):
+        """``{tipo: (ações, arquivos, bytes)}`` na ordem de execução."""
+        totais = {}
+        for acao in self.acoes:
+            quantidade, arquivos, tamanho = totais.get(acao.tipo, (0, 0, 0))
+            totais[acao.tipo] = (quantidade + 1, arquivos + acao.arquivos, tamanho + acao.tamanho)
+        return dict(sorted(totais.items(), key=lambda item: _FASES[item[0]]))
+
+    def relatorio(self):
+        """Linhas do resumo do plano (o que seria feito e quanto)."""
+        linhas = [f"📝 Plano: {self.descricao}"]
+        for tipo, (quantidade, arquivos, tamanho) in self.totais().items():
+            if tipo == CRIAR_PASTA or not self.medido:
+                linhas.append(f"{_DESCRICOES[tipo]}: {quantidade}")
+            else:
+                linhas.append(f"{_DESCRICOES[tipo]}: {quantidade} ({arquivos} arquivos, {formatar_bytes(tamanho)})")
+        if self.ignorados:
+            linhas.append(f"⏭️ Itens ignorados (já existem): {self.ignorados}")
+        if self.medido:
+            linhas.append(f"💾 Total estimado: {formatar_bytes(self.bytes_estimados)}")
+        linhas.extend(self.observacoes)
+        return linhas
+
+
+def executar_plano(plano, trabalhadores=TRABALHADORES_COPIA, modo=MODO_PADRAO, ao_progredir=None, diario=None,
+                   metricas=None):
+    """Executa o plano e retorna ``(erros, estatisticas_copia)``.
+
+    As pastas são criadas primeiro e as movimentações seguem em ordem de pasta
+    de destino. As transferências, também agrupadas por destino, vão para um
+    ``AgendadorCopia`` (em paralelo, no ``modo`` escolhido). Uma ação que falha
+    é registrada e contada, e as demais continuam. Com um ``Diario``, cada ação
+    concluída é registrada e as movimentações já registradas são puladas.
+
+    Com ``Metricas``, o tempo de cada tipo de ação vira uma etapa (para as
+    transferências, o tempo de agendá-las) e a espera final pelas cópias fica
+    em ``aguardar_copias``.
+    """
+    if metricas is None:
+        metricas = Metricas()
+    acoes = sorted(plano.acoes, key=lambda acao: (_FASES[acao.tipo], str(acao.destino.parent), acao.destino.name))
+    concluidas = diario.concluidas(MOVER) if diario is not None else set()
+    erros = 0
+    copia = AgendadorCopia(trabalhadores, modo, diario=diario, metricas=metricas)
+    log = LogPeriodico(f"📦 {plano.descricao}")
+    try:
+        for i, acao in enumerate(acoes, start=1):
+            inicio = time.perf_counter()
+            try:
+                if acao.tipo == CRIAR_PASTA:
+                    if not acao.destino.is_dir():
+                        acao.destino.mkdir(parents=True)
+                        if diario is not None:
+                            diario.registrar(CRIAR_PASTA, destino=acao.destino)
+                elif acao.tipo == MOVER:
+                    if (os.path.abspath(acao.origem), os.path.abspath(acao.destino)) in concluidas:
+                        continue
+                    shutil.move(str(acao.origem), str(acao.destino))
+                    if diario is not None:
+                        diario.registrar(MOVER, acao.origem, acao.destino)
+                    logging.debug("✔️ Movido: %s → %s/", acao.origem.name, acao.destino.parent.name)
+                elif acao.tipo == COPIAR_ARQUIVO:
+                    copia.copiar_arquivo(acao.origem, acao.destino)
+                    logging.debug("📋 Arquivo enviado para transferência: %s → %s", acao.origem.name, acao.destino.parent)
+                else:
+                    copia.copiar_arvore(acao.origem, acao.destino, arvore=acao.arvore)
+                    logging.debug("📁 Pasta enviada para transferência: %s → %s", acao.origem.name, acao.destino.parent)
+            except Exception as e:
+                logging.error(f"❌ Erro em {acao.tipo} {acao.destino}: {e}")
+                erros += 1
+            else:
+                log.contar(_EVENTOS_LOG[acao.tipo])
+            finally:
+                metricas.somar(acao.tipo, time.perf_counter() - inicio)
+                metricas.contar(itens=1)
+                if ao_progredir:
+                    ao_progredir(i, len(acoes), f"Processando: {acao.destino.name}")
+    finally:
+        log.encerrar()
+        with metricas.etapa("aguardar_copias", itens=0):
+            estatisticas = copia.aguardar()
+    return erros + estatisticas.erros, estatisticas
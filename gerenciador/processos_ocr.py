@@ -0,0 +1,181 @@
+"""OCR em vários processos para máquinas sem GPU.
+
+Na CPU um único ``easyocr.Reader`` processa as imagens uma de cada vez e não
+ocupa todos os núcleos. Aqui cada processo do pool carrega o próprio leitor,
+com o número de threads do torch fixado para os processos não disputarem os
+núcleos, e recebe lotes de imagens; os resultados voltam para o processo
+principal na ordem em que ficam prontos. ``MotorOCRProcessos`` tem a mesma
+interface do ``MotorOCR``, então ``renomear_imagens`` (e a vigia de pasta)
+continuam aplicando as renomeações numa única thread, com a mesma forma de
+evitar nomes repetidos.
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .cache_ocr import hash_conteudo
+from .metricas import Metricas
+from .ocr import IDIOMAS_PADRAO, TAMANHO_LOTE_PADRAO, MotorOCR, ResultadoOCR, criar_leitor
+
+# Lotes enviados por processo antes de esperar resultados
+LOTES_POR_PROCESSO = 2
+
+_motor_do_processo = None  # MotorOCR de cada processo do pool, criado em _iniciar_processo
+
+
+def processos_padrao():
+    """Um processo por núcleo."""
+    return os.cpu_count() or 1
+
+
+def _iniciar_processo(idiomas, threads, tamanho_lote, regiao, preprocessamento):
+    global _motor_do_processo
+    # Antes de importar o torch: as bibliotecas de álgebra leem estas variáveis na carga
+    for variavel in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[variavel] = str(threads)
+    import torch
+
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # Já definido neste processo
+    try:
+        import cv2
+        cv2.setNumThreads(1)
+    except ImportError:
+        pass
+
+    reader, _ = criar_leitor(idiomas, gpu=False)
+    _motor_do_processo = MotorOCR(reader, tamanho_lote=tamanho_lote, trabalhadores=1, regiao=regiao,
+                                  preprocessamento=preprocessamento)
+
+
+def _reconhecer_lote(arquivos, conteudos=None):
+    """Roda no processo do pool: ``(resultados, tempos das etapas)`` do lote.
+
+    ``conteudos`` são as imagens que o processo principal já leu (para consultar o cache).
+    """
+    metricas = Metricas()
+    resultados = list(_motor_do_processo.reconhecer(arquivos, metricas, conteudos))
+    return resultados, metricas.tempos_etapas()
+
+
+class MotorOCRProcessos:
+    """Pipeline de OCR distribuído em ``processos`` processos, cada um com seu leitor na CPU.
+
+    ``threads_por_processo`` (padrão: núcleos / processos) fixa as threads do
+    torch em cada processo. Cada processo aprende a própria ``RegiaoInteresse``
+    (uma cópia da recebida) e aplica o ``PreProcessamento``. O ``CacheOCR`` é
+    consultado e atualizado só no processo principal; as imagens lidas para a
+    consulta seguem com o lote, então cada arquivo é lido do disco uma vez.
+    Os processos (e os modelos carregados) são criados no primeiro
+    ``reconhecer`` e ficam disponíveis até ``fechar()``.
+    """
+
+    def __init__(self, idiomas=IDIOMAS_PADRAO, processos=None, threads_por_processo=None,
+                 tamanho_lote=TAMANHO_LOTE_PADRAO, regiao=None, cache=None, preprocessamento=None):
+        self.idiomas = list(idiomas)
+        self.processos = max(1, int(processos or processos_padrao()))
+        self.threads_por_processo = max(1, int(threads_por_processo or (os.cpu_count() or 1) // self.processos))
+        self.tamanho_lote = max(1, int(tamanho_lote))
+        self.regiao = regiao
+        self.cache = cache
+        self.preprocessamento = preprocessamento
+        self._executor = None
+
+    def _obter_executor(self):
+        if self._executor is None:
+            logging.info(f"🧵 OCR em {self.processos} processos ({self.threads_por_processo} threads cada)")
+            # spawn: o torch não se dá bem com fork depois de criar threads (e é o único modo no Windows)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processos, mp_context=multiprocessing.get_context("spawn"),
+                initializer=_iniciar_processo,
+                initargs=(self.idiomas, self.threads_por_processo, self.tamanho_lote, self.regiao,
+                          self.preprocessamento))
+        return self._executor
+
+    def _consultar_cache(self, arquivo, metricas):
+        """``(chave, dados, resultado)``; ``resultado`` vem preenchido em acerto no cache ou erro de leitura."""
+        try:
+            with metricas.etapa("leitura"):
+                dados = arquivo.read_bytes()
+        except OSError as e:
+            return None, None, ResultadoOCR(arquivo, erro=str(e))
+        with metricas.etapa("cache"):
+            chave = hash_conteudo(dados)
+            em_cache = self.cache.obter(chave)
+        if em_cache is None:
+            return chave, dados, None
+        texto, id_jogador = em_cache
+        return chave, None, ResultadoOCR(arquivo, texto=texto, id_jogador=id_jogador, origem="cache")
+
+    def _colher(self, enviados, chaves, metricas):
+        """Espera ao menos um lote terminar e gera os resultados dos lotes prontos."""
+        prontos, _ = wait(enviados, return_when=FIRST_COMPLETED)
+        for futuro in prontos:
+            lote = enviados.pop(futuro)
+            try:
+                resultados, etapas = futuro.result()
+            except Exception as e:
+                # Processo encerrado à força ou falha ao carregar o modelo: o lote inteiro fica com erro
+                for arquivo in lote:
+                    yield ResultadoOCR(arquivo, erro=str(e) or type(e).__name__)
+                continue
+            metricas.incorporar(etapas)
+            for resultado in resultados:
+                chave = chaves.pop(resultado.arquivo, None)
+                if chave is not None and resultado.erro is None:
+                    with metricas.etapa("cache"):
+                        self.cache.guardar(chave, resultado.texto, resultado.id_jogador)
+                yield resultado
+
+    def reconhecer(self, arquivos, metricas=None):
+        """Gera um ResultadoOCR por arquivo, na ordem em que os lotes ficam prontos nos processos."""
+        if metricas is None:
+            metricas = Metricas()
+        executor = self._obter_executor()
+        tamanho_lote = self.tamanho_lote
+        if hasattr(arquivos, "__len__"):
+            # Poucas imagens: lotes menores para nenhum processo ficar parado no fim
+            por_lote = -(-len(arquivos) // (self.processos * LOTES_POR_PROCESSO))
+            tamanho_lote = max(1, min(tamanho_lote, por_lote))
+        enviados = {}  # futuro -> lote
+        chaves = {}
+        lote, conteudos = [], {}
+        try:
+            for arquivo in arquivos:
+                if self.cache is not None:
+                    chave, dados, resultado = self._consultar_cache(arquivo, metricas)
+                    if resultado is not None:
+                        yield resultado
+                        continue
+                    chaves[arquivo] = chave
+                    conteudos[arquivo] = dados
+                lote.append(arquivo)
+                if len(lote) < tamanho_lote:
+                    continue
+                enviados[executor.submit(_reconhecer_lote, lote, conteudos)] = lote
+                lote, conteudos = [], {}
+                while len(enviados) >= self.processos * LOTES_POR_PROCESSO:
+                    yield from self._colher(enviados, chaves, metricas)
+            if lote:
+                enviados[executor.submit(_reconhecer_lote, lote, conteudos)] = lote
+            while enviados:
+                yield from self._colher(enviados, chaves, metricas)
+        finally:
+            for futuro in enviados:
+                futuro.cancel()
+
+    def fechar(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
@@ -0,0 +1,120 @@
+"""Configuração do log: fila assíncrona, arquivo rotativo e resumos periódicos.
+
+As mensagens vão para uma fila (``QueueHandler``) e uma thread separada
+(``QueueListener``) as escreve no console e num arquivo rotativo, para que a
+escrita no terminal ou no disco não pare os laços das operações. O detalhe por
+item (cada arquivo movido, cada face.fpk encontrada) fica em DEBUG; no INFO,
+``LogPeriodico`` registra de tempos em tempos um resumo agregado.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from .cache_ocr import diretorio_cache_padrao
+
+FORMATO_LOG = '%(asctime)s - %(levelname)s - %(message)s'
+# Tamanho de cada arquivo do log e quantos arquivos antigos são mantidos
+TAMANHO_ARQUIVO_LOG = 5 * 2**20
+ARQUIVOS_LOG_ANTIGOS = 3
+# Segundos entre os resumos agregados no INFO
+INTERVALO_RESUMO_LOG = 10
+
+_ouvinte = None
+
+
+def arquivo_log_padrao():
+    """``<cache>/logs/gerenciador.log``."""
+    return diretorio_cache_padrao() / "logs" / "gerenciador.log"
+
+
+def configurar_log(nivel=logging.INFO, arquivo=None, console=True):
+    """Envia o log da aplicação por uma fila para o console e um arquivo rotativo.
+
+    Sem ``arquivo`` usa ``arquivo_log_padrao()``; ``arquivo=False`` desliga o
+    arquivo. Pode ser chamada de novo (ex.: para mudar o nível): a
+    configuração anterior é encerrada. O resto da fila é escrito na saída do
+    programa.
+    """
+    global _ouvinte
+    encerrar_log()
+
+    formatador = logging.Formatter(FORMATO_LOG)
+    destinos = []
+    if console:
+        destinos.append(logging.StreamHandler())
+    if arquivo is not False:
+        caminho = Path(arquivo) if arquivo else arquivo_log_padrao()
+        try:
+            caminho.parent.mkdir(parents=True, exist_ok=True)
+            destinos.append(logging.handlers.RotatingFileHandler(
+                caminho, maxBytes=TAMANHO_ARQUIVO_LOG, backupCount=ARQUIVOS_LOG_ANTIGOS, encoding="utf-8"))
+        except OSError as e:
+            logging.getLogger(__name__).warning(f"⚠️ Log em arquivo desativado ({caminho}): {e}")
+    for destino in destinos:
+        destino.setFormatter(formatador)
+
+    fila = queue.SimpleQueue()
+    raiz = logging.getLogger()
+    for handler in raiz.handlers[:]:
+        raiz.removeHandler(handler)
+    raiz.addHandler(logging.handlers.QueueHandler(fila))
+    raiz.setLevel(nivel)
+
+    _ouvinte = logging.handlers.QueueListener(fila, *destinos, respect_handler_level=True)
+    _ouvinte.start()
+    return _ouvinte
+
+
+def encerrar_log():
+    """Escreve o que ainda está na fila e para a thread do log."""
+    global _ouvinte
+    if _ouvinte is not None:
+        _ouvinte.stop()
+        for destino in _ouvinte.handlers:
+            destino.close()
+        _ouvinte = None
+
+
+atexit.register(encerrar_log)
+
+
+class LogPeriodico:
+    """Conta eventos por item e registra no INFO um resumo a cada ``intervalo`` segundos.
+
+    ``contar("movidos")`` substitui uma linha por arquivo; ``encerrar()``
+    registra o que foi contado desde o último resumo. Pode ser usado de várias
+    threads.
+    """
+
+    def __init__(self, titulo, intervalo=INTERVALO_RESUMO_LOG, logger=None):
+        self.titulo = titulo
+        self.intervalo = intervalo
+        self.logger = logger or logging.getLogger()
+        self.totais = Counter()
+        self._desde_ultimo = 0
+        self._ultimo = time.monotonic()
+        self._lock = threading.Lock()
+
+    def contar(self, evento, quantidade=1):
+        with self._lock:
+            self.totais[evento] += quantidade
+            self._desde_ultimo += quantidade
+            if time.monotonic() - self._ultimo >= self.intervalo:
+                self._registrar()
+
+    def _registrar(self):
+        if self._desde_ultimo and self.logger.isEnabledFor(logging.INFO):
+            totais = ", ".join(f"{total} {evento}" for evento, total in self.totais.items())
+            self.logger.info("%s: %s", self.titulo, totais)
+        self._desde_ultimo = 0
+        self._ultimo = time.monotonic()
+
+    def encerrar(self):
+        with self._lock:
+            self._registrar()
@@ -0,0 +1,191 @@
+"""Renomeações em lote com os nomes finais decididos na memória.
+
+Os nomes da pasta são lidos uma única vez; os nomes livres (``<id><ext>``,
+``<id>_1<ext>``, ...) são atribuídos a todas as imagens do lote sem consultar
+o disco, e as renomeações são aplicadas numa única passada, numa ordem em que
+o destino de cada uma já está livre. Trocas em ciclo (A→B, B→A) passam por um
+nome temporário. A ocupação dos nomes é comparada sem diferença de maiúsculas
+(como no Windows), e cada destino ainda é conferido no disco logo antes da
+renomeação, então nenhum arquivo é sobrescrito.
+"""
+
+import os
+import re
+from collections import Counter
+from pathlib import Path
+
+# Sufixo do nome temporário usado para desfazer ciclos (não é extensão de imagem: a vigia de pasta o ignora)
+SUFIXO_TEMPORARIO = ".renomeando"
+
+
+def _chave(caminho):
+    return str(caminho).casefold()
+
+
+class NomesPasta:
+    """Nomes ocupados de uma pasta, lidos uma vez, e a reserva de nomes livres por ID.
+
+    ``liberar`` são nomes que vão sair da pasta (as imagens do lote) e podem
+    ser reaproveitados.
+    """
+
+    def __init__(self, pasta, liberar=()):
+        self.pasta = Path(pasta)
+        # Contagem por nome sem diferença de maiúsculas: no Linux, liberar 'A.png' não libera 'a.png'
+        self._ocupados = Counter(nome.casefold() for nome in os.listdir(self.pasta))
+        self._ocupados.subtract(nome.casefold() for nome in liberar)
+        self._proximo = {}  # (id, extensão) -> primeiro contador ainda não testado
+
+    def livre(self, nome):
+        return self._ocupados[nome.casefold()] <= 0
+
+    def ocupar(self, nome):
+        self._ocupados[nome.casefold()] = max(self._ocupados[nome.casefold()], 0) + 1
+
+    def reservar(self, id_jogador, extensao):
+        """Reserva e retorna o primeiro nome livre para o ID: ``<id><ext>``, ``<id>_1<ext>``, ..."""
+        chave = (id_jogador, extensao.casefold())
+        contador = self._proximo.get(chave, 0)
+        while True:
+            nome = f"{id_jogador}_{contador}{extensao}" if contador else f"{id_jogador}{extensao}"
+            contador += 1
+            if self.livre(nome):
+                break
+        # Os nomes antes do contador estão ocupados e nenhum nome é liberado depois: o próximo começa daqui
+        self._proximo[chave] = contador
+        self.ocupar(nome)
+        return self.pasta / nome
+
+
+def _eh_nome_do_id(nome, id_jogador, extensao):
+    """Indica se ``nome`` já é um dos nomes do ID (``<id><ext>`` ou ``<id>_<n><ext>``)."""
+    return re.fullmatch(rf"{re.escape(id_jogador)}(?:_\d+)?{re.escape(extensao)}", nome) is not None
+
+
+def planejar_renomeacoes(pasta, pedidos):
+    """Atribui o nome final de cada ``(arquivo, id_jogador)``; retorna ``[(arquivo, novo)]`` na ordem dos pedidos.
+
+    A extensão é mantida (em minúsculas). Um arquivo que já tem um nome do
+    próprio ID (ex.: ao reprocessar uma pasta) fica com ele (``novo ==
+    arquivo``); os demais recebem o primeiro nome livre, considerando os
+    nomes já ocupados na pasta e os reservados no próprio lote.
+    """
+    nomes = NomesPasta(pasta, liberar=[arquivo.name for arquivo, _ in pedidos])
+    destinos = {}
+    for arquivo, id_jogador in pedidos:
+        if _eh_nome_do_id(arquivo.name, id_jogador, arquivo.suffix.lower()) and nomes.livre(arquivo.name):
+            nomes.ocupar(arquivo.name)
+            destinos[arquivo] = arquivo
+    for arquivo, id_jogador in pedidos:
+        if arquivo not in destinos:
+            destinos[arquivo] = nomes.reservar(id_jogador, arquivo.suffix.lower())
+    return [(arquivo, destinos[arquivo]) for arquivo, _ in pedidos]
+
+
+def _nome_temporario(origem):
+    contador = 0
+    while True:
+        temporario = origem.with_name(f".{origem.name}.{contador}{SUFIXO_TEMPORARIO}")
+        if not os.path.lexists(temporario):
+            return temporario
+        contador += 1
+
+
+def _destino_ocupado(origem, destino):
+    """Indica se ``destino`` existe no disco e não é a própria ``origem`` (troca só de maiúsculas no Windows)."""
+    if not os.path.lexists(destino):
+        return False
+    try:
+        return not (_chave(origem) == _chave(destino) and os.path.samefile(origem, destino))
+    except OSError:
+        return True
+
+
+def executar_renomeacoes(renomeacoes, ao_renomear=None):
+    """Aplica ``[(origem, destino)]`` sem sobrescrever; retorna ``[(origem, destino, erro)]`` (``erro`` None se deu certo).
+
+    Uma renomeação espera as outras cuja origem ocupa o seu destino (sem
+    diferença de maiúsculas, como no Windows); as que não esperam ninguém são
+    aplicadas primeiro e liberam as seguintes. Se só restam ciclos, um arquivo
+    do ciclo passa antes por um nome temporário. Antes de cada renomeação o
+    destino é conferido no disco: se existir (ex.: criado por outro programa),
+    a renomeação fica com erro em vez de sobrescrevê-lo. Se uma renomeação
+    falha, as que esperavam pelo seu lugar também ficam com erro, sem tocar
+    nos arquivos. ``ao_renomear(origem, destino)`` é chamado após cada
+    renomeação feita no disco, inclusive as de e para o nome temporário (para
+    o diário poder desfazer na ordem inversa).
+    """
+    # Cada renomeação é identificada pela posição: a origem muda quando ela passa pelo nome temporário
+    movimentos = [[origem, destino, origem] for origem, destino in renomeacoes if origem != destino]
+    pendentes = set(range(len(movimentos)))
+    por_nome = {}  # nome sem diferença de maiúsculas -> renomeações cuja origem está nele
+    for indice, (origem, _, _) in enumerate(movimentos):
+        por_nome.setdefault(_chave(origem), []).append(indice)
+    esperando = {}  # renomeação -> renomeações que esperam a sua origem ficar livre
+    bloqueios = {}  # renomeação -> quantas origens ainda ocupam o seu destino
+    prontas = []
+    for indice, (_, destino, _) in enumerate(movimentos):
+        ocupantes = [outro for outro in por_nome.get(_chave(destino), ()) if outro != indice]
+        for ocupante in ocupantes:
+            esperando.setdefault(ocupante, []).append(indice)
+        bloqueios[indice] = len(ocupantes)
+        if not ocupantes:
+            prontas.append(indice)
+    resultados = []
+
+    def liberar(indice):
+        for seguinte in esperando.pop(indice, ()):
+            if seguinte in pendentes:
+                bloqueios[seguinte] -= 1
+                if not bloqueios[seguinte]:
+                    prontas.append(seguinte)
+
+    def falhar(indice, erro):
+        falhas = [(indice, erro)]
+        while falhas:
+            indice, erro = falhas.pop()
+            if indice not in pendentes:
+                continue
+            pendentes.discard(indice)
+            origem, destino, original = movimentos[indice]
+            resultados.append((original, destino, erro))
+            falhas.extend((seguinte, f"{origem.name} continua ocupado") for seguinte in esperando.pop(indice, ()))
+
+    def renomear(indice, destino):
+        origem = movimentos[indice][0]
+        if _destino_ocupado(origem, destino):
+            falhar(indice, f"{destino.name} já existe")
+            return False
+        try:
+            origem.rename(destino)
+        except OSError as e:
+            falhar(indice, str(e))
+            return False
+        if ao_renomear:
+            ao_renomear(origem, destino)
+        return True
+
+    while pendentes:
+        while prontas:
+            indice = prontas.pop()
+            if indice not in pendentes:
+                continue
+            _, destino, original = movimentos[indice]
+            if renomear(indice, destino):
+                pendentes.discard(indice)
+                resultados.append((original, destino, None))
+                liberar(indice)
+
+        if pendentes:
+            # Só restam ciclos (e cadeias presas neles): um arquivo que alguém espera vai para um nome temporário
+            indice = next((indice for indice in pendentes
+                           if any(seguinte in pendentes for seguinte in esperando.get(indice, ()))), None)
+            if indice is None:
+                for indice in list(pendentes):
+                    falhar(indice, "renomeação bloqueada")
+                break
+            temporario = _nome_temporario(movimentos[indice][0])
+            if renomear(indice, temporario):
+                movimentos[indice][0] = temporario
+                liberar(indice)
+    return resultados
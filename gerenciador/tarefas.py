@@ -0,0 +1,116 @@
+"""Tarefas em segundo plano com progresso por fila e cancelamento.
+
+A operação roda numa thread própria e só publica eventos. Quem mostra o
+progresso (a interface Tk) consome a fila no próprio ritmo e junta vários
+eventos numa única atualização; perguntas ao usuário no meio da operação são
+feitas com ``na_interface``, que executa a função na thread consumidora.
+"""
+
+import queue
+import threading
+
+from .metricas import Metricas
+
+
+class Cancelado(Exception):
+    """A tarefa foi cancelada pelo usuário."""
+
+
+class _Pedido:
+    def __init__(self, funcao, args):
+        self.funcao = funcao
+        self.args = args
+        self.resultado = None
+        self.erro = None
+        self.atendido = threading.Event()
+
+
+class Tarefa:
+    """Executa ``funcao(tarefa)`` numa thread, com progresso e cancelamento.
+
+    A função informa o andamento por ``tarefa.ao_progredir(atual, total,
+    status)`` (o mesmo formato das operações). Depois de ``cancelar``, a
+    próxima chamada de ``ao_progredir`` levanta ``Cancelado``, que encerra a
+    tarefa pelo caminho normal de exceções (diários e caches são fechados).
+    ``tarefa.metricas`` é repassado à operação para medir suas etapas.
+    """
+
+    def __init__(self, funcao, nome="tarefa", metricas=None):
+        self.funcao = funcao
+        self.nome = nome
+        self.metricas = metricas if metricas is not None else Metricas(nome)
+        self.resultado = None
+        self.erro = None
+        self.cancelada = False
+        self._eventos = queue.Queue()
+        self._pedidos = queue.Queue()
+        self._cancelar = threading.Event()
+        self._terminada = threading.Event()
+        self._thread = threading.Thread(target=self._executar, name=f"tarefa-{nome}", daemon=True)
+
+    def iniciar(self):
+        self._thread.start()
+        return self
+
+    @property
+    def terminada(self):
+        return self._terminada.is_set()
+
+    def aguardar(self, timeout=None):
+        """Espera o fim da tarefa; retorna True se ela terminou."""
+        return self._terminada.wait(timeout)
+
+    def cancelar(self):
+        self._cancelar.set()
+
+    def verificar_cancelamento(self):
+        """Levanta ``Cancelado`` se o cancelamento foi pedido."""
+        if self._cancelar.is_set():
+            raise Cancelado()
+
+    def ao_progredir(self, atual, total, status=""):
+        self.verificar_cancelamento()
+        self._eventos.put((atual, total, status))
+
+    def progresso_recente(self):
+        """Esvazia a fila de progresso e retorna só o evento mais recente (ou None)."""
+        ultimo = None
+        while True:
+            try:
+                ultimo = self._eventos.get_nowait()
+            except queue.Empty:
+                return ultimo
+
+    def na_interface(self, funcao, *args):
+        """Executa ``funcao(*args)`` na thread consumidora e retorna o resultado (bloqueia a tarefa)."""
+        pedido = _Pedido(funcao, args)
+        self._pedidos.put(pedido)
+        pedido.atendido.wait()
+        if pedido.erro is not None:
+            raise pedido.erro
+        return pedido.resultado
+
+    def atender_pedidos(self):
+        """Chamado pela thread consumidora: executa os pedidos de ``na_interface`` pendentes."""
+        while True:
+            try:
+                pedido = self._pedidos.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                pedido.resultado = pedido.funcao(*pedido.args)
+            except Exception as e:
+                pedido.erro = e
+            finally:
+                pedido.atendido.set()
+
+    def _executar(self):
+        try:
+            self.resultado = self.funcao(self)
+        except Cancelado:
+            self.cancelada = True
+        except Exception as e:
+            self.erro = e
+        finally:
+            self.metricas.encerrar()
+            self._terminada.set()
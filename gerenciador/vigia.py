@@ -0,0 +1,273 @@
+"""Vigia de pasta: renomeação contínua das imagens que chegam.
+
+No Linux as chegadas vêm do inotify (arquivo fechado após escrita ou movido
+para a pasta); nos demais sistemas, ou se o inotify falhar, a pasta é
+varrida periodicamente. Uma imagem só é processada depois de ficar
+``ESPERA_ESTAVEL`` segundos sem mudar de tamanho nem de data (o programa que
+a grava já terminou), e todas as que ficam prontas juntas vão num único lote
+para o OCR, com o modelo carregado uma vez para a sessão inteira.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+from .metricas import Metricas
+from .ocr import EXTENSOES_IMAGEM, ResumoRenomeacao, renomear_imagens
+
+# Segundos sem mudança (tamanho e data) para uma imagem ser considerada completa
+ESPERA_ESTAVEL = 0.5
+# Intervalo da varredura quando não há inotify
+INTERVALO_VARREDURA = 0.5
+# Intervalo máximo entre verificações de parada/cancelamento enquanto a pasta está parada
+INTERVALO_OCIOSO = 1.0
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_Q_OVERFLOW = 0x00004000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_CABECALHO_EVENTO = struct.Struct("iIII")
+
+
+class _FonteInotify:
+    """Nomes fechados após escrita ou movidos para a pasta, via inotify (só Linux)."""
+
+    def __init__(self, pasta):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            erro = ctypes.get_errno()
+            raise OSError(erro, os.strerror(erro))
+        if libc.inotify_add_watch(self._fd, os.fsencode(pasta), _IN_CLOSE_WRITE | _IN_MOVED_TO) < 0:
+            erro = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(erro, os.strerror(erro))
+
+    def ler(self, timeout):
+        """``(nomes, transbordou)``: nomes com eventos; ``transbordou`` se o kernel descartou eventos."""
+        prontos, _, _ = select.select([self._fd], [], [], timeout)
+        if not prontos:
+            return [], False
+        try:
+            dados = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return [], False
+
+        nomes, transbordou, posicao = [], False, 0
+        while posicao + _CABECALHO_EVENTO.size <= len(dados):
+            _, mascara, _, tamanho = _CABECALHO_EVENTO.unpack_from(dados, posicao)
+            posicao += _CABECALHO_EVENTO.size
+            nome = dados[posicao:posicao + tamanho].rstrip(b"\0")
+            posicao += tamanho
+            if mascara & _IN_Q_OVERFLOW:
+                transbordou = True
+            elif nome:
+                nomes.append(os.fsdecode(nome))
+        return nomes, transbordou
+
+    def fechar(self):
+        os.close(self._fd)
+
+
+class _FonteVarredura:
+    """Nomes novos ou alterados desde a varredura anterior da pasta."""
+
+    def __init__(self, pasta, intervalo=INTERVALO_VARREDURA):
+        self.pasta = pasta
+        self.intervalo = intervalo
+        self._assinaturas = _assinaturas(pasta)
+
+    def ler(self, timeout):
+        time.sleep(min(timeout, self.intervalo))
+        atuais = _assinaturas(self.pasta)
+        nomes = [nome for nome, assinatura in atuais.items() if self._assinaturas.get(nome) != assinatura]
+        self._assinaturas = atuais
+        return nomes, False
+
+    def fechar(self):
+        pass
+
+
+def _assinaturas(pasta):
+    """``{nome: (tamanho, mtime_ns)}`` dos arquivos da pasta."""
+    assinaturas = {}
+    with os.scandir(pasta) as entradas:
+        for entrada in entradas:
+            try:
+                if entrada.is_file():
+                    info = entrada.stat()
+                    assinaturas[entrada.name] = (info.st_size, info.st_mtime_ns)
+            except OSError:
+                continue  # Removido durante a varredura
+    return assinaturas
+
+
+def _assinatura(caminho):
+    try:
+        info = os.stat(caminho)
+    except OSError:
+        return None
+    return info.st_size, info.st_mtime_ns
+
+
+class VigiaPasta:
+    """Entrega em lotes as imagens que chegam completas a uma pasta.
+
+    As imagens já presentes ao iniciar são ignoradas (a não ser com
+    ``incluir_existentes``). ``ignorar(nome)`` marca um arquivo que o próprio
+    programa vai criar (o nome novo de uma renomeação) para não ser tratado
+    como chegada. Com ``usar_inotify=False`` a pasta é sempre varrida.
+    """
+
+    def __init__(self, pasta, incluir_existentes=False, espera=ESPERA_ESTAVEL, usar_inotify=True,
+                 intervalo=INTERVALO_VARREDURA):
+        self.pasta = Path(pasta)
+        self.espera = espera
+        self._pendentes = {}  # nome -> (assinatura, instante da última mudança)
+        self._ignorados = set()
+        existentes = {nome for nome in _assinaturas(self.pasta) if self._eh_imagem(nome)}
+        self._conhecidos = set() if incluir_existentes else set(existentes)
+        self.fonte = None
+        if usar_inotify and sys.platform.startswith("linux"):
+            try:
+                self.fonte = _FonteInotify(self.pasta)
+            except OSError as e:
+                logging.warning(f"⚠️ inotify indisponível ({e}); vigiando por varredura")
+        if self.fonte is None:
+            self.fonte = _FonteVarredura(self.pasta, intervalo)
+        logging.info(f"👀 Vigiando {self.pasta} ({'inotify' if isinstance(self.fonte, _FonteInotify) else 'varredura'})")
+        if incluir_existentes:
+            self._chegaram(existentes)
+
+    @staticmethod
+    def _eh_imagem(nome):
+        return nome.lower().endswith(EXTENSOES_IMAGEM)
+
+    def ignorar(self, nome):
+        self._ignorados.add(nome)
+        self._conhecidos.add(nome)
+
+    def processadas(self, renomeacoes, restantes):
+        """Atualiza os nomes conhecidos após um lote: ``renomeacoes`` ``(antigo, novo)`` e os não renomeados."""
+        for antigo, novo in renomeacoes:
+            self._conhecidos.discard(Path(antigo).name)
+            self._conhecidos.add(Path(novo).name)
+        self._conhecidos.update(Path(arquivo).name for arquivo in restantes)
+
+    def _chegaram(self, nomes):
+        agora = time.monotonic()
+        for nome in nomes:
+            if nome in self._ignorados:
+                self._ignorados.discard(nome)
+                continue
+            if self._eh_imagem(nome):
+                self._pendentes[nome] = (_assinatura(self.pasta / nome), agora)
+
+    def _prontas(self):
+        """Retira dos pendentes as imagens estáveis há ``espera`` segundos."""
+        agora = time.monotonic()
+        prontas = []
+        for nome, (assinatura, desde) in list(self._pendentes.items()):
+            atual = _assinatura(self.pasta / nome)
+            if atual is None:
+                del self._pendentes[nome]  # Removida ou renomeada antes de ficar pronta
+            elif atual != assinatura:
+                self._pendentes[nome] = (atual, agora)
+            elif agora - desde >= self.espera and atual[0] > 0:
+                del self._pendentes[nome]
+                prontas.append(self.pasta / nome)
+        return sorted(prontas)
+
+    def aguardar_lote(self, timeout=INTERVALO_OCIOSO):
+        """Espera até ``timeout`` segundos por imagens completas; retorna a lista (vazia se nenhuma)."""
+        limite = time.monotonic() + timeout
+        while True:
+            restante = limite - time.monotonic()
+            espera = min(restante, self.espera / 2) if self._pendentes else restante
+            nomes, transbordou = self.fonte.ler(max(0.0, espera))
+            if transbordou:
+                logging.warning("⚠️ Eventos da pasta perdidos; procurando imagens novas na pasta inteira")
+                nomes = [nome for nome in _assinaturas(self.pasta) if nome not in self._conhecidos]
+            self._chegaram(nomes)
+            prontas = self._prontas()
+            if prontas or time.monotonic() >= limite:
+                return prontas
+
+    def fechar(self):
+        self.fonte.fechar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+def _acumular(total, resumo):
+    total.total += resumo.total
+    total.renomeados += resumo.renomeados
+    total.sem_id += resumo.sem_id
+    total.erros += resumo.erros
+    total.ja_nomeados += resumo.ja_nomeados
+    total.renomeacoes.extend(resumo.renomeacoes)
+
+
+def vigiar_pasta(pasta, motor, ao_progredir=None, diario=None, metricas=None, parar=None, incluir_existentes=False,
+                 usar_inotify=True):
+    """Renomeia pelo ID do jogador as imagens que chegam à pasta até ``parar`` ser acionado.
+
+    Cada lote de imagens completas passa por ``renomear_imagens`` com o mesmo
+    ``motor`` (modelo já carregado, região aprendida e cache preservados).
+    ``ao_progredir(atual, None, status)`` é chamado a cada imagem e também
+    periodicamente enquanto não chega nada, então pode interromper a vigia
+    levantando uma exceção (como o ``Cancelado`` das tarefas); ``parar`` é um
+    ``threading.Event`` opcional e Ctrl+C também encerra a vigia. O fim da
+    sessão é marcado no ``diario`` uma única vez, ao encerrar. Retorna o
+    ``ResumoRenomeacao`` da sessão.
+    """
+    if metricas is None:
+        metricas = Metricas()
+    parar = parar if parar is not None else threading.Event()
+    resumo = ResumoRenomeacao()
+    inicio = time.time()
+
+    def progresso_do_lote(atual, total, resultado):
+        if ao_progredir:
+            ao_progredir(resumo.total + atual, None, f"Lendo: {resultado.arquivo.name}")
+
+    with VigiaPasta(pasta, incluir_existentes=incluir_existentes, usar_inotify=usar_inotify) as vigia:
+        try:
+            while not parar.is_set():
+                with metricas.etapa("espera_chegada", itens=0):
+                    lote = vigia.aguardar_lote()
+                if not lote:
+                    if ao_progredir:
+                        ao_progredir(resumo.total, None, "Aguardando imagens novas...")
+                    continue
+
+                logging.info(f"📥 {len(lote)} imagens novas")
+                resultado_lote = renomear_imagens(pasta, motor, progresso_do_lote, diario=diario, metricas=metricas,
+                                                  arquivos=lote, concluir_diario=False)
+                for _, novo in resultado_lote.renomeacoes:
+                    vigia.ignorar(Path(novo).name)
+                renomeadas = {Path(antigo).name for antigo, _ in resultado_lote.renomeacoes}
+                vigia.processadas(resultado_lote.renomeacoes,
+                                  [arquivo for arquivo in lote if arquivo.name not in renomeadas])
+                _acumular(resumo, resultado_lote)
+        except KeyboardInterrupt:
+            logging.info("⏹️ Vigia interrompida pelo usuário")
+        finally:
+            if diario is not None:
+                diario.concluir()
+
+    resumo.tempo = round(time.time() - inicio, 2)
+    logging.info(f"👀 Vigia encerrada: {resumo.renomeados} renomeadas, {resumo.sem_id} sem ID, {resumo.erros} erros")
+    return resumo
@@ -13,7 +13,6 @@ a = Analysis(
         'torchvision',
         'cv2',
         'PIL',
-        'pandas',
         'numpy',
         'tkinter',
         'tkinter.ttk',
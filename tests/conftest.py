@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Os testes importam o pacote direto da árvore (sem instalação)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
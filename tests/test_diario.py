@@ -0,0 +1,66 @@
+from gerenciador.diario import Diario, desfazer, execucao_incompleta, ler_diario
+
+
+def test_desfazer_na_ordem_inversa(tmp_path, monkeypatch):
+    origem = tmp_path / "origem"
+    origem.mkdir()
+    (origem / "a.txt").write_text("a")
+    (tmp_path / "1.png").write_text("img")
+    caminho = tmp_path / "diario.jsonl"
+
+    with Diario(caminho) as diario:
+        nova = tmp_path / "Nova"
+        nova.mkdir()
+        diario.registrar("criar_pasta", destino=nova)
+        (origem / "a.txt").rename(nova / "a.txt")
+        diario.registrar("mover", origem / "a.txt", nova / "a.txt")
+        (nova / "copia.txt").write_text("c")
+        diario.registrar("copiar", origem / "a.txt", nova / "copia.txt")
+        monkeypatch.chdir(tmp_path)
+        diario.registrar("renomear", "1.png", "55.png")  # relativo: gravado absoluto
+        (tmp_path / "1.png").rename(tmp_path / "55.png")
+        diario.concluir()
+
+    monkeypatch.chdir(origem)
+    resumo = desfazer(caminho)
+    assert (resumo.desfeitas, resumo.ignoradas, resumo.erros) == (4, 0, 0)
+    assert (origem / "a.txt").read_text() == "a"
+    assert (tmp_path / "1.png").exists() and not (tmp_path / "55.png").exists()
+    assert not (tmp_path / "Nova").exists()
+    assert not caminho.exists() and caminho.with_suffix(".desfeito.jsonl").exists()
+
+
+def test_desfazer_nao_sobrescreve_origem_ocupada(tmp_path):
+    caminho = tmp_path / "diario.jsonl"
+    (tmp_path / "b").write_text("movido")
+    (tmp_path / "a").write_text("novo")
+    with Diario(caminho) as diario:
+        diario.registrar("mover", tmp_path / "a", tmp_path / "b")
+    resumo = desfazer(caminho)
+    assert resumo.ignoradas == 1
+    assert (tmp_path / "a").read_text() == "novo" and (tmp_path / "b").read_text() == "movido"
+
+
+def test_retomar_le_o_anterior_e_guarda_o_substituido(tmp_path):
+    caminho = tmp_path / "diario.jsonl"
+    with Diario(caminho) as diario:
+        diario.registrar("criar_pasta", destino=tmp_path / "J")
+        diario.registrar("copiar", tmp_path / "o", tmp_path / "J" / "f")
+    assert execucao_incompleta(ler_diario(caminho))
+
+    with Diario(caminho, retomar=True) as diario:
+        assert diario.concluidas("copiar") == {(str(tmp_path / "o"), str(tmp_path / "J" / "f"))}
+        assert diario.pastas_incompletas() == {str(tmp_path / "J")}
+        diario.registrar("copiar_pasta", tmp_path / "o", tmp_path / "J")
+        diario.concluir()
+    assert not execucao_incompleta(ler_diario(caminho))
+
+    with Diario(caminho) as diario:
+        diario.registrar("criar_pasta", destino=tmp_path / "K")
+    assert caminho.with_suffix(".anterior.jsonl").exists()
+
+
+def test_linha_cortada_no_fim_e_ignorada(tmp_path):
+    caminho = tmp_path / "diario.jsonl"
+    caminho.write_text('{"acao": "inicio"}\n{"acao": "mover", "orig', encoding="utf-8")
+    assert ler_diario(caminho) == [{"acao": "inicio"}]
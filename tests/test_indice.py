@@ -0,0 +1,35 @@
+from gerenciador.indice import IndicePrefixos
+
+
+def _criar(diretorio, pastas=(), arquivos=()):
+    for nome in pastas:
+        (diretorio / nome).mkdir()
+    for nome in arquivos:
+        (diretorio / nome).write_text("x")
+
+
+def test_arquivo_pertence_ao_id_mais_longo(tmp_path):
+    _criar(tmp_path, arquivos=["1234_a.png", "12_b.png", "1299.png"])
+    for ids in (["12", "1234"], ["1234", "12"]):
+        indice = IndicePrefixos(tmp_path, ids)
+        assert [p.name for p in indice.retirar_arquivos("1234")] == ["1234_a.png"]
+        assert [p.name for p in indice.retirar_arquivos("12")] == ["1299.png", "12_b.png"]
+
+
+def test_pastas_pelo_nome_exato_e_itens_sem_dono(tmp_path):
+    _criar(tmp_path, pastas=["12", "123", "Maria"], arquivos=["99_x.png"])
+    indice = IndicePrefixos(tmp_path, ["12", " 5 ", ""])
+    assert indice.ids_com_pasta() == {"12"}
+    assert sorted(indice.pastas_sem_id) == ["123", "Maria"]
+    assert indice.arquivos_sem_dono == ["99_x.png"]
+    assert indice.dono("5_a.png") == "5"
+
+
+def test_retirar_remove_do_indice(tmp_path):
+    _criar(tmp_path, pastas=["7"], arquivos=["7_a.png"])
+    indice = IndicePrefixos(tmp_path, ["7"])
+    assert indice.retirar_pasta("7") == tmp_path / "7"
+    assert indice.retirar_pasta("7") is None
+    assert indice.retirar_arquivos("7") == [tmp_path / "7_a.png"]
+    assert indice.retirar_arquivos("7") == []
+    assert indice.ids_com_pasta() == set() and indice.ids_com_arquivos() == set()
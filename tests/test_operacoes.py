@@ -0,0 +1,106 @@
+import pytest
+
+from gerenciador import copia
+from gerenciador.diario import Diario, execucao_incompleta, ler_diario
+from gerenciador.fpk import MARCADOR_FACE
+from gerenciador.operacoes import conciliar_csv, copiar_pasta_completa_por_fpk, mover_por_csv
+
+
+@pytest.fixture(autouse=True)
+def _cache_temporario(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+
+
+def _csv(pasta, linhas):
+    arquivo = pasta / "ids.csv"
+    arquivo.write_text("Id;Name\n" + "".join(f"{id_};{nome}\n" for id_, nome in linhas), encoding="utf-8")
+    return arquivo
+
+
+def test_conciliacao_do_csv_com_o_diretorio(tmp_path):
+    for nome in ("1", "2", "77", "Ana"):
+        (tmp_path / nome).mkdir()
+    (tmp_path / "3_foto.png").write_text("")
+    (tmp_path / "88_orfao.png").write_text("")
+    arquivo = _csv(tmp_path, [("1", "Ana"), ("2", "Bia"), ("3", "Caio"), ("4", "Duda")])
+
+    conciliacao = conciliar_csv(arquivo)
+    assert conciliacao.ids_csv == 4
+    assert conciliacao.ids_sem_pasta == ["3", "4"]
+    assert conciliacao.ids_sem_itens == ["4"]
+    assert conciliacao.pastas_sem_linha == ["77"]  # 'Ana' é destino, não pasta de ID
+    assert conciliacao.arquivos_orfaos == ["88_orfao.png"]
+
+
+def test_mover_por_csv_retoma_execucao_interrompida(tmp_path):
+    for id_ in ("1", "2", "3"):
+        (tmp_path / id_).mkdir()
+        (tmp_path / id_ / "dados.txt").write_text(id_)
+    arquivo = _csv(tmp_path, [("1", "Ana"), ("2", "Bia"), ("3", "Caio")])
+    caminho = tmp_path / "diario.jsonl"
+
+    class Interrompido(Exception):
+        pass
+
+    def interromper(atual, total, status):
+        if atual == 4:  # 3 pastas criadas e a primeira movimentação
+            raise Interrompido
+
+    with Diario(caminho) as diario, pytest.raises(Interrompido):
+        mover_por_csv(arquivo, ao_progredir=interromper, diario=diario)
+    assert execucao_incompleta(ler_diario(caminho))
+
+    with Diario(caminho, retomar=True) as diario:
+        resumo = mover_por_csv(arquivo, diario=diario)
+    assert resumo.erros == 0
+    for id_, nome in (("1", "Ana"), ("2", "Bia"), ("3", "Caio")):
+        assert (tmp_path / nome / id_ / "dados.txt").read_text() == id_
+    assert not execucao_incompleta(ler_diario(caminho))
+
+
+def test_fpk_copy_folder_retoma_pasta_incompleta(tmp_path, monkeypatch):
+    pasta_face = tmp_path / "p1" / "grupo" / "A" / "1"
+    pasta_face.mkdir(parents=True)
+    (pasta_face / "face.fpk").write_bytes(b"xx" + f"{MARCADOR_FACE}Jogador 0/t".encode())
+    jogador = tmp_path / "p2" / "Jogador 0"
+    (jogador / "sub").mkdir(parents=True)
+    for i in range(4):
+        (jogador / f"f{i}").write_bytes(bytes([i]) * 1000)
+    (jogador / "sub" / "s").write_text("s")
+    destino = tmp_path / "p1" / "grupo" / "Jogador 0"
+    caminho = tmp_path / "diario.jsonl"
+
+    copiar_normal = copia._METODOS["copia"]
+    copiados = []
+
+    def falhar_no_terceiro(origem, temporario):
+        copiados.append(origem)
+        if len(copiados) == 3:
+            with open(temporario, "wb") as f:
+                f.write(b"pela metade")
+            raise OSError("disco cheio")
+        return copia.copiar_arquivo(origem, temporario)
+
+    monkeypatch.setitem(copia._METODOS, "copia", copia._via_temporario(falhar_no_terceiro))
+    with Diario(caminho) as diario:
+        resumo = copiar_pasta_completa_por_fpk(tmp_path / "p1", tmp_path / "p2", usar_indice=False,
+                                               trabalhadores_copia=1, modo="copia", diario=diario)
+    assert resumo.erros == 1
+    assert len([f for f in destino.rglob("*") if f.is_file()]) == 4  # sem temporário nem arquivo cortado
+
+    monkeypatch.setitem(copia._METODOS, "copia", copiar_normal)
+    with Diario(caminho, retomar=True) as diario:
+        resumo = copiar_pasta_completa_por_fpk(tmp_path / "p1", tmp_path / "p2", usar_indice=False,
+                                               trabalhadores_copia=1, modo="copia", diario=diario)
+    assert (resumo.erros, resumo.itens_ignorados, resumo.pastas_copiadas) == (0, 0, 1)
+    for arquivo in jogador.rglob("*"):
+        if arquivo.is_file():
+            assert (destino / arquivo.relative_to(jogador)).read_bytes() == arquivo.read_bytes()
+    assert not [f for f in destino.rglob(f"*{copia.SUFIXO_TEMPORARIO}")]
+
+    # Já completa: uma nova retomada não mexe mais na pasta
+    with Diario(caminho, retomar=True) as diario:
+        resumo = copiar_pasta_completa_por_fpk(tmp_path / "p1", tmp_path / "p2", usar_indice=False,
+                                               trabalhadores_copia=1, modo="copia", diario=diario)
+    assert (resumo.itens_ignorados, resumo.pastas_copiadas) == (1, 0)
@@ -0,0 +1,64 @@
+import os
+
+from gerenciador.renomeacao import SUFIXO_TEMPORARIO, executar_renomeacoes, planejar_renomeacoes
+
+
+def _arquivos(pasta, **conteudos):
+    for nome, conteudo in conteudos.items():
+        (pasta / nome).write_text(conteudo)
+
+
+def _conteudo(pasta):
+    return {nome: (pasta / nome).read_text() for nome in os.listdir(pasta)}
+
+
+def test_troca_e_ciclo_de_tres_passam_por_temporario(tmp_path):
+    _arquivos(tmp_path, **{"a.png": "A", "b.png": "B", "c.png": "C", "d.png": "D", "e.png": "E"})
+    p = tmp_path
+    feitas = []
+    resultados = executar_renomeacoes(
+        [(p / "a.png", p / "b.png"), (p / "b.png", p / "a.png"),
+         (p / "c.png", p / "d.png"), (p / "d.png", p / "e.png"), (p / "e.png", p / "c.png")],
+        ao_renomear=lambda origem, destino: feitas.append((origem.name, destino.name)))
+    assert all(erro is None for _, _, erro in resultados)
+    assert _conteudo(p) == {"b.png": "A", "a.png": "B", "d.png": "C", "e.png": "D", "c.png": "E"}
+    assert any(destino.endswith(SUFIXO_TEMPORARIO) for _, destino in feitas)
+
+
+def test_cadeia_sem_ciclo_em_ordem(tmp_path):
+    _arquivos(tmp_path, **{"1.png": "um", "2.png": "dois"})
+    p = tmp_path
+    resultados = executar_renomeacoes([(p / "1.png", p / "2.png"), (p / "2.png", p / "3.png")])
+    assert [erro for _, _, erro in resultados] == [None, None]
+    assert _conteudo(p) == {"2.png": "um", "3.png": "dois"}
+
+
+def test_nomes_que_so_diferem_em_maiusculas_nao_se_perdem(tmp_path):
+    _arquivos(tmp_path, **{"100.png": "minusculo", "x.png": "x"})
+    p = tmp_path
+    if os.path.exists(p / "100.PNG"):
+        return  # Sistema de arquivos sem diferença de maiúsculas: não dá para ter os dois nomes
+    (p / "100.PNG").write_text("maiusculo")
+    resultados = executar_renomeacoes([(p / "100.png", p / "300.png"), (p / "100.PNG", p / "400.png"),
+                                       (p / "x.png", p / "100.png")])
+    assert all(erro is None for _, _, erro in resultados)
+    assert _conteudo(p) == {"300.png": "minusculo", "400.png": "maiusculo", "100.png": "x"}
+
+
+def test_destino_existente_fora_do_lote_nao_e_sobrescrito(tmp_path):
+    _arquivos(tmp_path, **{"a.png": "A", "b.png": "B", "5.png": "externo"})
+    p = tmp_path
+    resultados = {origem.name: erro for origem, _, erro in
+                  executar_renomeacoes([(p / "a.png", p / "5.png"), (p / "b.png", p / "a.png")])}
+    assert "já existe" in resultados["a.png"]
+    assert "continua ocupado" in resultados["b.png"]
+    assert _conteudo(p) == {"a.png": "A", "b.png": "B", "5.png": "externo"}
+
+
+def test_planejar_mantem_nome_do_proprio_id_e_numera_os_demais(tmp_path):
+    _arquivos(tmp_path, **{"7.png": "", "x.png": "", "y.PNG": "", "8.png": ""})
+    p = tmp_path
+    plano = dict(planejar_renomeacoes(p, [(p / "7.png", "7"), (p / "x.png", "7"), (p / "y.PNG", "8")]))
+    assert plano[p / "7.png"] == p / "7.png"
+    assert plano[p / "x.png"] == p / "7_1.png"
+    assert plano[p / "y.PNG"] == p / "8_1.png"  # 8.png está ocupado por uma imagem fora do lote